@@ -1,48 +1,220 @@
 """
 Module for fetching data from Airtable.
 """
+import queue
+import threading
+from datetime import timezone
 from pyairtable import Api
-from config import AIRTABLE_API_KEY, AIRTABLE_BASE_ID, AIRTABLE_TABLE_NAME
+from config import (
+    AIRTABLE_API_KEY,
+    AIRTABLE_BASE_ID,
+    AIRTABLE_TABLE_NAME,
+    AIRTABLE_ENDPOINT_URL,
+    AIRTABLE_PREFETCH_PAGES,
+    COLUMNS
+)
+
+# Fields requested from Airtable; SpeakerFilter only reads the mapped columns
+PROJECTED_FIELDS = list(dict.fromkeys(COLUMNS.values()))
+
+# Tag statuses that make a record a candidate for an event
+CANDIDATE_STATUSES = ('Confirmed', 'Intended', 'Endorsed')
 
 
 class AirtableFetcher:
     """Handles fetching data from Airtable."""
     
-    def __init__(self):
-        """Initialize Airtable API connection."""
+    def __init__(self, table=None):
+        """
+        Initialize Airtable API connection.
+        
+        Args:
+            table: Optional table object to fetch from instead of the
+                configured base (e.g. a local stand-in for testing)
+        """
+        if table is not None:
+            self.api = None
+            self.table = table
+            return
+        
         if not AIRTABLE_API_KEY:
             raise ValueError("AIRTABLE_API_KEY not set in environment variables")
         if not AIRTABLE_BASE_ID:
             raise ValueError("AIRTABLE_BASE_ID not set in environment variables")
         if not AIRTABLE_TABLE_NAME:
             raise ValueError("AIRTABLE_TABLE_NAME not set in environment variables")
-            
-        self.api = Api(AIRTABLE_API_KEY)
+        
+        self.api = Api(AIRTABLE_API_KEY, endpoint_url=AIRTABLE_ENDPOINT_URL)
         self.table = self.api.table(AIRTABLE_BASE_ID, AIRTABLE_TABLE_NAME)
     
-    def fetch_all_records(self):
+    def fetch_all_records(self, formula=None, all_fields=False):
         """
         Fetch all records from the Airtable table.
         
+        Args:
+            formula: Optional filterByFormula expression evaluated by Airtable
+            all_fields: Request every field instead of only the mapped columns
+            
         Returns:
             list: List of all records with their fields
         """
         try:
-            records = self.table.all()
+            records = self.table.all(**self._list_options(formula, all_fields))
             return records
         except Exception as e:
             raise Exception(f"Error fetching records from Airtable: {str(e)}")
     
-    def get_records_dict(self):
+    def iter_record_pages(self, event_names=None, all_fields=False,
+                          prefetch=AIRTABLE_PREFETCH_PAGES):
+        """
+        Yield record fields page by page while later pages download.
+        
+        Pages are requested by a background thread up to prefetch pages
+        ahead, so the caller can filter one page while the next ones are
+        in flight.
+        
+        Args:
+            event_names: Optional event names; only records tagged for one
+                of them are downloaded (see event_formula)
+            all_fields: Request every field instead of only the mapped columns
+            prefetch: Maximum number of downloaded pages waiting to be consumed
+            
+        Yields:
+            list: Record fields of the next page
+        """
+        formula = self.event_formula(event_names) if event_names else None
+        options = self._list_options(formula, all_fields)
+        
+        pages = queue.Queue(maxsize=max(prefetch, 1))
+        stopped = threading.Event()
+        done = object()
+        
+        def put(item):
+            # Give up once the consumer has stopped reading
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def download():
+            try:
+                for page in self.table.iterate(**options):
+                    if not put([record['fields'] for record in page]):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
+        
+        thread = threading.Thread(target=download, name='airtable-pages', daemon=True)
+        thread.start()
+        
+        try:
+            while True:
+                item = pages.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise Exception(f"Error fetching records from Airtable: {str(item)}")
+                yield item
+        finally:
+            stopped.set()
+    
+    def fetch_modified_since(self, since):
+        """
+        Fetch records created or modified after a point in time.
+        
+        Args:
+            since: Timezone-aware datetime
+            
+        Returns:
+            list: Records with their IDs and fields
+        """
+        timestamp = since.astimezone(timezone.utc).isoformat(timespec='milliseconds')
+        timestamp = timestamp.replace('+00:00', 'Z')
+        formula = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{timestamp}'))"
+        
+        try:
+            return self.table.all(formula=formula, fields=PROJECTED_FIELDS)
+        except Exception as e:
+            raise Exception(f"Error fetching records from Airtable: {str(e)}")
+    
+    def fetch_record_ids(self):
+        """
+        Fetch the IDs of all records, without their content.
+        
+        Only the name field is requested, which keeps the listing small
+        enough to detect deleted records on every sync.
+        
+        Returns:
+            set: Record IDs
+        """
+        try:
+            records = self.table.all(fields=[COLUMNS['speaker_name']])
+            return {record['id'] for record in records}
+        except Exception as e:
+            raise Exception(f"Error fetching records from Airtable: {str(e)}")
+    
+    def get_records_dict(self, event_names=None, all_fields=False):
         """
         Get all records as a list of dictionaries with fields only.
         
+        Args:
+            event_names: Optional event names; only records tagged for one
+                of them are downloaded (see event_formula)
+            all_fields: Request every field instead of only the mapped columns
+            
         Returns:
             list: List of record fields
         """
-        records = self.fetch_all_records()
+        formula = self.event_formula(event_names) if event_names else None
+        records = self.fetch_all_records(formula=formula, all_fields=all_fields)
         return [record['fields'] for record in records]
-
-
-
-
+    
+    @staticmethod
+    def _list_options(formula, all_fields):
+        """
+        Build the options for listing records.
+        
+        Args:
+            formula: Optional filterByFormula expression
+            all_fields: Request every field instead of only the mapped columns
+            
+        Returns:
+            dict: Keyword arguments for Table.all/Table.iterate
+        """
+        options = {}
+        if not all_fields:
+            options['fields'] = PROJECTED_FIELDS
+        if formula:
+            options['formula'] = formula
+        return options
+    
+    @staticmethod
+    def event_formula(event_names):
+        """
+        Build a filterByFormula expression matching candidate records.
+        
+        The expression keeps records whose Workshops field contains a
+        Confirmed, Intended or Endorsed tag for any of the events. It only
+        narrows the download; SpeakerFilter still applies the full rules,
+        so results are unchanged.
+        
+        Args:
+            event_names: Event names (e.g., ["2511 Barclays"])
+            
+        Returns:
+            str: Airtable formula
+        """
+        workshops = f"LOWER({{{COLUMNS['workshops']}}})"
+        searches = []
+        
+        for event_name in event_names:
+            for status in CANDIDATE_STATUSES:
+                tag = f"{event_name} {status}".lower()
+                tag = tag.replace('\\', '\\\\').replace("'", "\\'")
+                searches.append(f"SEARCH('{tag}', {workshops})")
+        
+        return f"OR({', '.join(searches)})"
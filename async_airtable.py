@@ -0,0 +1,259 @@
+"""
+Asynchronous Airtable client for concurrent, rate-limited fetching.
+"""
+import asyncio
+import random
+import time
+from urllib.parse import quote
+import httpx
+from config import (
+    AIRTABLE_API_KEY,
+    AIRTABLE_BASE_ID,
+    AIRTABLE_ENDPOINT_URL,
+    AIRTABLE_RATE_LIMIT,
+    AIRTABLE_MAX_RETRIES,
+    AIRTABLE_BACKOFF_BASE,
+    AIRTABLE_BACKOFF_MAX
+)
+from airtable_fetcher import PROJECTED_FIELDS, AirtableFetcher
+
+# Status codes worth retrying: rate limited or temporarily unavailable
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Records per page, Airtable's maximum
+PAGE_SIZE = 100
+
+
+class TokenBucket:
+    """Spaces out requests to stay under a requests-per-second limit."""
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum burst size; defaults to 1, which spaces
+                requests evenly so no one-second window exceeds the rate
+        """
+        self.rate = rate
+        self.capacity = capacity or 1
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncAirtableFetcher:
+    """
+    Fetches records over one pooled HTTP session.
+
+    All requests share a token bucket tuned to Airtable's per-base rate
+    limit, rate-limited and transient errors are retried with jittered
+    exponential backoff, and several tables or views are fetched
+    concurrently. Use as an async context manager.
+    """
+
+    def __init__(self, api_key=AIRTABLE_API_KEY, base_id=AIRTABLE_BASE_ID,
+                 endpoint_url=AIRTABLE_ENDPOINT_URL, rate_limit=AIRTABLE_RATE_LIMIT,
+                 max_retries=AIRTABLE_MAX_RETRIES, transport=None):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: Airtable API key
+            base_id: Airtable base ID
+            endpoint_url: Airtable API endpoint, e.g. a local mock server
+            rate_limit: Requests per second for the base
+            max_retries: Retries per request on 429 and 5xx responses
+            transport: Optional httpx transport to send requests through,
+                e.g. httpx.MockTransport in tests
+        """
+        if not api_key:
+            raise ValueError("AIRTABLE_API_KEY not set in environment variables")
+        if not base_id:
+            raise ValueError("AIRTABLE_BASE_ID not set in environment variables")
+
+        self.api_key = api_key
+        self.base_id = base_id
+        self.endpoint_url = endpoint_url.rstrip('/')
+        self.max_retries = max_retries
+        self.limiter = TokenBucket(rate_limit)
+        self.request_count = 0
+        self.retry_count = 0
+        self._transport = transport
+        self._client = None
+
+    async def __aenter__(self):
+        """Open the pooled HTTP session."""
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.endpoint_url}/v0/{self.base_id}",
+            headers={'Authorization': f"Bearer {self.api_key}"},
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            timeout=httpx.Timeout(30.0),
+            transport=self._transport
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the HTTP session."""
+        await self._client.aclose()
+        self._client = None
+
+    async def fetch_records(self, table_name, view=None, formula=None, all_fields=False):
+        """
+        Fetch all records of one table or view, page by page.
+
+        Args:
+            table_name: Table name or ID
+            view: Optional view name or ID
+            formula: Optional filterByFormula expression
+            all_fields: Request every field instead of only the mapped columns
+
+        Returns:
+            list: Records with their IDs and fields
+        """
+        params = {'pageSize': PAGE_SIZE}
+        if view:
+            params['view'] = view
+        if formula:
+            params['filterByFormula'] = formula
+        if not all_fields:
+            params['fields[]'] = PROJECTED_FIELDS
+
+        records = []
+        while True:
+            page = await self._get(table_name, params)
+            records.extend(page.get('records', []))
+
+            offset = page.get('offset')
+            if not offset:
+                return records
+            params['offset'] = offset
+
+    async def fetch_many(self, sources, formula=None, all_fields=False):
+        """
+        Fetch several tables or views concurrently.
+
+        Args:
+            sources: List of (table_name, view) pairs; view may be None
+            formula: Optional filterByFormula expression for every source
+            all_fields: Request every field instead of only the mapped columns
+
+        Returns:
+            list: Record lists, one per source, in the same order
+        """
+        return await asyncio.gather(*(
+            self.fetch_records(table_name, view, formula, all_fields)
+            for table_name, view in sources
+        ))
+
+    async def get_records_dict(self, sources, event_names=None, all_fields=False):
+        """
+        Get the records of several tables or views as field dictionaries.
+
+        Records returned by several views of the same table are kept once.
+
+        Args:
+            sources: List of (table_name, view) pairs; view may be None
+            event_names: Optional event names; only records tagged for one
+                of them are downloaded
+            all_fields: Request every field instead of only the mapped columns
+
+        Returns:
+            list: List of record fields
+        """
+        formula = AirtableFetcher.event_formula(event_names) if event_names else None
+        results = await self.fetch_many(sources, formula, all_fields)
+
+        seen = set()
+        records = []
+        for (table_name, _), source_records in zip(sources, results):
+            for record in source_records:
+                key = (table_name, record['id'])
+                if key not in seen:
+                    seen.add(key)
+                    records.append(record['fields'])
+
+        return records
+
+    async def _get(self, table_name, params):
+        """
+        Send one rate-limited list request, retrying with backoff.
+
+        Args:
+            table_name: Table name or ID
+            params: Query parameters
+
+        Returns:
+            dict: Decoded response body
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire()
+            self.request_count += 1
+
+            try:
+                response = await self._client.get(f"/{quote(table_name, safe='')}", params=params)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise Exception(f"Error fetching records from Airtable: {str(e)}")
+                response = None
+
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                if response.is_error:
+                    raise Exception(
+                        f"Error fetching records from Airtable: "
+                        f"{response.status_code} {response.text}"
+                    )
+                return response.json()
+
+            if attempt == self.max_retries:
+                break
+
+            self.retry_count += 1
+            await asyncio.sleep(self._backoff_delay(attempt, response))
+
+        raise Exception(
+            f"Error fetching records from Airtable: {response.status_code} "
+            f"after {self.max_retries} retries"
+        )
+
+    @staticmethod
+    def _backoff_delay(attempt, response=None):
+        """
+        Get the wait before retrying a request.
+
+        A Retry-After header is honoured; otherwise the delay doubles with
+        each attempt, capped at AIRTABLE_BACKOFF_MAX, with random jitter so
+        concurrent requests do not retry in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number that failed
+            response: Failed response, if any
+
+        Returns:
+            float: Seconds to wait
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+
+        delay = min(AIRTABLE_BACKOFF_MAX, AIRTABLE_BACKOFF_BASE * 2 ** attempt)
+        return random.uniform(delay / 2, delay)
@@ -2,22 +2,48 @@
 FastAPI backend for Speaker Prospect Filtering Tool.
 Handles CSV upload and speaker filtering with NaN-safe processing.
 """
-from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+import asyncio
+import json
 import sys
 import os
+import time
 from datetime import datetime
-import json
 import pandas as pd
-import io
 
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from filters import SpeakerFilter
-from output_generator import OutputGenerator
+from config import (
+    DATASET_CACHE_MAX_BYTES,
+    FILTER_EXECUTOR,
+    FILTER_WORKERS,
+    JOB_WORKERS,
+    JOB_QUEUE_SIZE,
+    JOB_RESULT_TTL_SECONDS,
+    PROGRESS_TTL_SECONDS,
+    PROGRESS_INTERVAL_SECONDS,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_TTL_SECONDS,
+    PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAX,
+    RESULT_SET_MAX_BYTES,
+    RESULT_SET_TTL_SECONDS
+)
+from dataset_registry import DatasetRegistry
+from executor import FilterExecutor
+from ingest import upload_compression, upload_format
+from jobs import JobManager, JobQueueFullError
+from pagination import CATEGORIES, first_pages, paginate, result_set_id, speaker_detail
+import pipeline
+from pipeline import EXPORT_MEDIA_TYPES, STREAMED_FORMATS, NoRecordsError
+from progress import ProgressRegistry, UploadProgressMiddleware
+from request_encoding import GzipRequestMiddleware, RequestTooLargeError
+from result_cache import ResultCache, content_hash, result_key
 
 app = FastAPI(
     title="Speaker Prospect Filtering API",
@@ -34,9 +60,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Idle seconds between keep-alive comments on progress streams
+PROGRESS_KEEPALIVE_SECONDS = 15
+
 # Increase max request size to 1GB
 app.max_request_size = 1024 * 1024 * 1024  # 1GB
 
+# Inflate uploads sent with Content-Encoding: gzip as they arrive
+app.add_middleware(GzipRequestMiddleware, max_size=app.max_request_size)
+
+# Progress of runs started with ?progress_id=..., streamed by /api/progress
+progress_registry = ProgressRegistry(PROGRESS_TTL_SECONDS)
+
+# Outermost, so uploads are counted in bytes on the wire
+app.add_middleware(UploadProgressMiddleware, registry=progress_registry)
+
+# Parsed uploads, reused by the /api/datasets endpoints
+datasets = DatasetRegistry(DATASET_CACHE_MAX_BYTES)
+
+# Parse/filter/enrich work runs here, off the event loop
+executor = FilterExecutor(FILTER_EXECUTOR, FILTER_WORKERS)
+
+# Long-running filter/export runs submitted through /api/jobs
+jobs = JobManager(JOB_WORKERS, JOB_QUEUE_SIZE, JOB_RESULT_TTL_SECONDS)
+
+# Rendered filter responses and export reports, by content hash and event
+results = ResultCache(RESULT_CACHE_MAX_BYTES, RESULT_CACHE_TTL_SECONDS)
+
+# Filter responses read page by page through /api/result-sets
+result_sets = ResultCache(RESULT_SET_MAX_BYTES, RESULT_SET_TTL_SECONDS)
+
 
 class FilterRequest(BaseModel):
     """Request model for filtering speakers (legacy - use file upload instead)."""
@@ -56,6 +109,26 @@ class FilterResponse(BaseModel):
     endorsed_speakers: List[dict]
 
 
+class EventQuery(BaseModel):
+    """One event of a multi-event filter request."""
+    event_name: str
+    event_title: Optional[str] = ""
+
+
+class MultiEventFilterRequest(BaseModel):
+    """Request model for filtering several events in one call."""
+    events: List[EventQuery]
+
+
+class JobRequest(BaseModel):
+    """Request model for submitting a background filter or export job."""
+    dataset_id: str
+    event_name: str
+    event_title: Optional[str] = ""
+    format: Optional[str] = None  # Export format; None for a filter response
+    compact: Optional[bool] = False  # Unindented JSON export
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
@@ -64,9 +137,13 @@ class HealthResponse(BaseModel):
 
 class CSVInfoResponse(BaseModel):
     """CSV file information response."""
+    dataset_id: str
     row_count: int
     column_count: int
     columns: List[str]
+    loaded_columns: List[str]
+    memory_bytes: int
+    memory_saved_bytes: int
     sample_data: List[dict]
     message: str
 
@@ -87,6 +164,13 @@ async def root():
     }
 
 
+@app.on_event("shutdown")
+async def shutdown_executor():
+    """Stop the worker pools when the server shuts down."""
+    executor.shutdown()
+    jobs.shutdown()
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
@@ -96,240 +180,1306 @@ async def health_check():
     }
 
 
-@app.post("/api/upload-csv", response_model=CSVInfoResponse)
-async def upload_csv(file: UploadFile = File(...)):
+@app.get("/api/stats")
+async def get_stats():
+    """Worker pool load, dataset registry, job and result cache usage."""
+    return {
+        "executor": executor.stats(),
+        "datasets": datasets.stats(),
+        "jobs": jobs.stats(),
+        "result_cache": results.stats(),
+        "result_sets": result_sets.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _get_dataset(dataset_id):
     """
-    Upload CSV file and return basic information about it.
-    Max file size: 1GB
+    Look up a stored dataset.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        
+    Returns:
+        DataFrame: Stored dataset
     """
-    try:
-        # Check file type
-        if not file.filename.endswith('.csv'):
-            raise HTTPException(
-                status_code=400,
-                detail="File must be a CSV file"
-            )
+    df = datasets.get(dataset_id)
+    if df is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Dataset not found or expired. Please upload the CSV file again."
+        )
+    return df
+
+
+async def _get_tag_index(dataset_id, df):
+    """
+    Get the tag index of a stored dataset, building it on first use.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        df: Stored dataset
         
-        # Read CSV file
-        contents = await file.read()
+    Returns:
+        TagIndex: Event/status tag index for the dataset
+    """
+    tag_index = datasets.get_tag_index(dataset_id)
+    if tag_index is None:
+        tag_index = await executor.run(pipeline.build_tag_index, df)
+        datasets.set_tag_index(dataset_id, tag_index)
+    return tag_index
+
+
+def _dataset_cache_key(dataset_id, kind, *parts):
+    """
+    Build the result cache key of a request on a stored dataset.
+    
+    Datasets share cache entries with direct uploads of the same file.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        kind: 'filter' or 'export'
+        *parts: Request parameters the result depends on
         
-        # Check file size (1GB limit)
-        if len(contents) > 1024 * 1024 * 1024:
-            raise HTTPException(
-                status_code=413,
-                detail="File size exceeds 1GB limit"
-            )
+    Returns:
+        tuple: Cache key, or None if the dataset's upload was not hashed
+    """
+    digest = datasets.get_content_hash(dataset_id)
+    if digest is None:
+        return None
+    return result_key(kind, digest, 'frame', *parts)
+
+
+def _select_fields(view, fields):
+    """
+    Resolve the speaker fields requested with view= and fields=.
+    
+    Args:
+        view: 'summary' or 'full'
+        fields: Optional comma-separated field names; overrides view
         
-        # Parse CSV
-        df = pd.read_csv(io.BytesIO(contents))
+    Returns:
+        frozenset: Fields to keep, or None to keep all
+    """
+    try:
+        return pipeline.select_fields(view, fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+
+
+def _selection_key(selection):
+    """
+    Get the result cache key part of a field selection.
+    
+    Args:
+        selection: Fields from _select_fields(), or None for all
         
-        # Get sample data (first 3 rows)
-        sample_data = df.head(3).to_dict('records')
+    Returns:
+        tuple: Sorted field names, or None for all
+    """
+    return tuple(sorted(selection)) if selection is not None else None
+
+
+def _check_page_size(limit):
+    """
+    Validate the requested page size.
+    
+    Args:
+        limit: Speakers per page from the request
+    """
+    if limit < 1 or limit > PAGE_SIZE_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Page size must be between 1 and {PAGE_SIZE_MAX}"
+        )
+
+
+def _get_result_set(result_set_id, category):
+    """
+    Look up a stored result set for reading one category.
+    
+    Args:
+        result_set_id: Result set ID returned by
+            /api/datasets/{dataset_id}/result-sets
+        category: Requested speaker category
         
-        return {
-            "row_count": len(df),
-            "column_count": len(df.columns),
-            "columns": df.columns.tolist(),
-            "sample_data": sample_data,
-            "message": f"Successfully uploaded. Found {len(df)} rows and {len(df.columns)} columns."
-        }
-    except pd.errors.EmptyDataError:
+    Returns:
+        dict: Stored filter response
+    """
+    if category not in CATEGORIES:
         raise HTTPException(
             status_code=400,
-            detail="CSV file is empty"
+            detail="Invalid category. Must be confirmed, intended, or endorsed"
         )
-    except Exception as e:
+    
+    result = result_sets.get(result_set_id)
+    if result is None:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error processing CSV: {str(e)}"
+            status_code=404,
+            detail="Result set not found or expired. Create it again; cursors stay valid."
         )
+    return result
 
 
-@app.post("/api/filter-speakers-csv")
-async def filter_speakers_from_csv(
-    event_name: str,
-    event_title: str = "",
-    file: UploadFile = File(...)
-):
+def _check_upload_format(filename):
     """
-    Filter speakers from uploaded CSV file based on event name.
+    Get the format of an uploaded file from its name.
     
     Args:
-        event_name: Name of the event (e.g., "2511 Barclays")
-        event_title: Optional event title for content analysis
-        file: CSV file with speaker data
+        filename: Uploaded file name
         
     Returns:
-        FilterResponse with categorized speakers
+        str: 'csv', 'parquet' or 'arrow'
+    """
+    fmt = upload_format(filename)
+    if fmt is None:
+        raise HTTPException(
+            status_code=400,
+            detail="File must be a CSV, Parquet or Arrow IPC file"
+        )
+    return fmt
+
+
+def _check_upload_compression(filename, fmt):
+    """
+    Get the compression of an uploaded file from its name.
+    
+    Args:
+        filename: Uploaded file name
+        fmt: Upload format from the same name
+        
+    Returns:
+        str: 'gzip', 'zstd' or None
+    """
+    compression = upload_compression(filename)
+    if compression is not None and fmt != 'csv':
+        raise HTTPException(
+            status_code=400,
+            detail="Only CSV files can be uploaded compressed (.csv.gz, .csv.zst)"
+        )
+    return compression
+
+
+def _check_export_format(format):
+    """
+    Validate the requested export format.
+    
+    Args:
+        format: Export format from the request path
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid format. Must be csv, json, text, parquet or arrow"
+        )
+
+
+def _get_progress(progress_id):
+    """
+    Get the Progress a request reports to.
+    
+    Args:
+        progress_id: Client-chosen progress ID, or None
+        
+    Returns:
+        Progress: Progress for the ID, or None if not tracked
+    """
+    if not progress_id:
+        return None
+    return progress_registry.get_or_create(progress_id)
+
+
+def _finish_progress(progress, error=None):
+    """
+    Mark a tracked run as finished.
+    
+    Args:
+        progress: Progress of the run, or None if not tracked
+        error: Error message if the run failed
+    """
+    if progress is not None:
+        progress.finish(error)
+
+
+def _finish_after(chunks, progress):
+    """
+    Pass a streamed response through and finish its progress at the end.
+    
+    Args:
+        chunks: Response body chunks
+        progress: Progress of the run, or None if not tracked
+        
+    Yields:
+        bytes: Response body chunks
     """
     try:
-        # Read and parse CSV
-        contents = await file.read()
-        
-        # Check file size
-        if len(contents) > 1024 * 1024 * 1024:
-            raise HTTPException(
-                status_code=413,
-                detail="File size exceeds 1GB limit"
-            )
+        yield from chunks
+    except Exception as e:
+        _finish_progress(progress, str(e))
+        raise
+    finally:
+        _finish_progress(progress)
+
+
+async def _upload_hash(data):
+    """
+    Hash an upload for the result cache.
+    
+    Args:
+        data: Upload bytes or the spooled upload file
         
-        df = pd.read_csv(io.BytesIO(contents))
-        records = df.to_dict('records')
+    Returns:
+        str: Content hash
+    """
+    return await executor.run(content_hash, data, in_thread=True)
+
+
+def _cache_after(chunks, cache_key):
+    """
+    Pass a streamed response through and cache it once fully sent.
+    
+    Args:
+        chunks: Response body chunks
+        cache_key: Result cache key for the complete body
         
-        if not records:
-            raise HTTPException(
-                status_code=404,
-                detail="No records found in CSV file"
-            )
+    Yields:
+        bytes: Response body chunks
+    """
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    results.put(cache_key, b"".join(parts))
+
+
+async def _json_response(content, progress=None, cache_key=None):
+    """
+    Serialize a JSON response body in the worker pool.
+    
+    Args:
+        content: JSON-compatible response data
+        progress: Optional Progress to report serialized bytes to
+        cache_key: Optional result cache key to store the body under
         
-        # Filter speakers into categories
-        speaker_filter = SpeakerFilter(event_name)
+    Returns:
+        Response: JSON response
+    """
+    body = await executor.run(
+        pipeline.render_json_response, content, progress, in_thread=True
+    )
+    if cache_key is not None:
+        results.put(cache_key, body)
+    return Response(content=body, media_type="application/json")
+
+
+def _export_headers(format):
+    """
+    Build the download headers of an export.
+    
+    Args:
+        format: Export format (csv, json, text, parquet, arrow)
+        
+    Returns:
+        tuple: (media type, headers)
+    """
+    media_type, extension = EXPORT_MEDIA_TYPES[format]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"speaker_report_{timestamp}"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}.{extension}"
+    }
+    return media_type, headers
+
+
+def _cached_response(cache_key, format=None):
+    """
+    Build a response from the result cache.
+    
+    Args:
+        cache_key: Result cache key
+        format: Export format, or None for a JSON filter response
         
-        confirmed = speaker_filter.filter_confirmed(records)
-        intended = speaker_filter.filter_intended(records)
-        endorsed = speaker_filter.filter_endorsed(records)
+    Returns:
+        Response: Cached response, or None on a cache miss
+    """
+    body = results.get(cache_key)
+    if body is None:
+        return None
+    if format is None:
+        return Response(content=body, media_type="application/json")
+    media_type, headers = _export_headers(format)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+async def _progress_events(progress):
+    """
+    Stream a run's progress as Server-Sent Events.
+    
+    A 'progress' event is sent whenever the counters change, checked every
+    PROGRESS_INTERVAL_SECONDS, and a final 'done' event once the run has
+    finished. The stream also ends if the run stops updating for
+    PROGRESS_TTL_SECONDS.
+    
+    Args:
+        progress: Progress to stream
         
-        # Generate enhanced data with analysis
-        generator = OutputGenerator(event_name, event_title)
+    Yields:
+        str: Server-Sent Events
+    """
+    version = None
+    last_sent = time.monotonic()
+    
+    while True:
+        now = time.monotonic()
         
-        # Enhance intended and endorsed speakers with analysis
-        enhanced_intended = [generator._enhance_speaker_data(s) for s in intended]
-        enhanced_endorsed = [generator._enhance_speaker_data(s) for s in endorsed]
+        if progress.version != version:
+            version = progress.version
+            snapshot = progress.snapshot()
+            event = "done" if snapshot['finished'] else "progress"
+            yield f"event: {event}\ndata: {json.dumps(snapshot)}\n\n"
+            if snapshot['finished']:
+                return
+            last_sent = now
+        elif now - progress.updated > PROGRESS_TTL_SECONDS:
+            yield "event: expired\ndata: {}\n\n"
+            return
+        elif now - last_sent >= PROGRESS_KEEPALIVE_SECONDS:
+            # Comment line; keeps proxies from closing an idle stream
+            yield ": keep-alive\n\n"
+            last_sent = now
         
-        return {
-            "event_name": event_name,
-            "event_title": event_title,
-            "generated_at": datetime.now().isoformat(),
-            "summary": {
-                "confirmed_count": len(confirmed),
-                "intended_count": len(intended),
-                "endorsed_count": len(endorsed),
-                "total_count": len(confirmed) + len(intended) + len(endorsed)
-            },
-            "confirmed_speakers": confirmed,
-            "intended_speakers": enhanced_intended,
-            "endorsed_speakers": enhanced_endorsed
-        }
+        await asyncio.sleep(PROGRESS_INTERVAL_SECONDS)
+
+
+def _progress_stream_response(progress):
+    """
+    Build the Server-Sent Events response for a run's progress.
+    
+    Args:
+        progress: Progress to stream
         
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error filtering speakers: {str(e)}"
-        )
+    Returns:
+        StreamingResponse: text/event-stream response
+    """
+    return StreamingResponse(
+        _progress_events(progress),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
-@app.post("/api/export-csv/{format}")
-async def export_speakers_from_csv(
-    format: str,
-    event_name: str,
-    event_title: str = "",
-    file: UploadFile = File(...)
+async def _export_response(
+    format, event_name, event_title, categorized, progress=None, cache_key=None,
+    compact=False, selection=None
 ):
     """
-    Export filtered speakers from CSV in specified format (csv, json, text).
+    Render categorized speakers as a file download response.
+    
+    CSV, text, Parquet and Arrow reports are streamed as they are
+    rendered; JSON is rendered in the worker pool and sent in one piece.
+    A tracked run's progress is finished once the report has been
+    rendered.
     
     Args:
-        format: Export format (csv, json, text)
+        format: Export format (csv, json, text, parquet, arrow)
         event_name: Name of the event
         event_title: Optional event title
-        file: CSV file with speaker data
+        categorized: (confirmed, intended, endorsed) lists of speakers
+        progress: Optional Progress to report stage counts to
+        cache_key: Optional result cache key to store the report under
+        compact: Omit whitespace from a JSON report
+        selection: Speaker fields of a JSON report, or None for all
         
     Returns:
-        File download response
+        Response: File download response
     """
-    from fastapi.responses import Response
+    media_type, headers = _export_headers(format)
     
-    if format not in ['csv', 'json', 'text']:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid format. Must be csv, json, or text"
+    if format in STREAMED_FORMATS:
+        # Starlette iterates sync generators in its threadpool, off the loop
+        chunks = pipeline.iter_export(
+            format, event_name, event_title, *categorized, progress=progress
         )
+        if cache_key is not None:
+            chunks = _cache_after(chunks, cache_key)
+        return StreamingResponse(
+            _finish_after(chunks, progress),
+            media_type=media_type,
+            headers=headers
+        )
+    
+    content = await executor.run(
+        pipeline.render_json_export, event_name, event_title, *categorized, progress,
+        compact, selection, in_thread=progress is not None
+    )
+    if cache_key is not None:
+        results.put(cache_key, content)
+    _finish_progress(progress)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+@app.post("/api/upload-csv", response_model=CSVInfoResponse)
+async def upload_csv(file: UploadFile = File(...), progress_id: Optional[str] = None):
+    """
+    Upload CSV file and return basic information about it.
+    Max file size: 1GB
+    
+    Parquet (.parquet) and Arrow IPC (.arrow, .feather, .ipc) files are
+    also accepted and read with column projection, memory-mapped when the
+    upload has been spilled to disk. CSV files may be compressed (.csv.gz,
+    .csv.zst) and are decompressed while they are parsed.
+    
+    The parsed file is kept server-side; use the returned dataset_id with
+    the /api/datasets endpoints instead of uploading the file again.
+    
+    Pass a new client-chosen progress_id to follow the upload and parsing
+    on /api/progress/{progress_id}.
+    """
+    fmt = _check_upload_format(file.filename)
+    compression = _check_upload_compression(file.filename, fmt)
+    progress = _get_progress(progress_id)
     
     try:
-        # Read and parse CSV
-        contents = await file.read()
-        df = pd.read_csv(io.BytesIO(contents))
-        records = df.to_dict('records')
-        
-        # Filter speakers
-        speaker_filter = SpeakerFilter(event_name)
-        confirmed = speaker_filter.filter_confirmed(records)
-        intended = speaker_filter.filter_intended(records)
-        endorsed = speaker_filter.filter_endorsed(records)
-        
-        generator = OutputGenerator(event_name, event_title)
-        
-        # Generate appropriate format
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"speaker_report_{timestamp}"
-        
-        if format == 'csv':
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-                generator.generate_csv(confirmed, intended, endorsed, f.name)
-                with open(f.name, 'r', encoding='utf-8') as csv_file:
-                    content = csv_file.read()
-                os.unlink(f.name)
-            
-            return Response(
-                content=content,
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}.csv"
-                }
-            )
+        if fmt == 'csv' and compression is None:
+            # Read CSV file
+            contents = await file.read()
             
-        elif format == 'json':
-            data = {
-                'event_name': event_name,
-                'event_title': event_title,
-                'generated_at': datetime.now().isoformat(),
-                'summary': {
-                    'confirmed_count': len(confirmed),
-                    'intended_count': len(intended),
-                    'endorsed_count': len(endorsed)
-                },
-                'confirmed_speakers': confirmed,
-                'intended_speakers': [generator._enhance_speaker_data(s) for s in intended],
-                'endorsed_speakers': [generator._enhance_speaker_data(s) for s in endorsed]
-            }
+            # Check file size (1GB limit)
+            if len(contents) > 1024 * 1024 * 1024:
+                raise HTTPException(
+                    status_code=413,
+                    detail="File size exceeds 1GB limit"
+                )
             
-            return Response(
-                content=json.dumps(data, indent=2, ensure_ascii=False),
-                media_type="application/json",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}.json"
-                }
+            # Parse CSV
+            digest = await _upload_hash(contents)
+            df, stats = await executor.run(
+                pipeline.parse_csv_bytes, contents, progress,
+                in_thread=progress is not None
             )
+        else:
+            # Check file size (1GB limit)
+            if file.size is not None and file.size > 1024 * 1024 * 1024:
+                raise HTTPException(
+                    status_code=413,
+                    detail="File size exceeds 1GB limit"
+                )
             
-        else:  # text
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-                generator.generate_text(confirmed, intended, endorsed, f.name)
-                with open(f.name, 'r', encoding='utf-8') as text_file:
-                    content = text_file.read()
-                os.unlink(f.name)
-            
-            return Response(
-                content=content,
-                media_type="text/plain",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}.txt"
-                }
+            # Reads (and may memory-map) the spooled upload, so stays in-process
+            digest = await _upload_hash(file.file)
+            df, stats = await executor.run(
+                pipeline.parse_upload_file, file.file, fmt, compression, progress,
+                app.max_request_size, in_thread=True
             )
-            
-    except Exception as e:
+        
+        dataset_id = datasets.add(df, file.filename, digest)
+        
+        # Get sample data (first 3 rows), with missing values as null
+        sample = df.head(3).astype(object)
+        sample_data = sample.where(sample.notna(), None).to_dict('records')
+        
+        column_count = len(stats['columns'])
+        
+        return {
+            "dataset_id": dataset_id,
+            "row_count": len(df),
+            "column_count": column_count,
+            "columns": stats['columns'],
+            "loaded_columns": stats['loaded_columns'],
+            "memory_bytes": stats['memory_bytes'],
+            "memory_saved_bytes": stats['memory_saved_bytes'],
+            "sample_data": sample_data,
+            "message": f"Successfully uploaded. Found {len(df)} rows and {column_count} columns."
+        }
+    except pd.errors.EmptyDataError:
+        raise HTTPException(
+            status_code=400,
+            detail="CSV file is empty"
+        )
+    except RequestTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing CSV: {str(e)}"
+        )
+    finally:
+        _finish_progress(progress)
+
+
+@app.post("/api/filter-speakers-csv")
+async def filter_speakers_from_csv(
+    event_name: str,
+    event_title: str = "",
+    stream: bool = False,
+    view: str = "full",
+    fields: Optional[str] = None,
+    file: UploadFile = File(...),
+    progress_id: Optional[str] = None
+):
+    """
+    Filter speakers from uploaded CSV file based on event name.
+    
+    Args:
+        event_name: Name of the event (e.g., "2511 Barclays")
+        event_title: Optional event title for content analysis
+        stream: Parse the file in chunks, so parsing and filtering
+            memory stays bounded; values are kept as written in the file
+            instead of being type-inferred. The upload itself is still
+            received in full first: Starlette spools it (to disk above
+            1MB) before the endpoint runs, and the result cache hashes it
+            before parsing, so this does not lower the upload's own disk
+            or memory use
+        view: 'full' for every speaker field, 'summary' to leave out the
+            full_notes and full_abstract texts
+        fields: Optional comma-separated speaker fields to return instead
+            of a view; content_fit_analysis is only computed if listed
+        file: CSV, Parquet or Arrow IPC file with speaker data; CSV files
+            may be compressed (.csv.gz, .csv.zst)
+        progress_id: Optional new client-chosen ID to follow the run on
+            /api/progress/{progress_id}
+            
+    Returns:
+        FilterResponse with categorized speakers
+    """
+    fmt = upload_format(file.filename) or 'csv'
+    compression = _check_upload_compression(file.filename, fmt)
+    selection = _select_fields(view, fields)
+    progress = _get_progress(progress_id)
+    
+    try:
+        if stream or fmt != 'csv' or compression is not None:
+            # Check file size
+            if file.size is not None and file.size > 1024 * 1024 * 1024:
+                raise HTTPException(
+                    status_code=413,
+                    detail="File size exceeds 1GB limit"
+                )
+            
+            cache_key = result_key(
+                'filter', await _upload_hash(file.file),
+                'stream' if stream else 'frame', event_name, event_title,
+                _selection_key(selection)
+            )
+            cached = _cached_response(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Reads the spooled upload directly, so it must stay in-process
+            if stream:
+                result = await executor.run(
+                    pipeline.filter_csv_stream, file.file, event_name, event_title, fmt,
+                    compression, progress, selection, app.max_request_size, in_thread=True
+                )
+            else:
+                result = await executor.run(
+                    pipeline.filter_upload_file, file.file, fmt, event_name, event_title,
+                    compression, progress, selection, app.max_request_size, in_thread=True
+                )
+        else:
+            # Read and parse CSV
+            contents = await file.read()
+            
+            # Check file size
+            if len(contents) > 1024 * 1024 * 1024:
+                raise HTTPException(
+                    status_code=413,
+                    detail="File size exceeds 1GB limit"
+                )
+            
+            cache_key = result_key(
+                'filter', await _upload_hash(contents), 'frame', event_name, event_title,
+                _selection_key(selection)
+            )
+            cached = _cached_response(cache_key)
+            if cached is not None:
+                return cached
+            
+            result = await executor.run(
+                pipeline.filter_csv_bytes, contents, event_name, event_title, progress,
+                selection, in_thread=progress is not None
+            )
+        
+        return await _json_response(result, progress, cache_key)
+        
+    except NoRecordsError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
+    except RequestTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error filtering speakers: {str(e)}"
+        )
+    finally:
+        _finish_progress(progress)
+
+
+@app.post("/api/export-csv/{format}")
+async def export_speakers_from_csv(
+    format: str,
+    event_name: str,
+    event_title: str = "",
+    compact: bool = False,
+    view: str = "full",
+    fields: Optional[str] = None,
+    file: UploadFile = File(...),
+    progress_id: Optional[str] = None
+):
+    """
+    Export filtered speakers from CSV in specified format (csv, json, text,
+    parquet, arrow).
+    
+    Parquet and Arrow IPC files have a fixed schema with one row per
+    speaker (see columnar_export.SPEAKER_SCHEMA) and load directly into
+    pandas, notebooks or a warehouse.
+    
+    Args:
+        format: Export format (csv, json, text, parquet, arrow)
+        event_name: Name of the event
+        event_title: Optional event title
+        compact: Omit whitespace from a JSON report (smaller and faster)
+        view: Speaker fields of a JSON report: 'full', or 'summary' to
+            leave out the full_notes and full_abstract texts
+        fields: Optional comma-separated speaker fields of a JSON report
+            instead of a view. The other formats have a fixed layout.
+        file: CSV, Parquet or Arrow IPC file with speaker data; CSV files
+            may be compressed (.csv.gz, .csv.zst)
+        progress_id: Optional new client-chosen ID to follow the run on
+            /api/progress/{progress_id}
+            
+    Returns:
+        File download response
+    """
+    _check_export_format(format)
+    compact = compact and format == 'json'
+    selection = _select_fields(view, fields) if format == 'json' else None
+    fmt = upload_format(file.filename) or 'csv'
+    compression = _check_upload_compression(file.filename, fmt)
+    progress = _get_progress(progress_id)
+    
+    try:
+        if fmt == 'csv' and compression is None:
+            # Read and parse CSV
+            contents = await file.read()
+            cache_key = result_key(
+                'export', await _upload_hash(contents), 'frame', format,
+                event_name, event_title, compact, _selection_key(selection)
+            )
+            cached = _cached_response(cache_key, format)
+            if cached is not None:
+                _finish_progress(progress)
+                return cached
+            
+            categorized = await executor.run(
+                pipeline.categorize_csv_bytes, contents, event_name, progress,
+                in_thread=progress is not None
+            )
+        else:
+            cache_key = result_key(
+                'export', await _upload_hash(file.file), 'frame', format,
+                event_name, event_title, compact, _selection_key(selection)
+            )
+            cached = _cached_response(cache_key, format)
+            if cached is not None:
+                _finish_progress(progress)
+                return cached
+            
+            categorized = await executor.run(
+                pipeline.categorize_upload_file, file.file, fmt, event_name, compression,
+                progress, app.max_request_size, in_thread=True
+            )
+        
+        return await _export_response(
+            format, event_name, event_title, categorized, progress, cache_key, compact,
+            selection
+        )
+        
+    except RequestTooLargeError as e:
+        _finish_progress(progress, str(e))
+        raise HTTPException(
+            status_code=413,
+            detail=str(e)
+        )
+    except Exception as e:
+        _finish_progress(progress, str(e))
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error exporting data: {str(e)}"
+        )
+
+
+@app.post("/api/datasets/{dataset_id}/filter")
+async def filter_speakers_from_dataset(
+    dataset_id: str,
+    event_name: str,
+    event_title: str = "",
+    view: str = "full",
+    fields: Optional[str] = None,
+    progress_id: Optional[str] = None
+):
+    """
+    Filter speakers from a previously uploaded dataset.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        event_name: Name of the event (e.g., "2511 Barclays")
+        event_title: Optional event title for content analysis
+        view: 'full' for every speaker field, 'summary' to leave out the
+            full_notes and full_abstract texts
+        fields: Optional comma-separated speaker fields to return instead
+            of a view; content_fit_analysis is only computed if listed
+        progress_id: Optional new client-chosen ID to follow the run on
+            /api/progress/{progress_id}
+            
+    Returns:
+        FilterResponse with categorized speakers
+    """
+    selection = _select_fields(view, fields)
+    df = _get_dataset(dataset_id)
+    progress = _get_progress(progress_id)
+    
+    try:
+        cache_key = _dataset_cache_key(
+            dataset_id, 'filter', event_name, event_title, _selection_key(selection)
+        )
+        cached = _cached_response(cache_key) if cache_key is not None else None
+        if cached is not None:
+            return cached
+        
+        tag_index = await _get_tag_index(dataset_id, df)
+        result = await executor.run(
+            pipeline.filter_frame, df, event_name, event_title, tag_index, progress,
+            selection, in_thread=progress is not None
+        )
+        return await _json_response(result, progress, cache_key)
+        
+    except NoRecordsError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error filtering speakers: {str(e)}"
+        )
+    finally:
+        _finish_progress(progress)
+
+
+@app.post("/api/datasets/{dataset_id}/export/{format}")
+async def export_speakers_from_dataset(
+    dataset_id: str,
+    format: str,
+    event_name: str,
+    event_title: str = "",
+    compact: bool = False,
+    view: str = "full",
+    fields: Optional[str] = None,
+    progress_id: Optional[str] = None
+):
+    """
+    Export filtered speakers from a previously uploaded dataset.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        format: Export format (csv, json, text, parquet, arrow)
+        event_name: Name of the event
+        event_title: Optional event title
+        compact: Omit whitespace from a JSON report (smaller and faster)
+        view: Speaker fields of a JSON report: 'full', or 'summary' to
+            leave out the full_notes and full_abstract texts
+        fields: Optional comma-separated speaker fields of a JSON report
+            instead of a view. The other formats have a fixed layout.
+        progress_id: Optional new client-chosen ID to follow the run on
+            /api/progress/{progress_id}
+            
+    Returns:
+        File download response
+    """
+    _check_export_format(format)
+    compact = compact and format == 'json'
+    selection = _select_fields(view, fields) if format == 'json' else None
+    df = _get_dataset(dataset_id)
+    progress = _get_progress(progress_id)
+    
+    try:
+        cache_key = _dataset_cache_key(
+            dataset_id, 'export', format, event_name, event_title, compact,
+            _selection_key(selection)
+        )
+        cached = _cached_response(cache_key, format) if cache_key is not None else None
+        if cached is not None:
+            _finish_progress(progress)
+            return cached
+        
+        tag_index = await _get_tag_index(dataset_id, df)
+        categorized = await executor.run(
+            pipeline.categorize_frame, df, event_name, tag_index, progress,
+            in_thread=progress is not None
+        )
+        
+        return await _export_response(
+            format, event_name, event_title, categorized, progress, cache_key, compact,
+            selection
+        )
+        
+    except Exception as e:
+        _finish_progress(progress, str(e))
         raise HTTPException(
             status_code=500,
             detail=f"Error exporting data: {str(e)}"
         )
 
 
+@app.post("/api/datasets/{dataset_id}/result-sets")
+async def create_result_set(
+    dataset_id: str,
+    event_name: str,
+    event_title: str = "",
+    limit: int = PAGE_SIZE_DEFAULT,
+    view: str = "full",
+    fields: Optional[str] = None,
+    progress_id: Optional[str] = None
+):
+    """
+    Filter speakers from a stored dataset into a paginated result set.
+    
+    Returns the summary and the first page of each category; read further
+    pages from /api/result-sets/{result_set_id}/{category}. The result set
+    ID depends only on the dataset content, event and filter settings, so
+    calling this again after the result set expired rebuilds it under the
+    same ID and earlier cursors stay valid.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        event_name: Name of the event (e.g., "2511 Barclays")
+        event_title: Optional event title for content analysis
+        limit: Speakers per page (at most PAGE_SIZE_MAX)
+        view: Speaker fields of the first pages: 'full', or 'summary' to
+            leave out the full_notes and full_abstract texts
+        fields: Optional comma-separated speaker fields instead of a view
+        progress_id: Optional new client-chosen ID to follow the run on
+            /api/progress/{progress_id}
+            
+    Returns:
+        Result set ID, summary and first page of each category
+    """
+    _check_page_size(limit)
+    selection = _select_fields(view, fields)
+    df = _get_dataset(dataset_id)
+    progress = _get_progress(progress_id)
+    
+    try:
+        cache_key = _dataset_cache_key(dataset_id, 'filter', event_name, event_title)
+        set_id = result_set_id(cache_key or ('filter', dataset_id, event_name, event_title))
+        
+        result = result_sets.get(set_id)
+        if result is None:
+            tag_index = await _get_tag_index(dataset_id, df)
+            result = await executor.run(
+                pipeline.filter_frame, df, event_name, event_title, tag_index, progress,
+                in_thread=progress is not None
+            )
+            result_sets.put(set_id, result)
+        
+        return await _json_response(
+            {"result_set_id": set_id, **first_pages(result, limit, selection)}, progress
+        )
+        
+    except NoRecordsError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error filtering speakers: {str(e)}"
+        )
+    finally:
+        _finish_progress(progress)
+
+
+@app.get("/api/result-sets/{result_set_id}/{category}")
+async def get_result_page(
+    result_set_id: str,
+    category: str,
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE_DEFAULT,
+    view: str = "full",
+    fields: Optional[str] = None
+):
+    """
+    Get one page of speakers from a result set.
+    
+    Args:
+        result_set_id: Result set ID returned by
+            /api/datasets/{dataset_id}/result-sets
+        category: confirmed, intended or endorsed
+        cursor: next_cursor of the previous page; omit for the first page
+        limit: Speakers per page (at most PAGE_SIZE_MAX)
+        view: 'full' for every speaker field, 'summary' to leave out the
+            full_notes and full_abstract texts
+        fields: Optional comma-separated speaker fields instead of a view
+        
+    Returns:
+        Speakers of the page, its offset, total count of the category and
+        next_cursor (null on the last page)
+    """
+    _check_page_size(limit)
+    selection = _select_fields(view, fields)
+    result = _get_result_set(result_set_id, category)
+    
+    try:
+        page = paginate(result, category, cursor, limit, selection)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    
+    return await _json_response(page)
+
+
+@app.get("/api/result-sets/{result_set_id}/{category}/{position}")
+async def get_speaker_detail(result_set_id: str, category: str, position: int):
+    """
+    Get every field of one speaker of a result set, e.g. after listing
+    pages with view=summary.
+    
+    Args:
+        result_set_id: Result set ID returned by
+            /api/datasets/{dataset_id}/result-sets
+        category: confirmed, intended or endorsed
+        position: Position of the speaker in its category: the page's
+            offset plus the speaker's index in the page
+            
+    Returns:
+        The speaker with all fields, including full_notes and full_abstract
+    """
+    result = _get_result_set(result_set_id, category)
+    
+    speaker = speaker_detail(result, category, position)
+    if speaker is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No {category} speaker at position {position}"
+        )
+    
+    return await _json_response(speaker)
+
+
+@app.post("/api/datasets/{dataset_id}/filter-events")
+async def filter_events_from_dataset(dataset_id: str, request: MultiEventFilterRequest):
+    """
+    Filter speakers for several events from a previously uploaded dataset.
+    
+    The dataset's tag index is built once and shared by all events, so
+    each additional event costs a lookup instead of a full column scan.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        request: Events to filter, each with an optional event title
+        
+    Returns:
+        One FilterResponse per requested event, in request order
+    """
+    if not request.events:
+        raise HTTPException(
+            status_code=400,
+            detail="At least one event is required"
+        )
+    
+    df = _get_dataset(dataset_id)
+    
+    try:
+        tag_index = await _get_tag_index(dataset_id, df)
+        events = [(e.event_name, e.event_title or "") for e in request.events]
+        event_results = await executor.run(pipeline.filter_events, df, events, tag_index)
+        
+        return {
+            "dataset_id": dataset_id,
+            "event_count": len(event_results),
+            "results": event_results
+        }
+        
+    except NoRecordsError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error filtering speakers: {str(e)}"
+        )
+
+
+@app.get("/api/datasets/{dataset_id}/events")
+async def list_dataset_events(dataset_id: str):
+    """
+    List the events tagged in a previously uploaded dataset.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+        
+    Returns:
+        Row counts per event and tag status
+    """
+    df = _get_dataset(dataset_id)
+    tag_index = await _get_tag_index(dataset_id, df)
+    
+    return {
+        "dataset_id": dataset_id,
+        "tag_count": tag_index.tag_count(),
+        "events": tag_index.event_statuses()
+    }
+
+
+def _get_job(job_id):
+    """
+    Look up a submitted job.
+    
+    Args:
+        job_id: Job ID returned by /api/jobs
+        
+    Returns:
+        Job: Submitted job
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found or expired"
+        )
+    return job
+
+
+def _run_job(job, dataset_id, df, request):
+    """
+    Run a submitted job in a job worker thread.
+    
+    Args:
+        job: Job being run, for progress reporting
+        dataset_id: Dataset ID returned by /api/upload-csv
+        df: Stored dataset, held by the job even if the registry evicts it
+        request: Submitted job request
+        
+    Returns:
+        dict or bytes: Filter response, or the rendered export
+    """
+    tag_index = datasets.get_tag_index(dataset_id)
+    if tag_index is None:
+        job.progress.start('indexing', len(df))
+        tag_index = pipeline.build_tag_index(df)
+        job.progress.advance('indexing', len(df))
+        datasets.set_tag_index(dataset_id, tag_index)
+    
+    event_title = request.event_title or ""
+    if request.format is None:
+        return pipeline.filter_frame(
+            df, request.event_name, event_title, tag_index, job.progress
+        )
+    return pipeline.export_frame(
+        request.format, df, request.event_name, event_title, tag_index, job.progress,
+        bool(request.compact)
+    )
+
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(request: JobRequest):
+    """
+    Submit a filter or export run on a stored dataset as a background job.
+    
+    The job runs in the job worker pool; poll /api/jobs/{job_id} for its
+    status and progress and download /api/jobs/{job_id}/result when it has
+    completed.
+    
+    Args:
+        request: Dataset, event and, for an export, the export format
+        
+    Returns:
+        Job status with the job ID
+    """
+    if request.format is not None:
+        _check_export_format(request.format)
+    df = _get_dataset(request.dataset_id)
+    
+    params = {
+        "dataset_id": request.dataset_id,
+        "event_name": request.event_name,
+        "event_title": request.event_title or "",
+        "format": request.format,
+        "compact": bool(request.compact)
+    }
+    kind = "filter" if request.format is None else "export"
+    
+    try:
+        job = jobs.submit(
+            kind, params, lambda job: _run_job(job, request.dataset_id, df, request)
+        )
+    except JobQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
+    
+    return job.to_dict()
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get the status and stage progress of a job.
+    
+    Args:
+        job_id: Job ID returned by /api/jobs
+        
+    Returns:
+        Job status, progress and error, if any
+    """
+    return _get_job(job_id).to_dict()
+
+
+@app.get("/api/jobs/{job_id}/progress")
+async def stream_job_progress(job_id: str):
+    """
+    Stream the stage progress of a job as Server-Sent Events.
+    
+    Args:
+        job_id: Job ID returned by /api/jobs
+        
+    Returns:
+        text/event-stream of 'progress' events and a final 'done' event
+    """
+    return _progress_stream_response(_get_job(job_id).progress)
+
+
+@app.get("/api/progress/{progress_id}")
+async def stream_progress(progress_id: str):
+    """
+    Stream the progress of a run started with ?progress_id=... as
+    Server-Sent Events.
+    
+    Each event carries the current stage and, per stage (receiving,
+    parsing, categorizing, enriching, serializing), the count done, the
+    expected total if known and the seconds spent, from which clients can
+    estimate the remaining time. The stream may be opened before the run
+    starts; use a new ID for every run.
+    
+    Args:
+        progress_id: Client-chosen progress ID
+        
+    Returns:
+        text/event-stream of 'progress' events and a final 'done' event
+    """
+    return _progress_stream_response(progress_registry.get_or_create(progress_id))
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """
+    Download the result of a completed job.
+    
+    Args:
+        job_id: Job ID returned by /api/jobs
+        
+    Returns:
+        FilterResponse for filter jobs, file download for export jobs
+    """
+    job = _get_job(job_id)
+    
+    if job.status == 'failed':
+        raise HTTPException(
+            status_code=500,
+            detail=f"Job failed: {job.error}"
+        )
+    if job.status != 'completed':
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job is {job.status}"
+        )
+    
+    if job.kind == 'filter':
+        return await _json_response(job.result)
+    
+    media_type, extension = EXPORT_MEDIA_TYPES[job.params['format']]
+    timestamp = job.finished_at.strftime('%Y%m%d_%H%M%S')
+    return Response(
+        content=job.result,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename=speaker_report_{timestamp}.{extension}"
+        }
+    )
+
+
+@app.delete("/api/jobs/{job_id}")
+async def delete_job(job_id: str):
+    """
+    Cancel a queued job or discard a finished job's result.
+    
+    Args:
+        job_id: Job ID returned by /api/jobs
+    """
+    if not jobs.remove(job_id):
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found or expired"
+        )
+    return {"job_id": job_id, "deleted": True}
+
+
+@app.delete("/api/datasets/{dataset_id}")
+async def delete_dataset(dataset_id: str):
+    """
+    Release a previously uploaded dataset.
+    
+    Args:
+        dataset_id: Dataset ID returned by /api/upload-csv
+    """
+    if not datasets.remove(dataset_id):
+        raise HTTPException(
+            status_code=404,
+            detail="Dataset not found or expired"
+        )
+    return {"dataset_id": dataset_id, "deleted": True}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,68 @@
+"""
+Benchmark JSON serialization of a filter response.
+
+Filters a CSV file for an event, then times each available serializer
+(json, and orjson if installed) in compact and indented layout on the
+resulting response.
+"""
+import sys
+import time
+from pipeline import filter_csv_bytes
+from serialization import JSON_SERIALIZERS, dumps, orjson
+
+
+def benchmark(filepath, event_name, event_title="", repeats=5):
+    """
+    Time the serializers on one filter response and print a table.
+
+    Args:
+        filepath: Path to a speaker CSV file
+        event_name: Name of the event to filter for
+        event_title: Optional event title for content analysis
+        repeats: Runs per serializer and layout; the best time is reported
+    """
+    with open(filepath, 'rb') as f:
+        contents = f.read()
+
+    response = filter_csv_bytes(contents, event_name, event_title)
+    summary = response['summary']
+    print(f"\nEvent: {event_name}")
+    print(f"Speakers: {summary['confirmed_count']} confirmed, "
+          f"{summary['intended_count']} intended, {summary['endorsed_count']} endorsed\n")
+
+    serializers = [name for name in JSON_SERIALIZERS if name != 'orjson' or orjson is not None]
+    baseline = None
+
+    print(f"{'serializer':<12}{'layout':<10}{'best ms':>10}{'MB':>10}{'speedup':>10}")
+    for serializer in serializers:
+        for compact in (False, True):
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                body = dumps(response, compact, serializer)
+                timings.append(time.perf_counter() - start)
+
+            best = min(timings)
+            if baseline is None:
+                baseline = best
+            layout = 'compact' if compact else 'indented'
+            print(f"{serializer:<12}{layout:<10}{best * 1000:>10.1f}"
+                  f"{len(body) / 1024 / 1024:>10.2f}{baseline / best:>9.1f}x")
+
+    if orjson is None:
+        print("\norjson is not installed; pip install orjson to compare it.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("\nUsage:")
+        print("  python benchmark_json.py <path_to_csv_file> <event_name> [event_title] [repeats]")
+        print("\nExample:")
+        print("  python benchmark_json.py speakers.csv \"2511 Barclays\" \"Banking risk\"\n")
+    else:
+        benchmark(
+            sys.argv[1],
+            sys.argv[2],
+            sys.argv[3] if len(sys.argv) > 3 else "",
+            int(sys.argv[4]) if len(sys.argv) > 4 else 5
+        )
@@ -0,0 +1,259 @@
+"""
+Parquet and Arrow IPC exports of categorized speakers.
+
+Notebooks and the warehouse load these formats directly instead of
+re-parsing a CSV or JSON report. Every export has the same schema: one row
+per speaker, with the category as a column and the IR rating as a float.
+Columns are built one field at a time from a frame of the result set's
+source rows, and the file is written and streamed one record batch at a
+time.
+"""
+import io
+from datetime import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config import COLUMNS
+from filters import rating_flags
+from progress import Progress
+from text_extractor import EventKeywordMatcher, TextExtractor
+
+FORMATS = ('parquet', 'arrow')
+
+# Rows per record batch; each batch is one Parquet row group and one
+# streamed chunk
+BATCH_ROWS = 8192
+
+PARQUET_COMPRESSION = 'zstd'
+
+# One row per speaker, in the field order of the JSON report. Fields a
+# category does not have (the tag of detailed speakers, everything but the
+# name, tag and company of confirmed ones) are null.
+SPEAKER_SCHEMA = pa.schema([
+    ('speaker_name', pa.string()),
+    ('tag', pa.string()),
+    ('company', pa.string()),
+    ('category', pa.string()),
+    ('rating_flag', pa.string()),
+    ('axel_rating', pa.string()),
+    ('in_sum', pa.string()),
+    ('call_date', pa.string()),
+    ('full_notes', pa.string()),
+    ('jelena_rating', pa.string()),
+    ('jelena_comments', pa.string()),
+    ('abstract_title', pa.string()),
+    ('full_abstract', pa.string()),
+    ('region', pa.string()),
+    ('ir_engagement', pa.string()),
+    ('ir_rating', pa.float64()),
+    ('content_fit_analysis', pa.string())
+])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out the bytes written since the last drain."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        # Parquet records byte offsets in the footer, so the position keeps
+        # counting across drains
+        return self._position
+
+    def drain(self):
+        """
+        Take the bytes written since the last drain.
+
+        Returns:
+            bytes: Written bytes, empty if nothing was written
+        """
+        chunk = b''.join(self._chunks)
+        self._chunks = []
+        return chunk
+
+
+def _text_column(frame, field, default=''):
+    """
+    Vectorized equivalent of safe_str() over one source column.
+
+    Args:
+        frame: Source rows
+        field: Key of the column in COLUMNS
+        default: Value used when the column does not exist
+
+    Returns:
+        pd.Series: Strings, empty for NaN/NA/None
+    """
+    column = COLUMNS[field]
+    if column not in frame.columns:
+        return pd.Series(default, index=frame.index, dtype=object)
+
+    series = frame[column]
+    return series.astype(str).where(series.notna(), '')
+
+
+def _detailed_table(speakers, matcher):
+    """
+    Build the rows of detailed (intended or endorsed) speakers.
+
+    Text columns, rating flags and IR ratings are computed over whole
+    columns. The call notes, Jelena's comments, abstract titles and content
+    fit still go through the per-row *_many extractors: each is several
+    steps (search, strip, split into lines, truncate), and chaining pandas'
+    object-dtype string methods measured slower than one loop over the
+    precompiled patterns. Arrow compute kernels are faster but use RE2 and
+    their own whitespace and case rules, so values would drift from the
+    JSON report's.
+
+    Args:
+        speakers: SpeakerRecords of one category
+        matcher: EventKeywordMatcher for the content fit analysis
+
+    Returns:
+        pa.Table: Speakers in SPEAKER_SCHEMA
+    """
+    # Object columns keep the source values as they are, so strings come
+    # out as safe_str() writes them
+    frame = pd.DataFrame([speaker.record for speaker in speakers], dtype=object)
+
+    notes = _text_column(frame, 'notes_speaker_calls')
+    jelena = _text_column(frame, 'jelena_comments')
+    abstracts = _text_column(frame, 'abstract')
+    ir_engagement = _text_column(frame, 'ir_speaking_engagement')
+
+    in_sum, call_date = zip(*TextExtractor.extract_in_sum_section_many(notes))
+    jelena_rating, jelena_comments = zip(*TextExtractor.extract_jelena_comments_many(jelena))
+
+    if COLUMNS['axel_rating'] in frame.columns:
+        flags = rating_flags(frame[COLUMNS['axel_rating']])
+    else:
+        flags = pd.Series('', index=frame.index, dtype=object)
+
+    columns = {
+        'speaker_name': _text_column(frame, 'speaker_name', 'Unknown'),
+        'tag': pa.nulls(len(frame), pa.string()),
+        'company': _text_column(frame, 'company'),
+        'category': pd.Series(speakers[0]['category'], index=frame.index, dtype=object),
+        'rating_flag': flags,
+        'axel_rating': _text_column(frame, 'axel_rating'),
+        'in_sum': in_sum,
+        'call_date': call_date,
+        'full_notes': notes,
+        'jelena_rating': jelena_rating,
+        'jelena_comments': jelena_comments,
+        'abstract_title': TextExtractor.extract_abstract_title_many(abstracts),
+        'full_abstract': abstracts,
+        'region': _text_column(frame, 'region'),
+        'ir_engagement': ir_engagement,
+        'ir_rating': TextExtractor.extract_ir_rating_many(ir_engagement),
+        'content_fit_analysis': matcher.content_fit_analysis_many(abstracts)
+    }
+    arrays = [pa.array(columns[field.name], field.type, from_pandas=True)
+              for field in SPEAKER_SCHEMA]
+    return pa.Table.from_arrays(arrays, schema=SPEAKER_SCHEMA)
+
+
+def speaker_batches(event_title, confirmed, intended, endorsed, batch_rows=BATCH_ROWS,
+                    progress=None):
+    """
+    Convert categorized speakers to record batches, one category at a time.
+
+    Args:
+        event_title: Optional event title for the content fit analysis
+        confirmed: List of confirmed speakers
+        intended: List of intended speakers (SpeakerRecords)
+        endorsed: List of endorsed speakers (SpeakerRecords)
+        batch_rows: Maximum rows per batch
+        progress: Optional Progress to report enriched speakers to
+
+    Yields:
+        pa.RecordBatch: Next rows in SPEAKER_SCHEMA
+    """
+    progress = progress or Progress()
+    progress.start('enriching', len(intended) + len(endorsed))
+    matcher = EventKeywordMatcher(event_title)
+
+    if confirmed:
+        yield from pa.Table.from_pylist(confirmed, schema=SPEAKER_SCHEMA).to_batches(batch_rows)
+
+    for speakers in (intended, endorsed):
+        if speakers:
+            table = _detailed_table(speakers, matcher)
+            progress.advance('enriching', len(speakers))
+            yield from table.to_batches(batch_rows)
+
+
+def _open_writer(format, sink, schema):
+    """
+    Open a Parquet or Arrow IPC file writer.
+
+    Args:
+        format: 'parquet' or 'arrow'
+        sink: Writable file object
+        schema: Schema of the file
+
+    Returns:
+        Writer with write_batch() and close()
+    """
+    if format == 'parquet':
+        return pq.ParquetWriter(sink, schema, compression=PARQUET_COMPRESSION)
+    return pa.ipc.new_file(sink, schema)
+
+
+def iter_columnar_export(format, event_name, event_title, confirmed, intended, endorsed,
+                         batch_rows=BATCH_ROWS, progress=None):
+    """
+    Write categorized speakers as a Parquet or Arrow IPC file, piece by piece.
+
+    The event name and title and the generation time are stored in the
+    schema metadata.
+
+    Args:
+        format: 'parquet' or 'arrow'
+        event_name: Name of the event
+        event_title: Optional event title
+        confirmed: List of confirmed speakers
+        intended: List of intended speakers
+        endorsed: List of endorsed speakers
+        batch_rows: Rows per record batch (and Parquet row group)
+        progress: Optional Progress to report stage counts to
+
+    Yields:
+        bytes: Next chunk of the file
+    """
+    progress = progress or Progress()
+    schema = SPEAKER_SCHEMA.with_metadata({
+        'event_name': event_name,
+        'event_title': event_title,
+        'generated_at': datetime.now().isoformat()
+    })
+
+    sink = _ChunkSink()
+    writer = _open_writer(format, sink, schema)
+    progress.start('serializing')
+
+    def flush():
+        chunk = sink.drain()
+        progress.advance('serializing', len(chunk))
+        return chunk
+
+    for batch in speaker_batches(event_title, confirmed, intended, endorsed, batch_rows,
+                                 progress):
+        writer.write_batch(batch)
+        chunk = flush()
+        if chunk:
+            yield chunk
+
+    writer.close()
+    yield flush()
@@ -35,4 +35,41 @@ IR_RATING_THRESHOLD = 3.8
 # Region filters for Intended/Endorsed
 EXCLUDED_REGIONS = ['Asia', 'US']
 
+# Memory budget for uploaded datasets kept server-side (LRU eviction)
+DATASET_CACHE_MAX_BYTES = int(os.getenv('DATASET_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
 
+# Rows per chunk when streaming CSV uploads (bounded-memory ingestion)
+CSV_CHUNK_ROWS = int(os.getenv('CSV_CHUNK_ROWS', 50000))
+
+# Worker pool for parse/filter/enrich work ('thread' or 'process').
+# 'process' sidesteps the GIL but pickles every argument to the worker on
+# each call: filtering a stored dataset copies its whole DataFrame (the
+# mapped columns kept at upload, see memory_bytes) and tag index per request.
+FILTER_EXECUTOR = os.getenv('FILTER_EXECUTOR', 'thread')
+FILTER_WORKERS = int(os.getenv('FILTER_WORKERS', min(4, os.cpu_count() or 1)))
+
+# Background jobs: concurrent jobs, jobs waiting beyond those, and how long
+# finished jobs and their results are kept
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', 2))
+JOB_QUEUE_SIZE = int(os.getenv('JOB_QUEUE_SIZE', 16))
+JOB_RESULT_TTL_SECONDS = int(os.getenv('JOB_RESULT_TTL_SECONDS', 3600))
+
+# Progress streams: how long an idle run's progress is kept, and how often
+# the event stream checks for updates
+PROGRESS_TTL_SECONDS = int(os.getenv('PROGRESS_TTL_SECONDS', 600))
+PROGRESS_INTERVAL_SECONDS = float(os.getenv('PROGRESS_INTERVAL_SECONDS', 0.5))
+
+# Cached filter/export results (LRU eviction bounded by memory, plus a TTL)
+RESULT_CACHE_MAX_BYTES = int(os.getenv('RESULT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+RESULT_CACHE_TTL_SECONDS = int(os.getenv('RESULT_CACHE_TTL_SECONDS', 3600))
+
+# JSON serializer for responses and JSON exports ('auto', 'json' or 'orjson';
+# 'auto' uses orjson when it is installed)
+JSON_SERIALIZER = os.getenv('JSON_SERIALIZER', 'auto')
+
+# Paginated result sets: speakers per page by default and at most, and the
+# memory budget and TTL of stored result sets
+PAGE_SIZE_DEFAULT = int(os.getenv('PAGE_SIZE_DEFAULT', 50))
+PAGE_SIZE_MAX = int(os.getenv('PAGE_SIZE_MAX', 500))
+RESULT_SET_MAX_BYTES = int(os.getenv('RESULT_SET_MAX_BYTES', 512 * 1024 * 1024))
+RESULT_SET_TTL_SECONDS = int(os.getenv('RESULT_SET_TTL_SECONDS', 3600))
@@ -0,0 +1,175 @@
+"""
+In-memory registry of parsed datasets.
+
+An uploaded file is parsed once and kept server-side under an ID, so the
+preview, filter and export calls of a session can reuse the same DataFrame
+instead of re-sending and re-parsing the file.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+
+
+class DatasetRegistry:
+    """Stores parsed DataFrames with memory-bounded LRU eviction."""
+
+    def __init__(self, max_bytes):
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_bytes: Total memory budget for all stored DataFrames
+        """
+        self.max_bytes = max_bytes
+        self._datasets = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, df, filename=None, content_hash=None):
+        """
+        Store a DataFrame and evict least recently used ones over budget.
+
+        The dataset being added is never evicted by its own insertion, so a
+        single upload larger than the budget is still kept until the next one.
+
+        Args:
+            df: Parsed DataFrame
+            filename: Original upload file name
+            content_hash: Hash of the uploaded file, for result caching
+
+        Returns:
+            str: Dataset ID
+        """
+        dataset_id = uuid.uuid4().hex
+        size = int(df.memory_usage(deep=True).sum())
+
+        with self._lock:
+            self._datasets[dataset_id] = {
+                'df': df,
+                'filename': filename,
+                'content_hash': content_hash,
+                'size_bytes': size,
+                'tag_index': None
+            }
+            self._total_bytes += size
+            self._evict(dataset_id)
+
+        return dataset_id
+
+    def _evict(self, keep_id):
+        """
+        Evict least recently used datasets until the budget is met.
+
+        Must be called with the lock held.
+
+        Args:
+            keep_id: Dataset that is never evicted, i.e. the one that grew
+        """
+        while self._total_bytes > self.max_bytes and len(self._datasets) > 1:
+            dataset_id = next(iter(self._datasets))
+            if dataset_id == keep_id:
+                self._datasets.move_to_end(dataset_id)
+                continue
+            evicted = self._datasets.pop(dataset_id)
+            self._total_bytes -= evicted['size_bytes']
+
+    def get(self, dataset_id):
+        """
+        Get a stored DataFrame and mark it as recently used.
+
+        Args:
+            dataset_id: Dataset ID returned by add()
+
+        Returns:
+            DataFrame: Stored DataFrame, or None if unknown or evicted
+        """
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is None:
+                return None
+            self._datasets.move_to_end(dataset_id)
+            return entry['df']
+
+    def get_content_hash(self, dataset_id):
+        """
+        Get the content hash of a stored dataset's upload.
+
+        Args:
+            dataset_id: Dataset ID returned by add()
+
+        Returns:
+            str: Content hash, or None if unknown, evicted or not hashed
+        """
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            return entry['content_hash'] if entry is not None else None
+
+    def get_tag_index(self, dataset_id):
+        """
+        Get the tag index built for a stored dataset.
+
+        Args:
+            dataset_id: Dataset ID returned by add()
+
+        Returns:
+            TagIndex: Stored index, or None if not built yet or evicted
+        """
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            return entry['tag_index'] if entry is not None else None
+
+    def set_tag_index(self, dataset_id, tag_index):
+        """
+        Store the tag index built for a dataset.
+
+        The index's estimated size is added to the dataset's, so it counts
+        toward the memory budget, and it is dropped together with its
+        dataset on eviction.
+
+        Args:
+            dataset_id: Dataset ID returned by add()
+            tag_index: TagIndex built for the dataset's DataFrame
+        """
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is None:
+                return
+
+            size = tag_index.estimated_size()
+            if entry['tag_index'] is not None:
+                size -= entry['tag_index'].estimated_size()
+            entry['tag_index'] = tag_index
+            entry['size_bytes'] += size
+            self._total_bytes += size
+            self._evict(dataset_id)
+
+    def remove(self, dataset_id):
+        """
+        Remove a stored DataFrame.
+
+        Args:
+            dataset_id: Dataset ID returned by add()
+
+        Returns:
+            bool: True if the dataset was stored
+        """
+        with self._lock:
+            entry = self._datasets.pop(dataset_id, None)
+            if entry is None:
+                return False
+            self._total_bytes -= entry['size_bytes']
+            return True
+
+    def stats(self):
+        """
+        Get registry usage statistics.
+
+        Returns:
+            dict: Dataset count and memory usage
+        """
+        with self._lock:
+            return {
+                'dataset_count': len(self._datasets),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
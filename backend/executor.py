@@ -0,0 +1,138 @@
+"""
+Worker pool for CPU-bound request work.
+
+Parsing, filtering and enrichment run here instead of on the asyncio event
+loop, so one large upload does not stall /health and every other request.
+
+In process mode, arguments and results are pickled across the process
+boundary on every call; work that must stay in-process (open files) runs
+in a separate thread pool of the same size.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class FilterExecutor:
+    """Runs blocking work in a thread or process pool and tracks its load."""
+
+    def __init__(self, kind='thread', max_workers=4):
+        """
+        Initialize the worker pool.
+
+        Args:
+            kind: 'thread' or 'process'
+            max_workers: Number of workers
+        """
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor kind: {kind}. Must be thread or process")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self._pool = None
+        self._thread_pool = None
+        self._lock = threading.Lock()
+
+        # Load counters per pool: 'process' (process mode only) and 'thread'
+        pools = self._pool_names()
+        self._in_flight = dict.fromkeys(pools, 0)
+        self._completed = dict.fromkeys(pools, 0)
+        self._peak_in_flight = dict.fromkeys(pools, 0)
+
+    async def run(self, func, *args, in_thread=False):
+        """
+        Run a function in the pool and wait for its result.
+
+        Args:
+            func: Function to run; must be picklable for a process pool
+            *args: Positional arguments; must be picklable for a process pool
+            in_thread: Always use a thread, e.g. for work holding open files
+
+        Returns:
+            Any: The function's return value
+        """
+        name = 'thread' if in_thread or self.kind == 'thread' else 'process'
+        pool = self._get_thread_pool() if name == 'thread' else self._get_pool()
+
+        with self._lock:
+            self._in_flight[name] += 1
+            self._peak_in_flight[name] = max(self._peak_in_flight[name], self._in_flight[name])
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, functools.partial(func, *args))
+        finally:
+            with self._lock:
+                self._in_flight[name] -= 1
+                self._completed[name] += 1
+
+    def stats(self):
+        """
+        Get pool load statistics.
+
+        Each pool has max_workers workers and is reported on its own, so
+        running and queued counts are relative to that pool's size.
+
+        Returns:
+            dict: Executor kind and, per pool, worker count, running/queued
+                tasks and saturation
+        """
+        with self._lock:
+            pools = {}
+            for name in self._pool_names():
+                in_flight = self._in_flight[name]
+                pools[name] = {
+                    'max_workers': self.max_workers,
+                    'running': min(in_flight, self.max_workers),
+                    'queued': max(in_flight - self.max_workers, 0),
+                    'saturated': in_flight >= self.max_workers,
+                    'peak_in_flight': self._peak_in_flight[name],
+                    'completed': self._completed[name]
+                }
+            return {'kind': self.kind, 'pools': pools}
+
+    def shutdown(self):
+        """Shut down the worker pools."""
+        for pool in (self._pool, self._thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _pool_names(self):
+        """
+        Get the names of the pools this executor can use.
+
+        Returns:
+            tuple: ('thread',), or ('process', 'thread') in process mode
+        """
+        return ('thread',) if self.kind == 'thread' else ('process', 'thread')
+
+    def _get_pool(self):
+        """
+        Get the main pool, creating it on first use.
+
+        Returns:
+            Executor: Thread or process pool
+        """
+        if self.kind == 'thread':
+            return self._get_thread_pool()
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _get_thread_pool(self):
+        """
+        Get the thread pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Thread pool
+        """
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='filter'
+                )
+            return self._thread_pool
@@ -1,6 +1,8 @@
 """
 Filtering logic for categorizing speakers.
 """
+import sys
+from collections.abc import Mapping
 import pandas as pd
 from config import (
     COLUMNS, 
@@ -10,24 +12,286 @@ from config import (
 )
 from text_extractor import TextExtractor
 
+# Marks a SpeakerRecord field not extracted yet; Ellipsis survives pickling
+_UNSET = ...
+
 
 def safe_str(value):
     """
     Safely convert a value to string, handling NaN and None.
     
     Args:
-        value: Any value that might be NaN, None, or other type
+        value: Any value that might be NaN, NA, None, or other type
         
     Returns:
-        str: String representation, or empty string for NaN/None
+        str: String representation, or empty string for NaN/NA/None
     """
-    if value is None:
+    if value is None or value is pd.NA:
         return ''
     if isinstance(value, float) and pd.isna(value):
         return ''
     return str(value)
 
 
+def rating_flag(record):
+    """
+    Get rating flag for speaker.
+    
+    Args:
+        record: Speaker record
+        
+    Returns:
+        str: Rating flag ("Good option", "Lower rating", or "")
+    """
+    axel_rating = record.get(COLUMNS['axel_rating'])
+    
+    axel_numeric = None
+    if axel_rating is not None:
+        try:
+            axel_numeric = float(axel_rating)
+        except (ValueError, TypeError):
+            pass
+    
+    if axel_numeric is not None:
+        if axel_numeric >= AXEL_RATING_GOOD:
+            return "Good option"
+        elif axel_numeric in [92, 93]:
+            return "Lower rating"
+    
+    return ""
+
+
+def rating_flags(axel_ratings):
+    """
+    Vectorized equivalent of rating_flag.
+    
+    Args:
+        axel_ratings: Axel rating column
+        
+    Returns:
+        pd.Series: Rating flags ("Good option", "Lower rating", or "")
+    """
+    axel_numeric = DataFrameSpeakerFilter._to_float(axel_ratings)
+    
+    flags = pd.Series('', index=axel_ratings.index, dtype=object)
+    flags[axel_numeric.isin([92, 93])] = "Lower rating"
+    flags[axel_numeric >= AXEL_RATING_GOOD] = "Good option"
+    return flags
+
+
+class SpeakerRecord(Mapping):
+    """
+    Detailed speaker information for the Intended/Endorsed categories.
+    
+    Keeps a reference to the source record and extracts the derived fields
+    (call notes summary, Jelena's rating and comments, abstract title, IR
+    rating, rating flag) on first access, so CPU and memory scale with the
+    fields a response or report actually reads. Behaves as a read-only dict
+    with the keys in a fixed order; to_dict() and the JSON serializers turn
+    it into a plain object.
+    """
+    
+    # Derived values; _UNSET until first accessed
+    _DERIVED_SLOTS = (
+        '_in_sum_section', '_jelena_section', '_abstract_title', '_ir_rating', '_rating_flag'
+    )
+    __slots__ = ('_record', '_category', '_analysis') + _DERIVED_SLOTS
+    
+    KEYS = (
+        'speaker_name', 'company', 'category', 'rating_flag', 'axel_rating',
+        'in_sum', 'call_date', 'full_notes', 'jelena_rating', 'jelena_comments',
+        'abstract_title', 'full_abstract', 'region', 'ir_engagement', 'ir_rating'
+    )
+    
+    # Added by OutputGenerator when the speaker is enriched
+    ANALYSIS_KEY = 'content_fit_analysis'
+    
+    def __init__(self, record, category):
+        """
+        Wrap a source record.
+        
+        Args:
+            record: Speaker record (column name to value)
+            category: Category name
+        """
+        self._record = record
+        self._category = category
+        self._analysis = _UNSET
+        for name in self._DERIVED_SLOTS:
+            setattr(self, name, _UNSET)
+    
+    def with_analysis(self, analysis):
+        """
+        Get a copy carrying the content fit analysis.
+        
+        Fields extracted so far are shared with the copy.
+        
+        Args:
+            analysis: Content fit analysis text
+            
+        Returns:
+            SpeakerRecord: Copy with the content_fit_analysis key
+        """
+        enhanced = SpeakerRecord(self._record, self._category)
+        for name in self._DERIVED_SLOTS:
+            setattr(enhanced, name, getattr(self, name))
+        enhanced._analysis = analysis
+        return enhanced
+    
+    @property
+    def record(self):
+        """Source record (column name to value)."""
+        return self._record
+    
+    def to_dict(self):
+        """
+        Convert to a plain dict, extracting every field.
+        
+        Returns:
+            dict: Speaker fields in key order
+        """
+        text = self._text
+        in_sum, call_date = self._in_sum()
+        jelena_rating, jelena_comments = self._jelena()
+        
+        data = {
+            'speaker_name': text('speaker_name', 'Unknown'),
+            'company': text('company'),
+            'category': self._category,
+            'rating_flag': self._flag(),
+            'axel_rating': text('axel_rating'),
+            'in_sum': in_sum,
+            'call_date': call_date,
+            'full_notes': text('notes_speaker_calls'),
+            'jelena_rating': jelena_rating,
+            'jelena_comments': jelena_comments,
+            'abstract_title': self._title(),
+            'full_abstract': text('abstract'),
+            'region': text('region'),
+            'ir_engagement': text('ir_speaking_engagement'),
+            'ir_rating': self._ir()
+        }
+        if self._analysis is not _UNSET:
+            data[self.ANALYSIS_KEY] = self._analysis
+        return data
+    
+    def select(self, names):
+        """
+        Convert to a plain dict of some fields, extracting only those.
+        
+        Args:
+            names: Set of field names to keep
+            
+        Returns:
+            dict: Selected speaker fields in key order
+        """
+        getters = self._GETTERS
+        data = {key: getters[key](self) for key in self.KEYS if key in names}
+        if self.ANALYSIS_KEY in names and self._analysis is not _UNSET:
+            data[self.ANALYSIS_KEY] = self._analysis
+        return data
+    
+    def estimated_size(self):
+        """
+        Estimate the memory held by the record without extracting anything.
+        
+        Counts the source record's values and the fields extracted so far;
+        column names are shared by all records and left out.
+        
+        Returns:
+            int: Approximate size in bytes
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self._record)
+        size += sum(sys.getsizeof(value) for value in self._record.values())
+        
+        for name in self._DERIVED_SLOTS + ('_analysis',):
+            value = getattr(self, name)
+            if value is _UNSET:
+                continue
+            size += sys.getsizeof(value)
+            if isinstance(value, tuple):
+                size += sum(sys.getsizeof(item) for item in value)
+        
+        return size
+    
+    def __getitem__(self, key):
+        getter = self._GETTERS.get(key)
+        if getter is not None:
+            return getter(self)
+        if key == self.ANALYSIS_KEY and self._analysis is not _UNSET:
+            return self._analysis
+        raise KeyError(key)
+    
+    def __iter__(self):
+        yield from self.KEYS
+        if self._analysis is not _UNSET:
+            yield self.ANALYSIS_KEY
+    
+    def __len__(self):
+        return len(self.KEYS) + (self._analysis is not _UNSET)
+    
+    def __repr__(self):
+        return f"SpeakerRecord({self.to_dict()!r})"
+    
+    def _text(self, field, default=''):
+        """Read a source column as a string."""
+        return safe_str(self._record.get(COLUMNS[field], default))
+    
+    def _in_sum(self):
+        """(in_sum, call_date) from the call notes."""
+        if self._in_sum_section is _UNSET:
+            self._in_sum_section = TextExtractor.extract_in_sum_section(
+                self._text('notes_speaker_calls')
+            )
+        return self._in_sum_section
+    
+    def _jelena(self):
+        """(jelena_rating, jelena_comments) from Jelena's comments."""
+        if self._jelena_section is _UNSET:
+            self._jelena_section = TextExtractor.extract_jelena_comments(
+                self._text('jelena_comments')
+            )
+        return self._jelena_section
+    
+    def _title(self):
+        """Title line of the abstract."""
+        if self._abstract_title is _UNSET:
+            self._abstract_title = TextExtractor.extract_abstract_title(self._text('abstract'))
+        return self._abstract_title
+    
+    def _ir(self):
+        """IR rating from the IR speaking engagement text."""
+        if self._ir_rating is _UNSET:
+            self._ir_rating = TextExtractor.extract_ir_rating(
+                self._text('ir_speaking_engagement')
+            )
+        return self._ir_rating
+    
+    def _flag(self):
+        """Rating flag from Axel's rating."""
+        if self._rating_flag is _UNSET:
+            self._rating_flag = rating_flag(self._record)
+        return self._rating_flag
+    
+    _GETTERS = {
+        'speaker_name': lambda self: self._text('speaker_name', 'Unknown'),
+        'company': lambda self: self._text('company'),
+        'category': lambda self: self._category,
+        'rating_flag': _flag,
+        'axel_rating': lambda self: self._text('axel_rating'),
+        'in_sum': lambda self: self._in_sum()[0],
+        'call_date': lambda self: self._in_sum()[1],
+        'full_notes': lambda self: self._text('notes_speaker_calls'),
+        'jelena_rating': lambda self: self._jelena()[0],
+        'jelena_comments': lambda self: self._jelena()[1],
+        'abstract_title': _title,
+        'full_abstract': lambda self: self._text('abstract'),
+        'region': lambda self: self._text('region'),
+        'ir_engagement': lambda self: self._text('ir_speaking_engagement'),
+        'ir_rating': _ir
+    }
+
+
 class SpeakerFilter:
     """Handles filtering and categorization of speaker records."""
     
@@ -40,6 +304,61 @@ class SpeakerFilter:
         """
         self.event_name = event_name
         self.text_extractor = TextExtractor()
+        
+        # Lowercased tags, computed once and reused for every record
+        self._confirmed_tag = f"{event_name} Confirmed".lower()
+        self._intended_tag = f"{event_name} Intended".lower()
+        self._endorsed_tag = f"{event_name} Endorsed".lower()
+        self._not_reached_tag = f"{event_name} not reached".lower()
+        self._not_available_tag = f"{event_name} not available".lower()
+    
+    def categorize(self, records):
+        """
+        Categorize records into confirmed, intended and endorsed speakers
+        in a single pass.
+        
+        Each cell is normalized once per record, and the don't-contact and
+        rating checks run at most once per record. Results are identical to
+        calling filter_confirmed, filter_intended and filter_endorsed.
+        
+        Args:
+            records: List of all speaker records
+            
+        Returns:
+            tuple: (confirmed, intended, endorsed) lists of speakers
+        """
+        confirmed = []
+        intended = []
+        endorsed = []
+        
+        for record in records:
+            workshops_lower = safe_str(record.get(COLUMNS['workshops'], '')).lower()
+            
+            if not workshops_lower:
+                continue
+            
+            if self._confirmed_tag in workshops_lower:
+                confirmed.append(self._build_confirmed_speaker_info(record))
+            
+            is_intended = (
+                self._intended_tag in workshops_lower
+                and self._not_reached_tag not in workshops_lower
+                and self._not_available_tag not in workshops_lower
+            )
+            is_endorsed = self._endorsed_tag in workshops_lower
+            
+            if not (is_intended or is_endorsed):
+                continue
+            
+            if self._is_do_not_contact(record) or not self._passes_rating_filter(record):
+                continue
+            
+            if is_intended:
+                intended.append(self._build_detailed_speaker_info(record, 'Intended'))
+            if is_endorsed:
+                endorsed.append(self._build_detailed_speaker_info(record, 'Endorsed'))
+        
+        return confirmed, intended, endorsed
     
     def filter_confirmed(self, records):
         """
@@ -52,7 +371,6 @@ class SpeakerFilter:
             list: Confirmed speakers with relevant fields
         """
         confirmed = []
-        confirmed_tag = f"{self.event_name} Confirmed"
         
         for record in records:
             workshops = record.get(COLUMNS['workshops'], '')
@@ -61,13 +379,8 @@ class SpeakerFilter:
             if not workshops_str:
                 continue
             
-            if confirmed_tag.lower() in workshops_str.lower():
-                confirmed.append({
-                    'speaker_name': safe_str(record.get(COLUMNS['speaker_name'], 'Unknown')),
-                    'tag': confirmed_tag,
-                    'company': safe_str(record.get(COLUMNS['company'], '')),
-                    'category': 'Confirmed'
-                })
+            if self._confirmed_tag in workshops_str.lower():
+                confirmed.append(self._build_confirmed_speaker_info(record))
         
         return confirmed
     
@@ -82,9 +395,6 @@ class SpeakerFilter:
             list: Intended speakers with detailed information
         """
         intended = []
-        intended_tag = f"{self.event_name} Intended"
-        not_reached_tag = f"{self.event_name} not reached"
-        not_available_tag = f"{self.event_name} not available"
         
         for record in records:
             workshops = record.get(COLUMNS['workshops'], '')
@@ -96,14 +406,12 @@ class SpeakerFilter:
             workshops_lower = workshops_str.lower()
             
             # Check if intended but not "not reached" or "not available"
-            if intended_tag.lower() in workshops_lower:
-                if not_reached_tag.lower() in workshops_lower or not_available_tag.lower() in workshops_lower:
+            if self._intended_tag in workshops_lower:
+                if self._not_reached_tag in workshops_lower or self._not_available_tag in workshops_lower:
                     continue
                 
                 # Check activity notes for DON'T CONTACT
-                activity_notes = safe_str(record.get(COLUMNS['activity_notes'], ''))
-                activity_lower = activity_notes.lower()
-                if "don't contact" in activity_lower or "do not contact" in activity_lower:
+                if self._is_do_not_contact(record):
                     continue
                 
                 # Apply rating filters
@@ -124,7 +432,6 @@ class SpeakerFilter:
             list: Endorsed speakers with detailed information
         """
         endorsed = []
-        endorsed_tag = f"{self.event_name} Endorsed"
         
         for record in records:
             workshops = record.get(COLUMNS['workshops'], '')
@@ -133,11 +440,9 @@ class SpeakerFilter:
             if not workshops_str:
                 continue
             
-            if endorsed_tag.lower() in workshops_str.lower():
+            if self._endorsed_tag in workshops_str.lower():
                 # Check activity notes for DON'T CONTACT
-                activity_notes = safe_str(record.get(COLUMNS['activity_notes'], ''))
-                activity_lower = activity_notes.lower()
-                if "don't contact" in activity_lower or "do not contact" in activity_lower:
+                if self._is_do_not_contact(record):
                     continue
                 
                 # Apply rating filters
@@ -147,6 +452,19 @@ class SpeakerFilter:
         
         return endorsed
     
+    def _is_do_not_contact(self, record):
+        """
+        Check if the activity notes mark the speaker as DON'T CONTACT.
+        
+        Args:
+            record: Speaker record
+            
+        Returns:
+            bool: True if the speaker must not be contacted
+        """
+        activity_lower = safe_str(record.get(COLUMNS['activity_notes'], '')).lower()
+        return "don't contact" in activity_lower or "do not contact" in activity_lower
+    
     def _passes_rating_filter(self, record):
         """
         Check if record passes rating filters.
@@ -189,22 +507,24 @@ class SpeakerFilter:
         Returns:
             str: Rating flag ("Good option", "Lower rating", or "")
         """
-        axel_rating = record.get(COLUMNS['axel_rating'])
-        
-        axel_numeric = None
-        if axel_rating is not None:
-            try:
-                axel_numeric = float(axel_rating)
-            except (ValueError, TypeError):
-                pass
-        
-        if axel_numeric is not None:
-            if axel_numeric >= AXEL_RATING_GOOD:
-                return "Good option"
-            elif axel_numeric in [92, 93]:
-                return "Lower rating"
+        return rating_flag(record)
+    
+    def _build_confirmed_speaker_info(self, record):
+        """
+        Build speaker information for the Confirmed category.
         
-        return ""
+        Args:
+            record: Speaker record
+            
+        Returns:
+            dict: Confirmed speaker information
+        """
+        return {
+            'speaker_name': safe_str(record.get(COLUMNS['speaker_name'], 'Unknown')),
+            'tag': f"{self.event_name} Confirmed",
+            'company': safe_str(record.get(COLUMNS['company'], '')),
+            'category': 'Confirmed'
+        }
     
     def _build_detailed_speaker_info(self, record, category):
         """
@@ -215,41 +535,215 @@ class SpeakerFilter:
             category: Category name
             
         Returns:
-            dict: Detailed speaker information
-        """
-        # Extract all necessary information with safe string conversion
-        speaker_name = safe_str(record.get(COLUMNS['speaker_name'], 'Unknown'))
-        company = safe_str(record.get(COLUMNS['company'], ''))
-        notes = safe_str(record.get(COLUMNS['notes_speaker_calls'], ''))
-        jelena_comments = safe_str(record.get(COLUMNS['jelena_comments'], ''))
-        abstract = safe_str(record.get(COLUMNS['abstract'], ''))
-        region = safe_str(record.get(COLUMNS['region'], ''))
-        ir_engagement = safe_str(record.get(COLUMNS['ir_speaking_engagement'], ''))
-        axel_rating = safe_str(record.get(COLUMNS['axel_rating'], ''))
-        
-        # Extract structured information
-        in_sum, call_date = self.text_extractor.extract_in_sum_section(notes)
-        jelena_rating, jelena_lines = self.text_extractor.extract_jelena_comments(jelena_comments)
-        abstract_title = self.text_extractor.extract_abstract_title(abstract)
-        
-        # Build speaker info dictionary
-        speaker_info = {
-            'speaker_name': speaker_name,
-            'company': company,
-            'category': category,
-            'rating_flag': self._get_rating_flag(record),
-            'axel_rating': axel_rating,
-            'in_sum': in_sum,
-            'call_date': call_date,
-            'full_notes': notes,
-            'jelena_rating': jelena_rating,
-            'jelena_comments': jelena_lines,
-            'abstract_title': abstract_title,
-            'full_abstract': abstract,
-            'region': region,
-            'ir_engagement': ir_engagement,
-            'ir_rating': self.text_extractor.extract_ir_rating(ir_engagement)
-        }
+            SpeakerRecord: Detailed speaker information, extracted on access
+        """
+        return SpeakerRecord(record, category)
+
+
+class DataFrameSpeakerFilter(SpeakerFilter):
+    """
+    Column-wise variant of SpeakerFilter for pandas DataFrames.
+    
+    Tag matching, the don't-contact exclusion and the rating thresholds are
+    evaluated with vectorized string and numeric operations, and only the
+    matching rows are turned into speaker dictionaries. Results are identical
+    to SpeakerFilter.categorize(df.to_dict('records')).
+    """
+    
+    def categorize_frame(self, df, tag_index=None, progress=None):
+        """
+        Categorize a DataFrame into confirmed, intended and endorsed speakers.
+        
+        Args:
+            df: DataFrame with one speaker record per row
+            tag_index: Optional TagIndex built for df; tag lookups then use
+                the index instead of scanning the Workshops column
+            progress: Optional Progress to report categorized rows to
+            
+        Returns:
+            tuple: (confirmed, intended, endorsed) lists of speakers
+        """
+        if COLUMNS['workshops'] not in df.columns:
+            if progress is not None:
+                progress.advance('categorizing', len(df))
+            return [], [], []
+        
+        # Masks are combined and assigned by label, which needs a unique
+        # index (concatenated frames can repeat labels)
+        df = df.reset_index(drop=True)
+        
+        if tag_index is not None:
+            def contains(tag):
+                return pd.Series(
+                    tag_index.contains(tag, df[COLUMNS['workshops']]), index=df.index
+                )
+        else:
+            workshops = self._lower_text(df[COLUMNS['workshops']])
+            
+            def contains(tag):
+                return workshops.str.contains(tag, regex=False)
         
-        return speaker_info
+        confirmed_mask = contains(self._confirmed_tag)
+        intended_mask = (
+            contains(self._intended_tag)
+            & ~contains(self._not_reached_tag)
+            & ~contains(self._not_available_tag)
+        )
+        endorsed_mask = contains(self._endorsed_tag)
+        
+        # Only candidate rows go through the more expensive checks
+        candidates = df[intended_mask | endorsed_mask]
+        eligible = pd.Series(False, index=df.index)
+        if not candidates.empty:
+            eligible[candidates.index] = (
+                ~self._do_not_contact_mask(candidates)
+                & self._rating_mask(candidates)
+            )
+        
+        confirmed = [
+            self._build_confirmed_speaker_info(record)
+            for record in self._records(df, confirmed_mask)
+        ]
+        intended = self._build_detailed_speaker_infos(
+            self._records(df, intended_mask & eligible), 'Intended'
+        )
+        endorsed = self._build_detailed_speaker_infos(
+            self._records(df, endorsed_mask & eligible), 'Endorsed'
+        )
+        
+        if progress is not None:
+            progress.advance('categorizing', len(df))
+        
+        return confirmed, intended, endorsed
+    
+    @staticmethod
+    def _lower_text(series):
+        """
+        Vectorized equivalent of safe_str(value).lower().
+        
+        Args:
+            series: Column to normalize
+            
+        Returns:
+            pd.Series: Lowercased strings, empty for NaN/None
+        """
+        return series.astype(str).str.lower().where(series.notna(), '')
+    
+    def _do_not_contact_mask(self, df):
+        """
+        Vectorized equivalent of _is_do_not_contact.
+        
+        Args:
+            df: Candidate rows
+            
+        Returns:
+            pd.Series: True for rows marked DON'T CONTACT
+        """
+        if COLUMNS['activity_notes'] not in df.columns:
+            return pd.Series(False, index=df.index)
+        
+        activity = self._lower_text(df[COLUMNS['activity_notes']])
+        return (
+            activity.str.contains("don't contact", regex=False)
+            | activity.str.contains("do not contact", regex=False)
+        )
+    
+    def _rating_mask(self, df):
+        """
+        Vectorized equivalent of _passes_rating_filter.
+        
+        Args:
+            df: Candidate rows
+            
+        Returns:
+            pd.Series: True for rows that pass the rating filters
+        """
+        passes = pd.Series(False, index=df.index)
+        
+        if COLUMNS['axel_rating'] in df.columns:
+            axel_numeric = self._to_float(df[COLUMNS['axel_rating']])
+            passes |= axel_numeric >= AXEL_RATING_LOWER
+        
+        if COLUMNS['ir_speaking_engagement'] in df.columns:
+            ir_rating = self._ir_rating(df[COLUMNS['ir_speaking_engagement']])
+            passes |= ir_rating >= IR_RATING_THRESHOLD
+        
+        return passes
+    
+    @staticmethod
+    def _to_float(series):
+        """
+        Vectorized equivalent of float(value) with failures mapped to NaN.
+        
+        Args:
+            series: Column to convert
+            
+        Returns:
+            pd.Series: Float values
+        """
+        numeric = pd.to_numeric(series, errors='coerce').astype(float)
+        
+        # float() accepts a few spellings to_numeric rejects (e.g. padded
+        # strings); defer the leftovers to it so results stay identical
+        leftover = numeric.isna() & series.notna()
+        if leftover.any():
+            numeric[leftover] = series[leftover].map(_try_float)
+        
+        return numeric
+    
+    def _ir_rating(self, series):
+        """
+        Vectorized equivalent of TextExtractor.extract_ir_rating.
+        
+        Args:
+            series: IR speaking engagement column
+            
+        Returns:
+            pd.Series: Float ratings, NaN where none was found
+        """
+        ratings = self.text_extractor.extract_ir_rating_many(series)
+        return pd.Series(ratings, index=series.index, dtype=float)
+    
+    def _build_detailed_speaker_infos(self, records, category):
+        """
+        Batch version of _build_detailed_speaker_info.
+        
+        Args:
+            records: Speaker records
+            category: Category name
+            
+        Returns:
+            list: Detailed speaker information, one SpeakerRecord per record
+        """
+        return [SpeakerRecord(record, category) for record in records]
+    
+    @staticmethod
+    def _records(df, mask):
+        """
+        Convert only the masked rows to record dictionaries.
+        
+        Args:
+            df: Source DataFrame
+            mask: Boolean row mask
+            
+        Returns:
+            list: Record dictionaries for the selected rows
+        """
+        columns = [c for c in COLUMNS.values() if c in df.columns]
+        return df.loc[mask, columns].to_dict('records')
+
 
+def _try_float(value):
+    """
+    Convert a value with float(), returning NaN when it cannot be converted.
+    
+    Args:
+        value: Any value
+        
+    Returns:
+        float: Converted value or NaN
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float('nan')
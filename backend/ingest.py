@@ -0,0 +1,466 @@
+"""
+Ingestion helpers for uploaded speaker data files.
+"""
+import io
+import mmap
+from contextlib import contextmanager
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config import COLUMNS, CSV_CHUNK_ROWS
+from progress import Progress
+from request_encoding import RequestTooLargeError
+
+# Only the mapped columns are parsed; everything else in the export is skipped
+PROJECTED_COLUMNS = set(COLUMNS.values())
+
+# Low-cardinality columns stored as categoricals, long text as Arrow strings.
+# The Axel rating is left to type inference so its values are unchanged.
+COMPACT_DTYPES = {
+    COLUMNS['region']: 'category',
+    COLUMNS['company']: 'category',
+    COLUMNS['workshops']: 'string[pyarrow]',
+    COLUMNS['notes_speaker_calls']: 'string[pyarrow]',
+    COLUMNS['jelena_comments']: 'string[pyarrow]',
+    COLUMNS['abstract']: 'string[pyarrow]',
+    COLUMNS['ir_speaking_engagement']: 'string[pyarrow]',
+    COLUMNS['activity_notes']: 'string[pyarrow]',
+    COLUMNS['speaker_name']: 'string[pyarrow]'
+}
+
+# Rows parsed with default settings to estimate the unprojected footprint
+MEMORY_ESTIMATE_SAMPLE_ROWS = 1000
+
+# Accepted upload formats by file name suffix
+UPLOAD_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow'
+}
+
+# Compressed CSV uploads by file name suffix, decompressed while parsing
+UPLOAD_COMPRESSIONS = {
+    '.gz': 'gzip',
+    '.zst': 'zstd'
+}
+
+# Arrow string types read into pandas as Arrow-backed strings (zero-copy)
+ARROW_STRING_TYPES = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow')
+}
+
+
+def _is_projected(column):
+    """
+    Check if a column is one of the mapped columns.
+    
+    Args:
+        column: Column name from the CSV header
+        
+    Returns:
+        bool: True if the column should be parsed
+    """
+    return column in PROJECTED_COLUMNS
+
+
+def upload_compression(filename):
+    """
+    Get the compression of an upload from its file name.
+    
+    Args:
+        filename: Uploaded file name (e.g. "speakers.csv.gz")
+        
+    Returns:
+        str: 'gzip' or 'zstd', or None if not compressed
+    """
+    name = (filename or '').lower()
+    for suffix, compression in UPLOAD_COMPRESSIONS.items():
+        if name.endswith(suffix):
+            return compression
+    return None
+
+
+def upload_format(filename):
+    """
+    Get the upload format from a file name.
+    
+    A compression suffix is ignored, so "speakers.csv.gz" is a CSV file.
+    
+    Args:
+        filename: Uploaded file name
+        
+    Returns:
+        str: 'csv', 'parquet' or 'arrow', or None if not supported
+    """
+    name = (filename or '').lower()
+    for suffix in UPLOAD_COMPRESSIONS:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    
+    for suffix, fmt in UPLOAD_FORMATS.items():
+        if name.endswith(suffix):
+            return fmt
+    return None
+
+
+def open_csv_source(fileobj, compression=None, max_size=None):
+    """
+    Open an uploaded CSV file for the parser from its start.
+    
+    Compressed files are decompressed as the parser reads them, so the
+    decompressed text is never held in memory as a whole.
+    
+    Args:
+        fileobj: Readable, seekable binary file object
+        compression: 'gzip', 'zstd' or None
+        max_size: Optional limit on the decompressed size in bytes; reading
+            past it raises RequestTooLargeError
+            
+    Returns:
+        File object positioned at the start of the CSV text
+    """
+    fileobj.seek(0)
+    if compression is None:
+        return fileobj
+    source = pa.CompressedInputStream(pa.PythonFile(_KeepOpen(fileobj), mode='r'), compression)
+    if max_size is None:
+        return source
+    return _SizeLimited(source, max_size)
+
+
+class _KeepOpen(io.RawIOBase):
+    """Read-only view of a file that leaves the file open when closed."""
+    
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        data = self._fileobj.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class _SizeLimited(io.RawIOBase):
+    """Read-only view of a stream that fails once too many bytes are read."""
+    
+    def __init__(self, source, max_size):
+        self._source = source
+        self._max_size = max_size
+        self._read = 0
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        data = self._source.read(len(buffer))
+        self._read += len(data)
+        if self._read > self._max_size:
+            # Checked as data arrives, so a decompression bomb is stopped
+            # after at most one read past the limit
+            raise RequestTooLargeError(
+                f"Decompressed upload exceeds {self._max_size} bytes"
+            )
+        buffer[:len(data)] = data
+        return len(data)
+    
+    def close(self):
+        self._source.close()
+        super().close()
+
+
+def read_speaker_csv(fileobj, compression=None, progress=None, max_size=None):
+    """
+    Parse a CSV file reading only the mapped columns with compact dtypes.
+    
+    Args:
+        fileobj: Readable, seekable binary file object
+        compression: 'gzip', 'zstd' or None
+        progress: Optional Progress to report parsed rows to
+        max_size: Optional limit on the decompressed size of a compressed
+            file in bytes
+            
+    Returns:
+        tuple: (DataFrame, stats) where stats holds the full header, the
+            loaded columns and the memory used and saved by projection
+    """
+    progress = progress or Progress()
+    progress.start('parsing')
+    
+    sample = pd.read_csv(
+        open_csv_source(fileobj, compression, max_size), nrows=MEMORY_ESTIMATE_SAMPLE_ROWS
+    )
+    
+    df = pd.read_csv(
+        open_csv_source(fileobj, compression, max_size), usecols=_is_projected, dtype=COMPACT_DTYPES
+    )
+    progress.advance('parsing', len(df))
+    
+    memory_bytes = int(df.memory_usage(deep=True).sum())
+    default_memory_bytes = memory_bytes
+    if len(sample):
+        bytes_per_row = sample.memory_usage(deep=True).sum() / len(sample)
+        default_memory_bytes = int(bytes_per_row * len(df))
+    
+    stats = {
+        'columns': sample.columns.tolist(),
+        'loaded_columns': df.columns.tolist(),
+        'memory_bytes': memory_bytes,
+        'memory_saved_bytes': max(default_memory_bytes - memory_bytes, 0)
+    }
+    
+    return df, stats
+
+
+def read_speaker_table(fileobj, fmt, progress=None):
+    """
+    Read a Parquet or Arrow IPC file, loading only the mapped columns.
+    
+    Args:
+        fileobj: Readable, seekable binary file object
+        fmt: 'parquet' or 'arrow'
+        progress: Optional Progress to report parsed rows to
+        
+    Returns:
+        tuple: (DataFrame, stats) with the same stats as read_speaker_csv;
+            memory_saved_bytes is the size of the skipped columns (for
+            Arrow IPC, the file size not taken up by the loaded columns)
+    """
+    progress = progress or Progress()
+    progress.start('parsing')
+    
+    with open_columnar_source(fileobj) as source:
+        if fmt == 'parquet':
+            parquet_file = pq.ParquetFile(source)
+            columns = parquet_file.schema_arrow.names
+            loaded_columns = [c for c in columns if _is_projected(c)]
+            table = parquet_file.read(columns=loaded_columns)
+            
+            metadata = parquet_file.metadata
+            skipped_bytes = sum(
+                metadata.row_group(i).column(j).total_uncompressed_size
+                for i in range(metadata.num_row_groups)
+                for j in range(metadata.num_columns)
+                if not _is_projected(metadata.row_group(i).column(j).path_in_schema.split('.')[0])
+            )
+        else:
+            columns, schema, batches = _read_ipc(source)
+            loaded_columns = schema.names
+            table = pa.Table.from_batches(list(batches), schema=schema)
+            skipped_bytes = max(source.size() - table.nbytes, 0)
+    
+    df = _table_to_frame(table)
+    progress.advance('parsing', len(df))
+    
+    stats = {
+        'columns': columns,
+        'loaded_columns': df.columns.tolist(),
+        'memory_bytes': int(df.memory_usage(deep=True).sum()),
+        'memory_saved_bytes': int(skipped_bytes)
+    }
+    
+    return df, stats
+
+
+@contextmanager
+def open_columnar_source(fileobj):
+    """
+    Open an uploaded file for Arrow readers.
+    
+    Files with a descriptor are memory-mapped and read through the map, so
+    readers only touch the pages of the columns they load. Uploads
+    Starlette still holds in memory (under its 1MB spool size) are written
+    to disk by fileno() first. Objects without a descriptor, and empty
+    files, are read as they are. Readers copy what they load out of the
+    map, and the map is closed when the block exits.
+    
+    Args:
+        fileobj: Readable, seekable binary file object
+        
+    Yields:
+        pa.PythonFile: Random-access reader over the file contents
+    """
+    fileobj.seek(0)
+    
+    try:
+        mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        mapped = None
+    
+    try:
+        yield pa.PythonFile(fileobj if mapped is None else mapped, mode='r')
+    finally:
+        if mapped is not None:
+            mapped.close()
+
+
+def _read_ipc(source):
+    """
+    Read the mapped columns of an Arrow IPC file, batch by batch.
+    
+    In the file format only the buffers of the mapped columns are read;
+    the stream format has to be read through, but only the mapped columns
+    are decoded and kept.
+    
+    Args:
+        source: Reader from open_columnar_source()
+        
+    Returns:
+        tuple: (column names of the file, schema of the loaded columns,
+            iterator of record batches with only those columns)
+    """
+    try:
+        open_reader = pa.ipc.open_file
+        columns = open_reader(source).schema.names
+    except pa.ArrowInvalid:
+        open_reader = pa.ipc.open_stream
+        source.seek(0)
+        columns = open_reader(source).schema.names
+    
+    loaded = [i for i, c in enumerate(columns) if _is_projected(c)]
+    loaded_columns = [columns[i] for i in loaded]
+    
+    source.seek(0)
+    # An empty included_fields would read every column
+    options = pa.ipc.IpcReadOptions(included_fields=loaded or None)
+    reader = open_reader(source, options=options)
+    
+    if open_reader is pa.ipc.open_file:
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        batches = iter(reader)
+    
+    schema = pa.schema(
+        [reader.schema.field(c) for c in loaded_columns], metadata=reader.schema.metadata
+    )
+    return columns, schema, (batch.select(loaded_columns) for batch in batches)
+
+
+def _table_to_frame(table):
+    """
+    Convert an Arrow table to a DataFrame with the compact dtypes.
+    
+    Args:
+        table: Arrow table with the mapped columns
+        
+    Returns:
+        DataFrame: Speaker data
+    """
+    df = table.to_pandas(types_mapper=ARROW_STRING_TYPES.get)
+    
+    for column, dtype in COMPACT_DTYPES.items():
+        if dtype == 'category' and column in df.columns and pd.api.types.is_string_dtype(df[column]):
+            df[column] = df[column].astype('category')
+    
+    return df
+
+
+def iter_csv_chunks(fileobj, chunksize=CSV_CHUNK_ROWS, compression=None, max_size=None):
+    """
+    Read a CSV file in chunks of rows.
+    
+    Only the mapped columns are parsed, and every one is read as text so
+    all chunks have the same dtypes regardless of which values each one
+    happens to contain.
+    
+    Args:
+        fileobj: Readable binary file object positioned anywhere
+        chunksize: Number of rows per chunk
+        compression: 'gzip', 'zstd' or None
+        max_size: Optional limit on the decompressed size of a compressed
+            file in bytes
+            
+    Yields:
+        DataFrame: Next chunk of rows
+    """
+    source = open_csv_source(fileobj, compression, max_size)
+    with pd.read_csv(source, chunksize=chunksize, usecols=_is_projected, dtype=str) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def iter_table_chunks(fileobj, fmt, chunksize=CSV_CHUNK_ROWS):
+    """
+    Read a Parquet or Arrow IPC file in chunks of rows.
+    
+    Only the mapped columns are read, batch by batch; Arrow IPC batches
+    larger than chunksize are sliced.
+    
+    Args:
+        fileobj: Readable, seekable binary file object
+        fmt: 'parquet' or 'arrow'
+        chunksize: Number of rows per chunk
+        
+    Yields:
+        DataFrame: Next chunk of rows
+    """
+    with open_columnar_source(fileobj) as source:
+        if fmt == 'parquet':
+            parquet_file = pq.ParquetFile(source)
+            loaded_columns = [c for c in parquet_file.schema_arrow.names if _is_projected(c)]
+            batches = parquet_file.iter_batches(batch_size=chunksize, columns=loaded_columns)
+        else:
+            _, _, ipc_batches = _read_ipc(source)
+            batches = (
+                batch.slice(offset, chunksize)
+                for batch in ipc_batches
+                for offset in range(0, batch.num_rows, chunksize)
+            )
+        
+        for batch in batches:
+            yield _table_to_frame(pa.Table.from_batches([batch]))
+
+
+def categorize_csv_stream(fileobj, speaker_filter, chunksize=CSV_CHUNK_ROWS, fmt='csv',
+                          compression=None, progress=None, max_size=None):
+    """
+    Categorize an uploaded file chunk by chunk, keeping only matched speakers.
+    
+    Peak memory is bounded by the chunk size plus the matched speakers,
+    independent of the file size. Parsed and categorized rows are reported
+    after every chunk.
+    
+    Args:
+        fileobj: Readable binary file object
+        speaker_filter: DataFrameSpeakerFilter for the event
+        chunksize: Number of rows per chunk
+        fmt: Upload format ('csv', 'parquet' or 'arrow')
+        compression: 'gzip', 'zstd' or None, for CSV files
+        progress: Optional Progress to report parsed and categorized rows to
+        max_size: Optional limit on the decompressed size of a compressed
+            CSV file in bytes
+            
+    Returns:
+        tuple: (confirmed, intended, endorsed, row_count)
+    """
+    progress = progress or Progress()
+    progress.start('parsing')
+    progress.start('categorizing')
+    
+    confirmed = []
+    intended = []
+    endorsed = []
+    row_count = 0
+    
+    if fmt == 'csv':
+        chunks = iter_csv_chunks(fileobj, chunksize, compression, max_size)
+    else:
+        chunks = iter_table_chunks(fileobj, fmt, chunksize)
+    
+    for chunk in chunks:
+        row_count += len(chunk)
+        progress.advance('parsing', len(chunk))
+        chunk_confirmed, chunk_intended, chunk_endorsed = speaker_filter.categorize_frame(
+            chunk, progress=progress
+        )
+        confirmed.extend(chunk_confirmed)
+        intended.extend(chunk_intended)
+        endorsed.extend(chunk_endorsed)
+    
+    return confirmed, intended, endorsed, row_count
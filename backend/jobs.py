@@ -0,0 +1,221 @@
+"""
+Background jobs for long-running filter and export runs.
+
+A job is submitted against a stored dataset and runs in its own small
+worker pool, so the request returns at once with a job ID instead of
+holding the connection open until the platform's request timeout.
+Clients poll the job for its status and stage progress and download the
+result when it is done. Finished jobs are kept for a configurable TTL.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from progress import Progress
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is full."""
+
+
+class Job:
+    """One submitted run, its progress and its outcome."""
+
+    def __init__(self, kind, params):
+        """
+        Initialize a queued job.
+
+        Args:
+            kind: 'filter' or 'export'
+            params: Request parameters reported back with the status
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = 'queued'
+        self.progress = Progress()
+        self.result = None
+        self.error = None
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self.expires_at = None
+
+    @property
+    def finished(self):
+        """True once the job has completed or failed."""
+        return self.status in ('completed', 'failed')
+
+    def to_dict(self):
+        """
+        Describe the job for the status endpoint.
+
+        Returns:
+            dict: ID, status, timestamps, progress and error
+        """
+        return {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            **self.params,
+            'progress': self.progress.snapshot(),
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class JobManager:
+    """Runs jobs in a thread pool with a bounded queue and result TTL."""
+
+    def __init__(self, max_workers, max_queued, result_ttl):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_workers: Jobs running at the same time
+            max_queued: Jobs waiting for a worker before submit() refuses more
+            result_ttl: Seconds a finished job and its result are kept
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self._jobs = OrderedDict()
+        self._futures = {}
+        self._pending = 0
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def submit(self, kind, params, run):
+        """
+        Queue a job.
+
+        Args:
+            kind: 'filter' or 'export'
+            params: Request parameters reported back with the status
+            run: Callable taking the Job and returning its result; it
+                reports stage progress to job.progress
+
+        Returns:
+            Job: The queued job
+        """
+        job = Job(kind, params)
+
+        with self._lock:
+            self._purge_expired()
+
+            if self._pending >= self.max_workers + self.max_queued:
+                raise JobQueueFullError(
+                    f"Job queue is full ({self.max_queued} waiting). Try again later."
+                )
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='job'
+                )
+
+            self._pending += 1
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._pool.submit(self._run, job, run)
+
+        return job
+
+    def get(self, job_id):
+        """
+        Get a job that has not expired.
+
+        Args:
+            job_id: Job ID returned by submit()
+
+        Returns:
+            Job: The job, or None if unknown or expired
+        """
+        with self._lock:
+            self._purge_expired()
+            return self._jobs.get(job_id)
+
+    def remove(self, job_id):
+        """
+        Forget a job, cancelling it if it has not started.
+
+        A running job cannot be interrupted; it finishes in the background
+        and its result is discarded.
+
+        Args:
+            job_id: Job ID returned by submit()
+
+        Returns:
+            bool: True if the job was known
+        """
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            future = self._futures.pop(job_id, None)
+            if job is None:
+                return False
+            if future is not None and future.cancel():
+                self._pending -= 1
+                job.progress.finish('cancelled')
+            return True
+
+    def stats(self):
+        """
+        Get job counts.
+
+        Returns:
+            dict: Jobs by status and queue limits
+        """
+        with self._lock:
+            self._purge_expired()
+            counts = {status: 0 for status in ('queued', 'running', 'completed', 'failed')}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return {
+                **counts,
+                'max_workers': self.max_workers,
+                'max_queued': self.max_queued,
+                'result_ttl_seconds': self.result_ttl
+            }
+
+    def shutdown(self):
+        """Cancel queued jobs and stop the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job, run):
+        """
+        Run one job in a worker thread and record its outcome.
+
+        Args:
+            job: Job to run
+            run: Callable taking the Job and returning its result
+        """
+        job.status = 'running'
+        job.started_at = datetime.now()
+
+        try:
+            job.result = run(job)
+            job.status = 'completed'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished_at = datetime.now()
+            job.progress.finish(job.error)
+            with self._lock:
+                job.expires_at = time.monotonic() + self.result_ttl
+                self._futures.pop(job.id, None)
+                self._pending -= 1
+
+    def _purge_expired(self):
+        """Drop finished jobs past their TTL. Caller holds the lock."""
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.expires_at is not None and job.expires_at <= now
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
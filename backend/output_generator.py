@@ -2,25 +2,36 @@
 Output generation for speaker filtering results.
 """
 import csv
-import json
+import io
+import itertools
 from datetime import datetime
-from text_extractor import TextExtractor
+from filters import SpeakerRecord
+from serialization import dumps
+from text_extractor import EventKeywordMatcher, TextExtractor
+
+CSV_HEADER = ['Category', 'Speaker Name', 'Company', 'Rating Flag', 
+              'Axel Rating', 'IR Rating', 'Analysis', 'Call Date', 
+              'In Sum', 'Jelena Rating', 'Jelena Comments', 
+              'Abstract Title', 'Region', 'IR Engagement Full']
 
 
 class OutputGenerator:
     """Generates output in various formats."""
     
-    def __init__(self, event_name, event_title=""):
+    def __init__(self, event_name, event_title="", progress=None):
         """
         Initialize output generator.
         
         Args:
             event_name: Name of the event
             event_title: Full title of the event
+            progress: Optional Progress to report enriched speakers to
         """
         self.event_name = event_name
         self.event_title = event_title
+        self.progress = progress
         self.text_extractor = TextExtractor()
+        self.keyword_matcher = EventKeywordMatcher(event_title)
     
     def generate_csv(self, confirmed, intended, endorsed, output_file):
         """
@@ -34,73 +45,84 @@ class OutputGenerator:
         """
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
+            writer.writerows(self.iter_csv_rows(confirmed, intended, endorsed))
+        
+        print(f"CSV file generated: {output_file}")
+    
+    def iter_csv_rows(self, confirmed, intended, endorsed):
+        """
+        Yield CSV rows, header first, one speaker at a time.
+        
+        Args:
+            confirmed: List of confirmed speakers
+            intended: List of intended speakers
+            endorsed: List of endorsed speakers
             
-            # Write header
-            writer.writerow(['Category', 'Speaker Name', 'Company', 'Rating Flag', 
-                           'Axel Rating', 'IR Rating', 'Analysis', 'Call Date', 
-                           'In Sum', 'Jelena Rating', 'Jelena Comments', 
-                           'Abstract Title', 'Region', 'IR Engagement Full'])
-            
-            # Write confirmed speakers
-            for speaker in confirmed:
-                writer.writerow([
-                    speaker['category'],
-                    speaker['speaker_name'],
-                    speaker.get('company', ''),
-                    '',  # No rating flag for confirmed
-                    '',  # No detailed info for confirmed
-                    '',
-                    '',
-                    '',
-                    '',
-                    '',
-                    '',
-                    '',
-                    '',
-                    ''
-                ])
-            
-            # Write intended speakers
-            for speaker in intended:
-                analysis = self._generate_analysis_text(speaker)
-                writer.writerow([
-                    speaker['category'],
-                    speaker['speaker_name'],
-                    speaker.get('company', ''),
-                    speaker.get('rating_flag', ''),
-                    speaker.get('axel_rating', ''),
-                    speaker.get('ir_rating', ''),
-                    analysis,
-                    speaker.get('call_date', ''),
-                    speaker.get('in_sum', ''),
-                    speaker.get('jelena_rating', ''),
-                    speaker.get('jelena_comments', ''),
-                    speaker.get('abstract_title', ''),
-                    speaker.get('region', ''),
-                    speaker.get('ir_engagement', '')
-                ])
+        Yields:
+            list: Row values
+        """
+        yield CSV_HEADER
+        
+        # Confirmed speakers
+        for speaker in confirmed:
+            yield [
+                speaker['category'],
+                speaker['speaker_name'],
+                speaker.get('company', ''),
+                '',  # No rating flag for confirmed
+                '',  # No detailed info for confirmed
+                '',
+                '',
+                '',
+                '',
+                '',
+                '',
+                '',
+                '',
+                ''
+            ]
+        
+        # Intended and endorsed speakers
+        for speaker in itertools.chain(intended, endorsed):
+            analysis = self._generate_analysis_text(speaker)
+            yield [
+                speaker['category'],
+                speaker['speaker_name'],
+                speaker.get('company', ''),
+                speaker.get('rating_flag', ''),
+                speaker.get('axel_rating', ''),
+                speaker.get('ir_rating', ''),
+                analysis,
+                speaker.get('call_date', ''),
+                speaker.get('in_sum', ''),
+                speaker.get('jelena_rating', ''),
+                speaker.get('jelena_comments', ''),
+                speaker.get('abstract_title', ''),
+                speaker.get('region', ''),
+                speaker.get('ir_engagement', '')
+            ]
+    
+    def iter_csv_lines(self, confirmed, intended, endorsed):
+        """
+        Yield the CSV report as formatted lines, without writing a file.
+        
+        Args:
+            confirmed: List of confirmed speakers
+            intended: List of intended speakers
+            endorsed: List of endorsed speakers
             
-            # Write endorsed speakers
-            for speaker in endorsed:
-                analysis = self._generate_analysis_text(speaker)
-                writer.writerow([
-                    speaker['category'],
-                    speaker['speaker_name'],
-                    speaker.get('company', ''),
-                    speaker.get('rating_flag', ''),
-                    speaker.get('axel_rating', ''),
-                    speaker.get('ir_rating', ''),
-                    analysis,
-                    speaker.get('call_date', ''),
-                    speaker.get('in_sum', ''),
-                    speaker.get('jelena_rating', ''),
-                    speaker.get('jelena_comments', ''),
-                    speaker.get('abstract_title', ''),
-                    speaker.get('region', ''),
-                    speaker.get('ir_engagement', '')
-                ])
+        Yields:
+            str: One CSV-formatted row
+        """
+        buffer = io.StringIO()
+        # Same line endings the API served when it read the report file back
+        writer = csv.writer(buffer, lineterminator='\n')
         
-        print(f"CSV file generated: {output_file}")
+        for row in self.iter_csv_rows(confirmed, intended, endorsed):
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
     
     def generate_json(self, confirmed, intended, endorsed, output_file):
         """
@@ -126,8 +148,9 @@ class OutputGenerator:
             'endorsed_speakers': [self._enhance_speaker_data(s) for s in endorsed]
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # dumps turns SpeakerRecords into plain objects
+        with open(output_file, 'wb') as f:
+            f.write(dumps(output_data, compact=False))
         
         print(f"JSON file generated: {output_file}")
     
@@ -142,53 +165,69 @@ class OutputGenerator:
             output_file: Path to output text file
         """
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("SPEAKER PROSPECT FILTERING REPORT\n")
-            f.write(f"Event: {self.event_name}\n")
-            if self.event_title:
-                f.write(f"Title: {self.event_title}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("="*80 + "\n\n")
-            
-            # Confirmed Speakers
-            f.write("### CONFIRMED SPEAKERS ###\n")
-            f.write("Count: {}\n\n".format(len(confirmed)))
-            
-            if confirmed:
-                for i, speaker in enumerate(confirmed, 1):
-                    f.write(f"{i}. {speaker['speaker_name']}")
-                    if speaker.get('company'):
-                        f.write(f" - {speaker['company']}")
-                    f.write(f"\n   Tag: {speaker.get('tag', '')}\n\n")
-            else:
-                f.write("No confirmed speakers found.\n\n")
-            
-            f.write("\n" + "="*80 + "\n\n")
-            
-            # Intended Speakers
-            f.write("### INTENDED SPEAKERS ###\n")
-            f.write("Count: {}\n\n".format(len(intended)))
-            
-            if intended:
-                for i, speaker in enumerate(intended, 1):
-                    f.write(self._format_detailed_speaker(speaker, i))
-            else:
-                f.write("No intended speakers found.\n\n")
-            
-            f.write("\n" + "="*80 + "\n\n")
-            
-            # Endorsed Speakers
-            f.write("### ENDORSED SPEAKERS ###\n")
-            f.write(f"Count: {len(endorsed)}\n\n")
-            
-            if endorsed:
-                for i, speaker in enumerate(endorsed, 1):
-                    f.write(self._format_detailed_speaker(speaker, i))
-            else:
-                f.write("No endorsed speakers found.\n\n")
+            f.writelines(self.iter_text_sections(confirmed, intended, endorsed))
         
         print(f"Text file generated: {output_file}")
     
+    def iter_text_sections(self, confirmed, intended, endorsed):
+        """
+        Yield the human-readable report section by section.
+        
+        Args:
+            confirmed: List of confirmed speakers
+            intended: List of intended speakers
+            endorsed: List of endorsed speakers
+            
+        Yields:
+            str: Next piece of the report (header, speaker entry or divider)
+        """
+        header = "="*80 + "\n"
+        header += "SPEAKER PROSPECT FILTERING REPORT\n"
+        header += f"Event: {self.event_name}\n"
+        if self.event_title:
+            header += f"Title: {self.event_title}\n"
+        header += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        header += "="*80 + "\n\n"
+        yield header
+        
+        # Confirmed Speakers
+        yield "### CONFIRMED SPEAKERS ###\n"
+        yield "Count: {}\n\n".format(len(confirmed))
+        
+        if confirmed:
+            for i, speaker in enumerate(confirmed, 1):
+                entry = f"{i}. {speaker['speaker_name']}"
+                if speaker.get('company'):
+                    entry += f" - {speaker['company']}"
+                entry += f"\n   Tag: {speaker.get('tag', '')}\n\n"
+                yield entry
+        else:
+            yield "No confirmed speakers found.\n\n"
+        
+        yield "\n" + "="*80 + "\n\n"
+        
+        # Intended Speakers
+        yield "### INTENDED SPEAKERS ###\n"
+        yield "Count: {}\n\n".format(len(intended))
+        
+        if intended:
+            for i, speaker in enumerate(intended, 1):
+                yield self._format_detailed_speaker(speaker, i)
+        else:
+            yield "No intended speakers found.\n\n"
+        
+        yield "\n" + "="*80 + "\n\n"
+        
+        # Endorsed Speakers
+        yield "### ENDORSED SPEAKERS ###\n"
+        yield f"Count: {len(endorsed)}\n\n"
+        
+        if endorsed:
+            for i, speaker in enumerate(endorsed, 1):
+                yield self._format_detailed_speaker(speaker, i)
+        else:
+            yield "No endorsed speakers found.\n\n"
+    
     def _format_detailed_speaker(self, speaker, index):
         """
         Format detailed speaker information for text output.
@@ -232,9 +271,8 @@ class OutputGenerator:
             output += f"\n   Abstract Title: {speaker['abstract_title']}\n"
         
         # Content fit analysis
-        analysis = self.text_extractor.generate_content_fit_analysis(
-            speaker.get('full_abstract', ''), 
-            self.event_title
+        analysis = self.keyword_matcher.content_fit_analysis(
+            speaker.get('full_abstract', '')
         )
         output += f"\n   Content Fit Analysis:\n   {analysis}\n"
         
@@ -260,11 +298,12 @@ class OutputGenerator:
         Returns:
             str: Analysis text
         """
-        return self.text_extractor.generate_content_fit_analysis(
-            speaker.get('full_abstract', ''),
-            self.event_title,
-            max_words=50
+        analysis = self.keyword_matcher.content_fit_analysis(
+            speaker.get('full_abstract', '')
         )
+        if self.progress is not None:
+            self.progress.advance('enriching')
+        return analysis
     
     def _enhance_speaker_data(self, speaker):
         """
@@ -276,7 +315,11 @@ class OutputGenerator:
         Returns:
             dict: Enhanced speaker data
         """
+        analysis = self._generate_analysis_text(speaker)
+        if isinstance(speaker, SpeakerRecord):
+            return speaker.with_analysis(analysis)
+        
         enhanced = speaker.copy()
-        enhanced['content_fit_analysis'] = self._generate_analysis_text(speaker)
+        enhanced['content_fit_analysis'] = analysis
         return enhanced
 
@@ -0,0 +1,149 @@
+"""
+Cursor pagination over stored filter results.
+
+A large event's filter response can be tens of MB. Instead of sending it
+at once, the response is stored as a result set and each category is read
+page by page. Result sets never change once stored, so a cursor (an
+opaque, encoded offset) always points at the same position.
+"""
+import base64
+import hashlib
+import json
+from pipeline import project_speakers
+
+# Speaker categories and the filter response lists they page through
+CATEGORIES = {
+    'confirmed': 'confirmed_speakers',
+    'intended': 'intended_speakers',
+    'endorsed': 'endorsed_speakers'
+}
+
+
+def result_set_id(cache_key):
+    """
+    Derive a result set ID from its result cache key.
+
+    The same dataset content, event and filter settings always give the
+    same ID, so cursors stay valid if the result set is rebuilt.
+
+    Args:
+        cache_key: Key from result_cache.result_key()
+
+    Returns:
+        str: Result set ID
+    """
+    return hashlib.blake2b(repr(cache_key).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def encode_cursor(category, offset):
+    """
+    Encode a position in a category as an opaque cursor.
+
+    Args:
+        category: Speaker category
+        offset: Index of the next speaker to return
+
+    Returns:
+        str: URL-safe cursor
+    """
+    raw = json.dumps({'c': category, 'o': offset}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, category):
+    """
+    Decode a cursor returned by a previous page.
+
+    Args:
+        cursor: Cursor from next_cursor
+        category: Category being paged through
+
+    Returns:
+        int: Index of the next speaker to return
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        offset = data['o']
+        valid = data['c'] == category and isinstance(offset, int) and offset >= 0
+    except (ValueError, TypeError, KeyError):
+        valid = False
+
+    if not valid:
+        raise ValueError("Invalid cursor")
+    return offset
+
+
+def paginate(result, category, cursor=None, limit=50, selection=None):
+    """
+    Get one page of a category from a stored filter response.
+
+    Args:
+        result: Filter response from build_filter_response()
+        category: 'confirmed', 'intended' or 'endorsed'
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Speakers per page
+        selection: Speaker fields from select_fields(), or None for all
+
+    Returns:
+        dict: Speakers of the page, the total count and the cursor of the
+            next page (None on the last page)
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f"Unknown category: {category}. Must be confirmed, intended or endorsed")
+
+    speakers = result[CATEGORIES[category]]
+    offset = decode_cursor(cursor, category) if cursor else 0
+    end = offset + limit
+
+    return {
+        'category': category,
+        'total_count': len(speakers),
+        'limit': limit,
+        'offset': offset,
+        'speakers': project_speakers(speakers[offset:end], selection),
+        'next_cursor': encode_cursor(category, end) if end < len(speakers) else None
+    }
+
+
+def first_pages(result, limit=50, selection=None):
+    """
+    Summarize a stored filter response with the first page of each category.
+
+    Args:
+        result: Filter response from build_filter_response()
+        limit: Speakers per page
+        selection: Speaker fields from select_fields(), or None for all
+
+    Returns:
+        dict: Event, summary and {category: first page}
+    """
+    return {
+        'event_name': result['event_name'],
+        'event_title': result['event_title'],
+        'generated_at': result['generated_at'],
+        'summary': result['summary'],
+        'pages': {
+            category: paginate(result, category, None, limit, selection)
+            for category in CATEGORIES
+        }
+    }
+
+
+def speaker_detail(result, category, position):
+    """
+    Get every field of one speaker of a stored filter response.
+
+    Args:
+        result: Filter response from build_filter_response()
+        category: 'confirmed', 'intended' or 'endorsed'
+        position: Index of the speaker in its category (a page's offset
+            plus the speaker's index in the page)
+
+    Returns:
+        dict: The speaker, or None if position is out of range
+    """
+    speakers = result[CATEGORIES[category]]
+    if not 0 <= position < len(speakers):
+        return None
+    return speakers[position]
@@ -0,0 +1,535 @@
+"""
+Parse, filter and render steps behind the API endpoints.
+
+These functions are CPU-bound and free of any FastAPI dependency, so the
+API can run them in a worker pool instead of on the event loop. Arguments
+and return values are picklable (bytes, DataFrames, TagIndex, speaker
+lists) so they also work with a process pool, where they are copied to and
+from the worker on every call.
+"""
+import io
+from datetime import datetime
+from columnar_export import iter_columnar_export
+from filters import DataFrameSpeakerFilter, SpeakerRecord
+from ingest import categorize_csv_stream, read_speaker_csv, read_speaker_table
+from output_generator import OutputGenerator
+from progress import Progress
+from serialization import dumps
+from tag_index import TagIndex
+
+EXPORT_MEDIA_TYPES = {
+    'csv': ('text/csv', 'csv'),
+    'json': ('application/json', 'json'),
+    'text': ('text/plain', 'txt'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.file', 'arrow')
+}
+
+# Formats rendered incrementally by iter_export
+STREAMED_FORMATS = ('csv', 'text', 'parquet', 'arrow')
+
+# Approximate size of each chunk sent for streamed exports
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Fields of confirmed and detailed speakers (see SpeakerFilter) and the
+# enrichment added to detailed speakers
+SPEAKER_FIELDS = (
+    'speaker_name', 'tag', 'company', 'category', 'rating_flag', 'axel_rating',
+    'in_sum', 'call_date', 'full_notes', 'jelena_rating', 'jelena_comments',
+    'abstract_title', 'full_abstract', 'region', 'ir_engagement', 'ir_rating',
+    'content_fit_analysis'
+)
+
+# Long free-text fields, often many KB each; left out of the summary view
+FULL_TEXT_FIELDS = ('full_notes', 'full_abstract')
+
+SPEAKER_VIEWS = ('summary', 'full')
+
+
+class NoRecordsError(LookupError):
+    """Raised when an uploaded file contains no speaker records."""
+
+
+def select_fields(view='full', fields=None):
+    """
+    Resolve the speaker fields a client asked for.
+
+    Args:
+        view: 'full' for every field, 'summary' for all but FULL_TEXT_FIELDS
+        fields: Optional comma-separated field names; overrides view
+
+    Returns:
+        frozenset: Fields to keep, or None to keep all
+    """
+    if fields:
+        names = frozenset(name.strip() for name in fields.split(',') if name.strip())
+        unknown = sorted(names.difference(SPEAKER_FIELDS))
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(unknown)}. Must be among {', '.join(SPEAKER_FIELDS)}"
+            )
+        return names
+
+    if view not in SPEAKER_VIEWS:
+        raise ValueError(f"Invalid view: {view}. Must be summary or full")
+    if view == 'full':
+        return None
+    return frozenset(name for name in SPEAKER_FIELDS if name not in FULL_TEXT_FIELDS)
+
+
+def project_speakers(speakers, selection):
+    """
+    Keep only the selected fields of each speaker.
+
+    Args:
+        speakers: List of speaker dictionaries
+        selection: Fields from select_fields(), or None to keep all
+
+    Returns:
+        list: Speakers with only the selected fields
+    """
+    if selection is None:
+        return speakers
+    # Only the selected fields of a SpeakerRecord are ever extracted
+    return [
+        speaker.select(selection) if isinstance(speaker, SpeakerRecord)
+        else {name: value for name, value in speaker.items() if name in selection}
+        for speaker in speakers
+    ]
+
+
+def parse_csv_bytes(contents, progress=None):
+    """
+    Parse an uploaded CSV file.
+
+    Args:
+        contents: Raw CSV bytes
+        progress: Optional Progress to report stage counts to
+
+    Returns:
+        tuple: (DataFrame, stats) as returned by read_speaker_csv
+    """
+    return read_speaker_csv(io.BytesIO(contents), progress=progress)
+
+
+def parse_upload_file(fileobj, fmt, compression=None, progress=None, max_size=None):
+    """
+    Parse an uploaded file in any supported format.
+
+    Parquet and Arrow IPC files spilled to disk are memory-mapped, and
+    compressed CSV files are decompressed from the spooled upload, so this
+    must run in the process that holds the file (i.e. in a thread).
+
+    Args:
+        fileobj: Readable, seekable binary file object
+        fmt: Upload format ('csv', 'parquet' or 'arrow')
+        compression: 'gzip', 'zstd' or None, for CSV files
+        progress: Optional Progress to report stage counts to
+        max_size: Optional limit on the decompressed size of a compressed
+            CSV file in bytes
+
+    Returns:
+        tuple: (DataFrame, stats) as returned by read_speaker_csv
+    """
+    if fmt == 'csv':
+        return read_speaker_csv(fileobj, compression, progress, max_size)
+    return read_speaker_table(fileobj, fmt, progress)
+
+
+def filter_upload_file(fileobj, fmt, event_name, event_title, compression=None,
+                       progress=None, selection=None, max_size=None):
+    """
+    Parse and filter an uploaded file in any supported format.
+
+    Args:
+        fileobj: Readable, seekable binary file object
+        fmt: Upload format ('csv', 'parquet' or 'arrow')
+        event_name: Name of the event
+        event_title: Optional event title for content analysis
+        compression: 'gzip', 'zstd' or None, for CSV files
+        progress: Optional Progress to report stage counts to
+        selection: Speaker fields from select_fields(), or None for all
+        max_size: Optional limit on the decompressed size of a compressed
+            CSV file in bytes
+
+    Returns:
+        dict: Filter response with categorized speakers
+    """
+    df, _ = parse_upload_file(fileobj, fmt, compression, progress, max_size)
+    return filter_frame(df, event_name, event_title, progress=progress, selection=selection)
+
+
+def categorize_upload_file(fileobj, fmt, event_name, compression=None, progress=None,
+                           max_size=None):
+    """
+    Parse and categorize an uploaded file in any supported format.
+
+    Args:
+        fileobj: Readable, seekable binary file object
+        fmt: Upload format ('csv', 'parquet' or 'arrow')
+        event_name: Name of the event
+        compression: 'gzip', 'zstd' or None, for CSV files
+        progress: Optional Progress to report stage counts to
+        max_size: Optional limit on the decompressed size of a compressed
+            CSV file in bytes
+
+    Returns:
+        tuple: (confirmed, intended, endorsed) lists of speakers
+    """
+    df, _ = parse_upload_file(fileobj, fmt, compression, progress, max_size)
+    return categorize_frame(df, event_name, progress=progress)
+
+
+def filter_frame(df, event_name, event_title, tag_index=None, progress=None,
+                 selection=None):
+    """
+    Filter a parsed dataset and build the filter response.
+
+    Args:
+        df: DataFrame with speaker data
+        event_name: Name of the event
+        event_title: Optional event title for content analysis
+        tag_index: Optional TagIndex built for df
+        progress: Optional Progress to report stage counts to
+        selection: Speaker fields from select_fields(), or None for all
+
+    Returns:
+        dict: Filter response with categorized speakers
+    """
+    if df.empty:
+        raise NoRecordsError("No records found in CSV file")
+
+    # Filter speakers into categories
+    confirmed, intended, endorsed = categorize_frame(df, event_name, tag_index, progress)
+
+    return build_filter_response(
+        event_name, event_title, confirmed, intended, endorsed, progress, selection
+    )
+
+
+def filter_events(df, events, tag_index):
+    """
+    Filter a parsed dataset for several events using its tag index.
+
+    Args:
+        df: DataFrame with speaker data
+        events: List of (event_name, event_title) pairs
+        tag_index: TagIndex built for df
+
+    Returns:
+        list: Filter responses, one per event, in request order
+    """
+    if df.empty:
+        raise NoRecordsError("No records found in CSV file")
+
+    return [
+        filter_frame(df, event_name, event_title, tag_index)
+        for event_name, event_title in events
+    ]
+
+
+def build_tag_index(df):
+    """
+    Build the event/status tag index for a parsed dataset.
+
+    Args:
+        df: DataFrame with speaker data
+
+    Returns:
+        TagIndex: Index over the Workshops column
+    """
+    return TagIndex.from_frame(df)
+
+
+def filter_csv_bytes(contents, event_name, event_title, progress=None, selection=None):
+    """
+    Parse and filter an uploaded CSV file.
+
+    Args:
+        contents: Raw CSV bytes
+        event_name: Name of the event
+        event_title: Optional event title for content analysis
+        progress: Optional Progress to report stage counts to
+        selection: Speaker fields from select_fields(), or None for all
+
+    Returns:
+        dict: Filter response with categorized speakers
+    """
+    df, _ = parse_csv_bytes(contents, progress)
+    return filter_frame(df, event_name, event_title, progress=progress, selection=selection)
+
+
+def filter_csv_stream(fileobj, event_name, event_title, fmt='csv', compression=None,
+                      progress=None, selection=None, max_size=None):
+    """
+    Filter an uploaded file chunk by chunk without loading it whole.
+
+    Args:
+        fileobj: Readable binary file object
+        event_name: Name of the event
+        event_title: Optional event title for content analysis
+        fmt: Upload format ('csv', 'parquet' or 'arrow')
+        compression: 'gzip', 'zstd' or None, for CSV files
+        progress: Optional Progress to report stage counts to
+        selection: Speaker fields from select_fields(), or None for all
+        max_size: Optional limit on the decompressed size of a compressed
+            CSV file in bytes
+
+    Returns:
+        dict: Filter response with categorized speakers
+    """
+    speaker_filter = DataFrameSpeakerFilter(event_name)
+    confirmed, intended, endorsed, row_count = categorize_csv_stream(
+        fileobj, speaker_filter, fmt=fmt, compression=compression, progress=progress,
+        max_size=max_size
+    )
+
+    if row_count == 0:
+        raise NoRecordsError("No records found in CSV file")
+
+    return build_filter_response(
+        event_name, event_title, confirmed, intended, endorsed, progress, selection
+    )
+
+
+def build_filter_response(event_name, event_title, confirmed, intended, endorsed,
+                          progress=None, selection=None):
+    """
+    Build the filter response from categorized speakers.
+
+    Args:
+        event_name: Name of the event
+        event_title: Optional event title for content analysis
+        confirmed: List of confirmed speakers
+        intended: List of intended speakers
+        endorsed: List of endorsed speakers
+        progress: Optional Progress to report enriched speakers to
+        selection: Speaker fields from select_fields(), or None for all;
+            the content fit analysis is only computed if selected
+
+    Returns:
+        dict: Filter response with categorized speakers
+    """
+    progress = progress or Progress()
+
+    if selection is None or 'content_fit_analysis' in selection:
+        progress.start('enriching', len(intended) + len(endorsed))
+
+        # Generate enhanced data with analysis
+        generator = OutputGenerator(event_name, event_title, progress)
+
+        # Enhance intended and endorsed speakers with analysis
+        intended = [generator._enhance_speaker_data(s) for s in intended]
+        endorsed = [generator._enhance_speaker_data(s) for s in endorsed]
+
+    return {
+        "event_name": event_name,
+        "event_title": event_title,
+        "generated_at": datetime.now().isoformat(),
+        "summary": {
+            "confirmed_count": len(confirmed),
+            "intended_count": len(intended),
+            "endorsed_count": len(endorsed),
+            "total_count": len(confirmed) + len(intended) + len(endorsed)
+        },
+        "confirmed_speakers": project_speakers(confirmed, selection),
+        "intended_speakers": project_speakers(intended, selection),
+        "endorsed_speakers": project_speakers(endorsed, selection)
+    }
+
+
+def categorize_frame(df, event_name, tag_index=None, progress=None):
+    """
+    Categorize a parsed dataset without enriching or rendering it.
+
+    Args:
+        df: DataFrame with speaker data
+        event_name: Name of the event
+        tag_index: Optional TagIndex built for df
+        progress: Optional Progress to report categorized rows to
+
+    Returns:
+        tuple: (confirmed, intended, endorsed) lists of speakers
+    """
+    progress = progress or Progress()
+    progress.start('categorizing', len(df))
+
+    return DataFrameSpeakerFilter(event_name).categorize_frame(df, tag_index, progress)
+
+
+def categorize_csv_bytes(contents, event_name, progress=None):
+    """
+    Parse and categorize an uploaded CSV file.
+
+    Args:
+        contents: Raw CSV bytes
+        event_name: Name of the event
+        progress: Optional Progress to report stage counts to
+
+    Returns:
+        tuple: (confirmed, intended, endorsed) lists of speakers
+    """
+    df, _ = parse_csv_bytes(contents, progress)
+    return categorize_frame(df, event_name, progress=progress)
+
+
+def render_json_response(content, progress=None):
+    """
+    Serialize an API response body as compact JSON.
+
+    Rendering in the worker pool keeps large responses off the event loop
+    and lets the serialized size be reported as progress. The configured
+    serializer (orjson when installed) writes the bytes directly.
+
+    Args:
+        content: JSON-compatible response data
+        progress: Optional Progress to report serialized bytes to
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    progress = progress or Progress()
+    progress.start('serializing')
+
+    body = dumps(content)
+
+    progress.advance('serializing', len(body))
+    return body
+
+
+def render_json_export(event_name, event_title, confirmed, intended, endorsed,
+                       progress=None, compact=False, selection=None):
+    """
+    Render categorized speakers as a JSON report.
+
+    Args:
+        event_name: Name of the event
+        event_title: Optional event title
+        confirmed: List of confirmed speakers
+        intended: List of intended speakers
+        endorsed: List of endorsed speakers
+        progress: Optional Progress to report stage counts to
+        compact: Omit whitespace instead of indenting the report
+        selection: Speaker fields from select_fields(), or None for all;
+            the content fit analysis is only computed if selected
+
+    Returns:
+        bytes: UTF-8 encoded JSON report
+    """
+    progress = progress or Progress()
+
+    if selection is None or 'content_fit_analysis' in selection:
+        progress.start('enriching', len(intended) + len(endorsed))
+        generator = OutputGenerator(event_name, event_title, progress)
+        intended = [generator._enhance_speaker_data(s) for s in intended]
+        endorsed = [generator._enhance_speaker_data(s) for s in endorsed]
+
+    data = {
+        'event_name': event_name,
+        'event_title': event_title,
+        'generated_at': datetime.now().isoformat(),
+        'summary': {
+            'confirmed_count': len(confirmed),
+            'intended_count': len(intended),
+            'endorsed_count': len(endorsed)
+        },
+        'confirmed_speakers': project_speakers(confirmed, selection),
+        'intended_speakers': project_speakers(intended, selection),
+        'endorsed_speakers': project_speakers(endorsed, selection)
+    }
+
+    progress.start('serializing')
+    content = dumps(data, compact)
+    progress.advance('serializing', len(content))
+    return content
+
+
+def iter_export(format, event_name, event_title, confirmed, intended, endorsed,
+                chunk_size=STREAM_CHUNK_BYTES, progress=None):
+    """
+    Render categorized speakers as a CSV, text, Parquet or Arrow report,
+    piece by piece.
+
+    Rows and sections are grouped into chunks of roughly chunk_size
+    characters so the response streams without a full-report string.
+    Parquet and Arrow IPC files are streamed one record batch at a time
+    (see columnar_export).
+
+    Args:
+        format: Export format (csv, text, parquet, arrow)
+        event_name: Name of the event
+        event_title: Optional event title
+        confirmed: List of confirmed speakers
+        intended: List of intended speakers
+        endorsed: List of endorsed speakers
+        chunk_size: Approximate number of characters per chunk
+        progress: Optional Progress to report stage counts to
+
+    Yields:
+        bytes: Next UTF-8 encoded chunk of the report
+    """
+    progress = progress or Progress()
+
+    if format in ('parquet', 'arrow'):
+        yield from iter_columnar_export(
+            format, event_name, event_title, confirmed, intended, endorsed, progress=progress
+        )
+        return
+
+    generator = OutputGenerator(event_name, event_title, progress)
+
+    if format == 'csv':
+        # Only the CSV rows carry the content fit analysis
+        progress.start('enriching', len(intended) + len(endorsed))
+        pieces = generator.iter_csv_lines(confirmed, intended, endorsed)
+    else:  # text
+        pieces = generator.iter_text_sections(confirmed, intended, endorsed)
+
+    progress.start('serializing')
+
+    def flush(buffer):
+        chunk = ''.join(buffer).encode('utf-8')
+        progress.advance('serializing', len(chunk))
+        return chunk
+
+    buffer = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield flush(buffer)
+            buffer = []
+            buffered = 0
+
+    if buffer:
+        yield flush(buffer)
+
+
+def export_frame(format, df, event_name, event_title, tag_index=None, progress=None,
+                 compact=False):
+    """
+    Categorize a parsed dataset and render the whole report.
+
+    Used by background jobs, which keep the finished report until it is
+    downloaded instead of streaming it to an open request.
+
+    Args:
+        format: Export format (csv, json, text, parquet, arrow)
+        df: DataFrame with speaker data
+        event_name: Name of the event
+        event_title: Optional event title
+        tag_index: Optional TagIndex built for df
+        progress: Optional Progress to report stage counts to
+        compact: Omit whitespace from a JSON report
+
+    Returns:
+        bytes: Report; UTF-8 encoded for csv, json and text
+    """
+    categorized = categorize_frame(df, event_name, tag_index, progress)
+
+    if format in STREAMED_FORMATS:
+        return b''.join(
+            iter_export(format, event_name, event_title, *categorized, progress=progress)
+        )
+    return render_json_export(event_name, event_title, *categorized, progress, compact)
@@ -0,0 +1,212 @@
+"""
+Stage progress counters for filter and export runs.
+
+The pipeline steps report what they have processed so far (bytes
+received, rows parsed, rows categorized, speakers enriched, bytes
+serialized) to a Progress object, which the API reads from another
+thread to stream how far a run has got.
+"""
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs
+
+# Query parameter naming the Progress a request reports to
+PROGRESS_ID_PARAM = 'progress_id'
+
+
+class Progress:
+    """Thread-safe per-stage counters of one run."""
+
+    def __init__(self):
+        """Initialize with no stages started."""
+        self.stage = None
+        self.version = 0
+        self.finished = False
+        self.error = None
+        self.started = time.monotonic()
+        self.updated = self.started
+        self._stages = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, stage, total=None):
+        """
+        Begin a stage and make it the current one.
+
+        Args:
+            stage: Stage name, e.g. 'categorizing'
+            total: Expected count for the stage, if known
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._stages[stage] = {'done': 0, 'total': total, 'started': now, 'updated': now}
+            self.stage = stage
+            self._touch(now)
+
+    def advance(self, stage, count=1):
+        """
+        Add to the count of a stage, starting it if needed.
+
+        Args:
+            stage: Stage name
+            count: Amount processed since the last call
+        """
+        with self._lock:
+            now = time.monotonic()
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = {
+                    'done': 0, 'total': None, 'started': now, 'updated': now
+                }
+                self.stage = stage
+            entry['done'] += count
+            entry['updated'] = now
+            self._touch(now)
+
+    def finish(self, error=None):
+        """
+        Mark the run as finished.
+
+        Args:
+            error: Error message if the run failed
+        """
+        with self._lock:
+            if not self.finished:
+                self.finished = True
+                self.error = error
+                self._touch(time.monotonic())
+
+    def snapshot(self):
+        """
+        Get a copy of the counters.
+
+        Stage seconds run from the start of the stage to its last update,
+        so done / seconds is the stage's rate for ETA estimates.
+
+        Returns:
+            dict: Current stage, finished flag, error, elapsed seconds and
+                {stage: {'done', 'total', 'seconds'}} in start order
+        """
+        with self._lock:
+            return {
+                'stage': self.stage,
+                'finished': self.finished,
+                'error': self.error,
+                'elapsed_seconds': round(time.monotonic() - self.started, 3),
+                'stages': {
+                    name: {
+                        'done': entry['done'],
+                        'total': entry['total'],
+                        'seconds': round(entry['updated'] - entry['started'], 3)
+                    }
+                    for name, entry in self._stages.items()
+                }
+            }
+
+    def _touch(self, now):
+        """Record an update. Caller holds the lock."""
+        self.version += 1
+        self.updated = now
+
+
+class ProgressRegistry:
+    """Progress objects by client-chosen ID, dropped after a TTL."""
+
+    def __init__(self, ttl, max_entries=1000):
+        """
+        Initialize an empty registry.
+
+        Args:
+            ttl: Seconds an entry is kept after its last update
+            max_entries: Entries kept at most; the least recently used
+                are dropped first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, progress_id):
+        """
+        Get the Progress for an ID, creating it on first use.
+
+        Either the run or an event stream subscriber may come first.
+
+        Args:
+            progress_id: Client-chosen ID
+
+        Returns:
+            Progress: Progress for the ID
+        """
+        with self._lock:
+            self._purge_expired()
+            progress = self._entries.get(progress_id)
+            if progress is None:
+                progress = self._entries[progress_id] = Progress()
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self._entries.move_to_end(progress_id)
+            return progress
+
+    def get(self, progress_id):
+        """
+        Get the Progress for an ID.
+
+        Args:
+            progress_id: Client-chosen ID
+
+        Returns:
+            Progress: Progress for the ID, or None if unknown or expired
+        """
+        with self._lock:
+            self._purge_expired()
+            return self._entries.get(progress_id)
+
+    def _purge_expired(self):
+        """Drop entries not updated within the TTL. Caller holds the lock."""
+        cutoff = time.monotonic() - self.ttl
+        expired = [
+            progress_id for progress_id, progress in self._entries.items()
+            if progress.updated < cutoff
+        ]
+        for progress_id in expired:
+            del self._entries[progress_id]
+
+
+class UploadProgressMiddleware:
+    """ASGI middleware counting request body bytes as they are received."""
+
+    def __init__(self, app, registry):
+        """
+        Wrap an ASGI app.
+
+        Args:
+            app: ASGI application
+            registry: ProgressRegistry to report to
+        """
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        """Count the body of requests that carry a progress_id parameter."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        progress_ids = query.get(PROGRESS_ID_PARAM)
+        if not progress_ids:
+            await self.app(scope, receive, send)
+            return
+
+        progress = self.registry.get_or_create(progress_ids[0])
+        content_length = dict(scope['headers']).get(b'content-length', b'')
+        progress.start('receiving', int(content_length) if content_length.isdigit() else None)
+
+        async def counting_receive():
+            message = await receive()
+            if message['type'] == 'http.request':
+                progress.advance('receiving', len(message.get('body', b'')))
+            return message
+
+        await self.app(scope, counting_receive, send)
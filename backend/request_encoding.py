@@ -0,0 +1,150 @@
+"""
+Decoding of gzip-compressed request bodies.
+
+Clients may send an upload with `Content-Encoding: gzip` to cut transfer
+time. The body is inflated piece by piece as the server receives it, so
+the form parser and the endpoints see the plain request and the upload
+is never held compressed and decompressed at the same time.
+"""
+import zlib
+from starlette.responses import JSONResponse
+
+# Content-Encoding values decoded by GzipRequestMiddleware
+GZIP_ENCODINGS = ('gzip', 'x-gzip')
+
+# zlib window bits for a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# Maximum decompressed bytes handed to the app per receive() call
+DECODE_CHUNK_BYTES = 1024 * 1024
+
+
+class RequestTooLargeError(ValueError):
+    """Raised when a decompressed request body exceeds the size limit."""
+
+
+class GzipRequestMiddleware:
+    """ASGI middleware that inflates gzip-encoded request bodies."""
+
+    def __init__(self, app, max_size=None):
+        """
+        Wrap an ASGI app.
+
+        Args:
+            app: ASGI application
+            max_size: Optional limit on the decompressed body size in bytes
+        """
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        """
+        Decode the request body if it is gzip-encoded.
+
+        A body that inflates past max_size is answered with 413. The error
+        is raised inside the app's receive() so it stops reading, but the
+        app may turn it into a response of its own (FastAPI's form parsing
+        answers any body error with 400), so that response is replaced.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope['headers']
+        encoding = dict(headers).get(b'content-encoding', b'').decode('latin-1')
+        if encoding.strip().lower() not in GZIP_ENCODINGS:
+            await self.app(scope, receive, send)
+            return
+
+        # The app sees a plain body of unknown length
+        scope = dict(scope, headers=[
+            (name, value) for name, value in headers
+            if name not in (b'content-encoding', b'content-length')
+        ])
+        rejected = None
+        started = False
+
+        def reject(error):
+            nonlocal rejected
+            rejected = error
+
+        async def guarded_send(message):
+            nonlocal started
+            if rejected is not None and not started:
+                # Swallow the app's own answer to the failed read
+                return
+            if message['type'] == 'http.response.start':
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, self._decoding_receive(receive, reject), guarded_send)
+        except Exception:
+            # Anything the app raises after the body was rejected stems
+            # from the failed read
+            if rejected is None or started:
+                raise
+
+        if rejected is not None and not started:
+            response = JSONResponse({'detail': str(rejected)}, status_code=413)
+            await response(scope, receive, send)
+
+    def _decoding_receive(self, receive, reject):
+        """
+        Wrap receive() to return decompressed body chunks.
+
+        Each call inflates at most DECODE_CHUNK_BYTES, so a small, highly
+        compressed chunk cannot expand into one huge message. Concatenated
+        gzip members are decoded one after another.
+
+        Args:
+            receive: ASGI receive callable of the request
+            reject: Called with the RequestTooLargeError before it is
+                raised, so the middleware can answer 413
+
+        Returns:
+            Async receive callable yielding decompressed body messages
+        """
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        pending = b''
+        more_body = True
+        finished = False
+        decoded = 0
+
+        async def decoding_receive():
+            nonlocal decompressor, pending, more_body, finished, decoded
+
+            if finished:
+                # Body fully delivered; pass through e.g. http.disconnect
+                return await receive()
+
+            while not pending and more_body:
+                message = await receive()
+                if message['type'] != 'http.request':
+                    return message
+                pending = message.get('body', b'')
+                more_body = message.get('more_body', False)
+
+            if decompressor.eof and pending:
+                # Start of the next gzip member
+                decompressor = zlib.decompressobj(GZIP_WBITS)
+
+            body = decompressor.decompress(pending, DECODE_CHUNK_BYTES)
+            pending = decompressor.unconsumed_tail or decompressor.unused_data
+
+            if not pending and not more_body:
+                if not decompressor.eof:
+                    raise zlib.error("Truncated gzip request body")
+                finished = True
+
+            decoded += len(body)
+            if self.max_size is not None and decoded > self.max_size:
+                error = RequestTooLargeError(
+                    f"Decompressed request body exceeds {self.max_size} bytes"
+                )
+                reject(error)
+                raise error
+
+            return {'type': 'http.request', 'body': body, 'more_body': not finished}
+
+        return decoding_receive
@@ -0,0 +1,209 @@
+"""
+Cache of filter and export results.
+
+The same event is often re-run on the same file many times a day. Results
+are kept under a hash of the uploaded content, the event name and title
+and the filter settings in config, so a repeated call skips parsing,
+filtering and enrichment.
+"""
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+import config
+
+# Bytes read at a time when hashing an uploaded file
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def content_hash(data):
+    """
+    Hash uploaded content.
+
+    Args:
+        data: Raw bytes, or a readable, seekable binary file object
+
+    Returns:
+        str: Hex digest of the content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        digest.update(data)
+    else:
+        data.seek(0)
+        for chunk in iter(lambda: data.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+        data.seek(0)
+
+    return digest.hexdigest()
+
+
+def filter_settings():
+    """
+    Get the config values that change filter results.
+
+    Returns:
+        tuple: Column mapping, rating thresholds and excluded regions
+    """
+    return (
+        tuple(sorted(config.COLUMNS.items())),
+        config.AXEL_RATING_GOOD,
+        config.AXEL_RATING_LOWER,
+        config.IR_RATING_THRESHOLD,
+        tuple(config.EXCLUDED_REGIONS)
+    )
+
+
+def result_key(kind, digest, *parts):
+    """
+    Build a cache key.
+
+    Args:
+        kind: Result kind, e.g. 'filter' or 'export'
+        digest: Content hash of the input
+        *parts: Request parameters the result depends on, e.g. the event
+            name and title
+
+    Returns:
+        tuple: Cache key, including the current filter settings
+    """
+    return (kind, digest, *parts, filter_settings())
+
+
+def estimate_size(value):
+    """
+    Estimate the memory held by a result.
+
+    Objects with an estimated_size() method (SpeakerRecord) report their
+    own size, so lazily extracted fields are not computed just to be
+    measured.
+
+    Args:
+        value: Bytes, string, number or nested mappings, lists and tuples
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if hasattr(value, 'estimated_size'):
+        return value.estimated_size()
+
+    size = sys.getsizeof(value)
+
+    if isinstance(value, Mapping):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+
+    return size
+
+
+class ResultCache:
+    """Stores results with LRU eviction, a memory cap and a TTL."""
+
+    def __init__(self, max_bytes, ttl):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Total memory budget for all cached results
+            ttl: Seconds a result stays valid after it was stored
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get a cached result and mark it as recently used.
+
+        Args:
+            key: Key from result_key()
+
+        Returns:
+            Any: Cached result, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry['expires_at'] <= time.monotonic():
+                self._discard(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry['value']
+
+    def put(self, key, value, size=None):
+        """
+        Store a result and evict least recently used ones over budget.
+
+        Results larger than the whole budget are not stored.
+
+        Args:
+            key: Key from result_key()
+            value: Result to cache; must not be modified afterwards
+            size: Size in bytes, estimated if not given
+        """
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+
+            self._entries[key] = {
+                'value': value,
+                'size_bytes': size,
+                'expires_at': time.monotonic() + self.ttl
+            }
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._evictions += 1
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        """
+        Get cache usage statistics.
+
+        Returns:
+            dict: Entry count, memory usage and hit/miss counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entry_count': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 3) if lookups else 0.0,
+                'evictions': self._evictions
+            }
+
+    def _discard(self, key):
+        """Remove one entry. Caller holds the lock."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry['size_bytes']
@@ -0,0 +1,146 @@
+"""
+Event/status tag index for a parsed dataset.
+
+The Workshops column is split into its tags once, and each distinct tag is
+mapped to the rows that carry it. Filtering an event then checks the few
+distinct tags instead of scanning every cell, so running many events
+against the same dataset costs one scan in total.
+"""
+import sys
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+from config import COLUMNS
+from filters import DataFrameSpeakerFilter
+
+# Tag statuses, as they appear after the event name in a tag
+TAG_STATUSES = ('confirmed', 'intended', 'endorsed', 'not reached', 'not available')
+
+# Separator between tags in a Workshops cell
+TAG_SEPARATOR = ','
+
+
+class TagIndex:
+    """Maps each distinct Workshops tag to the row positions carrying it."""
+
+    def __init__(self, workshops):
+        """
+        Build the index from a lowercased Workshops column.
+
+        Only the tag positions are kept; the column itself is not, so the
+        index adds little to the memory of the dataset it was built for.
+
+        Args:
+            workshops: Lowercased Workshops values, empty for missing cells
+        """
+        self.row_count = len(workshops)
+
+        positions = defaultdict(list)
+        for position, cell in enumerate(workshops.tolist()):
+            if not cell:
+                continue
+            for tag in set(cell.split(TAG_SEPARATOR)):
+                positions[tag].append(position)
+
+        # Tags are kept unstripped so substring matches stay identical to
+        # scanning the whole cell
+        self._positions = {
+            tag: np.asarray(rows, dtype=np.int64)
+            for tag, rows in positions.items()
+        }
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Build the index for a DataFrame.
+
+        Args:
+            df: DataFrame with speaker data
+
+        Returns:
+            TagIndex: Index over the Workshops column
+        """
+        if COLUMNS['workshops'] not in df.columns:
+            return cls(pd.Series('', index=df.index, dtype=object))
+
+        return cls(DataFrameSpeakerFilter._lower_text(df[COLUMNS['workshops']]))
+
+    def contains(self, text, workshops=None):
+        """
+        Boolean row mask of cells containing a lowercased text.
+
+        Equivalent to `text in cell` for every cell of the column.
+
+        Args:
+            text: Lowercased text to look for, e.g. "2511 barclays confirmed"
+            workshops: The indexed Workshops column as stored in the
+                dataset. Only needed, and only lowercased, when the text
+                contains a tag separator; ValueError is raised if it is
+                missing then.
+
+        Returns:
+            np.ndarray: Boolean mask, one value per row
+        """
+        mask = np.zeros(self.row_count, dtype=bool)
+
+        if TAG_SEPARATOR in text:
+            # The text may span several tags; fall back to a full scan
+            if workshops is None:
+                raise ValueError("Text spans several tags; the Workshops column is needed")
+            lowered = DataFrameSpeakerFilter._lower_text(workshops)
+            mask[:] = lowered.str.contains(text, regex=False).to_numpy(dtype=bool)
+            return mask
+
+        for tag, rows in self._positions.items():
+            if text in tag:
+                mask[rows] = True
+
+        return mask
+
+    def event_statuses(self):
+        """
+        Parse the indexed tags into (event, status) pairs.
+
+        Returns:
+            dict: {event: {status: row count}} for tags ending in a status
+        """
+        events = defaultdict(lambda: defaultdict(list))
+
+        for tag, rows in self._positions.items():
+            tag = tag.strip()
+            for status in TAG_STATUSES:
+                if tag.endswith(' ' + status):
+                    event = tag[:-len(status)].strip()
+                    events[event][status].append(rows)
+                    break
+
+        # The same pair can appear under differently spaced tags; count rows once
+        return {
+            event: {
+                status: len(np.unique(np.concatenate(statuses[status])))
+                for status in TAG_STATUSES
+                if status in statuses
+            }
+            for event, statuses in sorted(events.items())
+        }
+
+    def estimated_size(self):
+        """
+        Estimate the memory held by the index.
+
+        Returns:
+            int: Approximate size in bytes of the tags and row positions
+        """
+        return sys.getsizeof(self._positions) + sum(
+            sys.getsizeof(tag) + rows.nbytes + sys.getsizeof(rows)
+            for tag, rows in self._positions.items()
+        )
+
+    def tag_count(self):
+        """
+        Get the number of distinct tags.
+
+        Returns:
+            int: Distinct tags in the index
+        """
+        return len(self._positions)
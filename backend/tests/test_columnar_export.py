@@ -0,0 +1,68 @@
+"""
+Parquet and Arrow exports, checked field for field against the JSON report.
+"""
+import io
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from columnar_export import SPEAKER_SCHEMA, iter_columnar_export
+from config import COLUMNS
+from filters import DataFrameSpeakerFilter
+from output_generator import OutputGenerator
+
+EVENT = '2511 Barclays'
+TITLE = 'Banking risk, capital markets and liquidity regulation'
+
+
+def speakers_frame():
+    rows = [
+        ('Ada', f'{EVENT} Confirmed', 95, 'In sum: fine', 'In sum 4\nGood', 'Banking'),
+        ('Grace', f'{EVENT} Intended', 94, 'Call 03/04/2025\nIN SUM:  great\n one\ntwo\n\nMore',
+         'In sum 4.5\n  Good\nThird', 'Banking risk in capital markets\nliquidity regulation'),
+        ('Edsger', f'{EVENT} Endorsed', float('nan'), None, '   ', 'x' * 250),
+        ('Barbara', f'{EVENT} Intended, {EVENT} Endorsed', '93', 'No summary, March 4, 2025',
+         None, 'Capital ' + 'y' * 195 + '\nrest'),
+        ('Alan', f'{EVENT} Endorsed', 0, '', 'insum: 3', 'z' * 200),
+    ]
+    return pd.DataFrame([
+        {
+            COLUMNS['speaker_name']: name,
+            COLUMNS['workshops']: workshops,
+            COLUMNS['axel_rating']: axel,
+            COLUMNS['notes_speaker_calls']: notes,
+            COLUMNS['jelena_comments']: jelena,
+            COLUMNS['abstract']: abstract,
+            COLUMNS['ir_speaking_engagement']: 'Keynote 4.1',
+            COLUMNS['company']: 'Acme'
+        }
+        for name, workshops, axel, notes, jelena, abstract in rows
+    ])
+
+
+def read_export(format, data):
+    if format == 'parquet':
+        return pq.read_table(io.BytesIO(data))
+    return pa.ipc.open_file(data).read_all()
+
+
+@pytest.mark.parametrize('format', ['parquet', 'arrow'])
+@pytest.mark.parametrize('title', [TITLE, ''])
+def test_export_matches_json_report(format, title):
+    confirmed, intended, endorsed = DataFrameSpeakerFilter(EVENT).categorize_frame(
+        speakers_frame()
+    )
+    generator = OutputGenerator(EVENT, title)
+    expected = confirmed + [generator._enhance_speaker_data(s).to_dict()
+                            for s in intended + endorsed]
+
+    data = b''.join(iter_columnar_export(format, EVENT, title, confirmed, intended, endorsed,
+                                         batch_rows=2))
+    table = read_export(format, data)
+
+    assert table.schema.equals(SPEAKER_SCHEMA)
+    assert table.schema.metadata[b'event_name'] == EVENT.encode()
+    rows = table.to_pylist()
+    assert len(rows) == len(expected)
+    for row, speaker in zip(rows, expected):
+        assert row == {**dict.fromkeys(row), **speaker}
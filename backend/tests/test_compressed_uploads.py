@@ -0,0 +1,194 @@
+"""
+Compressed CSV uploads and gzip-encoded request bodies.
+"""
+import asyncio
+import gzip
+import warnings
+import zlib
+import pandas as pd
+import pyarrow as pa
+import pytest
+from config import COLUMNS
+from request_encoding import GzipRequestMiddleware, RequestTooLargeError
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    from fastapi.testclient import TestClient
+
+import api
+
+EVENT = '2511 Barclays'
+
+
+@pytest.fixture(scope='module')
+def csv_bytes():
+    workshops = [f'{EVENT} Confirmed', f'{EVENT} Intended', f'{EVENT} Endorsed', '2512 HSBC Intended']
+    frame = pd.DataFrame([
+        {
+            COLUMNS['speaker_name']: f'Speaker {i}',
+            COLUMNS['workshops']: workshops[i % len(workshops)],
+            COLUMNS['axel_rating']: 90 + i % 6,
+            COLUMNS['region']: ['EU', 'US', 'Asia'][i % 3],
+            COLUMNS['company']: 'Acme',
+            COLUMNS['notes_speaker_calls']: f'In sum: speaker {i}\nGood fit',
+            COLUMNS['abstract']: 'Banking risk and capital markets',
+            'Unused notes': 'x' * 50
+        }
+        for i in range(400)
+    ])
+    return frame.to_csv(index=False).encode('utf-8')
+
+
+@pytest.fixture
+def client():
+    return TestClient(api.app)
+
+
+def compress(data, compression):
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, compression) as stream:
+        stream.write(data)
+    return sink.getvalue().to_pybytes()
+
+
+def without_timestamp(response):
+    assert response.status_code == 200, response.text
+    body = response.json()
+    body.pop('generated_at', None)
+    body.pop('dataset_id', None)
+    return body
+
+
+def multipart(client, path, csv_bytes, filename='speakers.csv'):
+    """Build a multipart upload request and return its body and content type."""
+    request = client.build_request('POST', path, files={'file': (filename, csv_bytes)})
+    return request.read(), request.headers['content-type']
+
+
+def post_filter(client, filename, data, **kwargs):
+    return client.post('/api/filter-speakers-csv', params={'event_name': EVENT},
+                       files={'file': (filename, data)}, **kwargs)
+
+
+@pytest.mark.parametrize('suffix, compression', [('.gz', 'gzip'), ('.zst', 'zstd')])
+def test_compressed_upload_matches_plain_upload(client, csv_bytes, suffix, compression):
+    compressed = compress(csv_bytes, compression)
+
+    plain = post_filter(client, 'speakers.csv', csv_bytes)
+    packed = post_filter(client, f'speakers.csv{suffix}', compressed)
+    assert without_timestamp(packed) == without_timestamp(plain)
+    assert plain.json()['summary']['total_count'] > 0
+
+    plain = client.post('/api/upload-csv', files={'file': ('speakers.csv', csv_bytes)})
+    packed = client.post('/api/upload-csv', files={'file': (f'speakers.csv{suffix}', compressed)})
+    assert without_timestamp(packed) == without_timestamp(plain)
+
+
+@pytest.mark.parametrize('path', ['/api/upload-csv', '/api/filter-speakers-csv'])
+def test_compressed_upload_over_limit(client, csv_bytes, monkeypatch, path):
+    # Far smaller than the CSV, but larger than its gzip form
+    monkeypatch.setattr(api.app, 'max_request_size', len(csv_bytes) // 4)
+    compressed = compress(csv_bytes, 'gzip')
+    assert len(compressed) < api.app.max_request_size
+
+    # A title of its own, so no cached result of the same upload is reused
+    response = client.post(path, params={'event_name': EVENT, 'event_title': 'Over limit'},
+                           files={'file': ('speakers.csv.gz', compressed)})
+    assert response.status_code == 413
+    assert 'exceeds' in response.json()['detail']
+
+
+def test_gzip_encoded_request_matches_plain(client, csv_bytes):
+    body, content_type = multipart(client, '/api/filter-speakers-csv', csv_bytes)
+    plain = post_filter(client, 'speakers.csv', csv_bytes)
+
+    encoded = client.post('/api/filter-speakers-csv', params={'event_name': EVENT},
+                          content=gzip.compress(body),
+                          headers={'content-type': content_type, 'content-encoding': 'gzip'})
+    assert without_timestamp(encoded) == without_timestamp(plain)
+
+
+def test_multi_member_gzip_request(client, csv_bytes):
+    body, content_type = multipart(client, '/api/filter-speakers-csv', csv_bytes)
+    # Split inside the CSV so a member boundary falls mid-file
+    middle = len(body) // 2
+    members = gzip.compress(body[:middle]) + gzip.compress(body[middle:])
+
+    encoded = client.post('/api/filter-speakers-csv', params={'event_name': EVENT},
+                          content=members,
+                          headers={'content-type': content_type, 'content-encoding': 'gzip'})
+    assert without_timestamp(encoded) == without_timestamp(
+        post_filter(client, 'speakers.csv', csv_bytes)
+    )
+
+
+def test_truncated_gzip_request(client, csv_bytes):
+    body, content_type = multipart(client, '/api/filter-speakers-csv', csv_bytes)
+    truncated = gzip.compress(body)[:-20]
+
+    response = client.post('/api/filter-speakers-csv', params={'event_name': EVENT},
+                           content=truncated,
+                           headers={'content-type': content_type, 'content-encoding': 'gzip'})
+    assert response.status_code == 400
+
+
+def test_gzip_request_over_limit(csv_bytes):
+    client = TestClient(GzipRequestMiddleware(api.app, max_size=1000))
+    body, content_type = multipart(client, '/api/upload-csv', csv_bytes)
+
+    response = client.post('/api/upload-csv', content=gzip.compress(body),
+                           headers={'content-type': content_type, 'content-encoding': 'gzip'})
+    assert response.status_code == 413
+    assert response.json() == {'detail': 'Decompressed request body exceeds 1000 bytes'}
+
+
+def decode(messages, max_size=None):
+    """Run body messages through the middleware's receive() wrapper."""
+    middleware = GzipRequestMiddleware(app=None, max_size=max_size)
+    rejected = []
+
+    async def run():
+        pending = list(messages)
+
+        async def receive():
+            return pending.pop(0)
+
+        decoding_receive = middleware._decoding_receive(receive, rejected.append)
+        body = b''
+        while True:
+            message = await decoding_receive()
+            body += message['body']
+            if not message['more_body']:
+                return body
+
+    return asyncio.run(run()), rejected
+
+
+def body_messages(data, size):
+    pieces = [data[i:i + size] for i in range(0, len(data), size)] or [b'']
+    return [
+        {'type': 'http.request', 'body': piece, 'more_body': i < len(pieces) - 1}
+        for i, piece in enumerate(pieces)
+    ]
+
+
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_decoding_across_message_boundaries(size):
+    data = b'speaker,notes\n' * 5000
+    members = gzip.compress(data[:30000]) + gzip.compress(data[30000:])
+
+    body, rejected = decode(body_messages(members, size))
+    assert body == data
+    assert rejected == []
+
+
+def test_decoding_truncated_body():
+    with pytest.raises(zlib.error):
+        decode(body_messages(gzip.compress(b'a' * 10000)[:-8], 100))
+
+
+def test_decoding_stops_a_gzip_bomb():
+    bomb = gzip.compress(b'\0' * (50 * 1024 * 1024))
+
+    with pytest.raises(RequestTooLargeError):
+        decode(body_messages(bomb, 64 * 1024), max_size=1024 * 1024)
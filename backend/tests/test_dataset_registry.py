@@ -0,0 +1,69 @@
+"""
+DatasetRegistry keeps stored datasets and their tag indexes within budget.
+"""
+import pandas as pd
+from config import COLUMNS
+from dataset_registry import DatasetRegistry
+from tag_index import TagIndex
+
+EVENT = '2511 Barclays'
+
+
+def frame(rows=2000):
+    return pd.DataFrame({
+        COLUMNS['workshops']: [f'{EVENT} Intended, Event {i % 50} Endorsed' for i in range(rows)],
+        COLUMNS['speaker_name']: [f'Speaker {i}' for i in range(rows)]
+    })
+
+
+def frame_size(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def test_tag_index_counts_toward_size():
+    df = frame()
+    registry = DatasetRegistry(max_bytes=10 * frame_size(df))
+    dataset_id = registry.add(df)
+    tag_index = TagIndex.from_frame(df)
+
+    registry.set_tag_index(dataset_id, tag_index)
+
+    assert tag_index.estimated_size() > 0
+    assert registry.stats()['total_bytes'] == frame_size(df) + tag_index.estimated_size()
+
+    # Replacing the index does not count it twice
+    registry.set_tag_index(dataset_id, TagIndex.from_frame(df))
+    assert registry.stats()['total_bytes'] == frame_size(df) + tag_index.estimated_size()
+
+    assert registry.remove(dataset_id)
+    assert registry.stats()['total_bytes'] == 0
+
+
+def test_tag_index_over_budget_evicts_least_recently_used():
+    old, new = frame(), frame()
+    # Room for both frames, but not for an index on top
+    registry = DatasetRegistry(max_bytes=frame_size(old) + frame_size(new))
+    old_id = registry.add(old)
+    new_id = registry.add(new)
+    assert registry.get(old_id) is old
+
+    # old_id is now the most recently used, so new_id is evicted
+    registry.set_tag_index(old_id, TagIndex.from_frame(old))
+
+    assert registry.get(new_id) is None
+    assert registry.get(old_id) is old
+    assert registry.get_tag_index(old_id) is not None
+    assert registry.stats()['dataset_count'] == 1
+
+
+def test_dataset_growing_by_its_index_is_kept():
+    df, other = frame(), frame()
+    registry = DatasetRegistry(max_bytes=frame_size(df) + frame_size(other))
+    dataset_id = registry.add(df)
+    other_id = registry.add(other)
+
+    # The dataset that grew is least recently used, but is not evicted
+    registry.set_tag_index(dataset_id, TagIndex.from_frame(df))
+
+    assert registry.get(dataset_id) is df
+    assert registry.get(other_id) is None
@@ -0,0 +1,129 @@
+"""
+DataFrameSpeakerFilter must categorize exactly like SpeakerFilter.
+"""
+import pandas as pd
+import pytest
+from config import COLUMNS
+from filters import DataFrameSpeakerFilter, SpeakerFilter
+from tag_index import TagIndex
+
+EVENT = '2511 Barclays'
+
+
+def row(workshops=f'{EVENT} Intended', axel=95, ir=None, region='EU', name='Ada Lovelace',
+        activity='', company='Acme'):
+    """Build one speaker record with the columns from config."""
+    return {
+        COLUMNS['workshops']: workshops,
+        COLUMNS['axel_rating']: axel,
+        COLUMNS['ir_speaking_engagement']: ir,
+        COLUMNS['region']: region,
+        COLUMNS['speaker_name']: name,
+        COLUMNS['activity_notes']: activity,
+        COLUMNS['company']: company,
+        COLUMNS['notes_speaker_calls']: 'In sum: strong speaker\nGood fit\n\nCalled 03/04/2025',
+        COLUMNS['jelena_comments']: 'In sum 4.5\nKnows the topic',
+        COLUMNS['abstract']: 'Banking risk\nCapital markets and risk'
+    }
+
+
+EDGE_ROWS = {
+    'nan_rating': row(axel=float('nan')),
+    'numeric_good_rating': row(axel=94),
+    'numeric_lower_rating': row(axel=92.0),
+    'numeric_low_rating': row(axel=91),
+    'text_rating': row(axel='93'),
+    'padded_text_rating': row(axel=' 95 '),
+    'unparseable_rating': row(axel='n/a'),
+    'none_rating_with_ir_text': row(axel=None, ir='Keynote, rated 4.2'),
+    'low_ir_text': row(axel=None, ir='rated 3.5'),
+    'numeric_ir': row(axel=float('nan'), ir=3.9),
+    'zero_ir': row(axel=None, ir=0),
+    'upper_case_tag': row(workshops=f'{EVENT.upper()} INTENDED'),
+    'lower_case_tag': row(workshops=f'{EVENT.lower()} endorsed'),
+    'whitespace_tag': row(workshops=f'  {EVENT} Endorsed  \n'),
+    'several_tags': row(workshops=f'{EVENT} Confirmed, {EVENT} Intended, {EVENT} Endorsed'),
+    'not_reached': row(workshops=f'{EVENT} Intended, {EVENT} not reached'),
+    'not_available': row(workshops=f'{EVENT} Intended; {EVENT} Not Available'),
+    'confirmed': row(workshops=f'{EVENT} Confirmed'),
+    'other_event': row(workshops='2512 HSBC Intended'),
+    'no_tags': row(workshops=None),
+    'blank_tags': row(workshops=''),
+    'excluded_region_asia': row(region='Asia'),
+    'excluded_region_us': row(region='US', workshops=f'{EVENT} Endorsed'),
+    'missing_region': row(region=None),
+    'blank_name': row(name=''),
+    'missing_name': row(name=None),
+    'nan_name': row(name=float('nan'), workshops=f'{EVENT} Confirmed'),
+    'dont_contact': row(activity="DON'T CONTACT until 2026"),
+    'do_not_contact': row(activity='Do not contact', workshops=f'{EVENT} Endorsed'),
+}
+
+
+def as_dicts(categorized):
+    """Convert categorized speakers to plain dicts for comparison."""
+    return tuple([dict(speaker) for speaker in speakers] for speakers in categorized)
+
+
+def expected(records):
+    """Categorize records with the row-by-row SpeakerFilter."""
+    return as_dicts(SpeakerFilter(EVENT).categorize(records))
+
+
+@pytest.mark.parametrize('use_tag_index', [False, True])
+@pytest.mark.parametrize('name', EDGE_ROWS)
+def test_edge_row_matches_speaker_filter(name, use_tag_index):
+    df = pd.DataFrame([EDGE_ROWS[name]])
+    tag_index = TagIndex.from_frame(df) if use_tag_index else None
+
+    result = DataFrameSpeakerFilter(EVENT).categorize_frame(df, tag_index)
+
+    assert as_dicts(result) == expected(df.to_dict('records'))
+
+
+@pytest.mark.parametrize('use_tag_index', [False, True])
+def test_mixed_frame_matches_speaker_filter(use_tag_index):
+    # All edge rows in one frame, so columns hold mixed types
+    df = pd.DataFrame(list(EDGE_ROWS.values()))
+    tag_index = TagIndex.from_frame(df) if use_tag_index else None
+
+    result = DataFrameSpeakerFilter(EVENT).categorize_frame(df, tag_index)
+
+    assert as_dicts(result) == expected(df.to_dict('records'))
+    assert all(len(speakers) > 0 for speakers in result)
+
+
+def test_event_name_with_tag_separator():
+    # A tag text with a comma spans tags, so the index scans the column
+    event = 'Summit, London'
+    df = pd.DataFrame([
+        row(workshops=f'{event} Confirmed'),
+        row(workshops=f'2511 Barclays Intended, {event} Intended'),
+        row(workshops=f'Summit, Paris Endorsed, {event.upper()} ENDORSED'),
+        row(workshops='London Intended'),
+        row(workshops=None),
+    ])
+    tag_index = TagIndex.from_frame(df)
+
+    result = DataFrameSpeakerFilter(event).categorize_frame(df, tag_index)
+
+    assert as_dicts(result) == as_dicts(SpeakerFilter(event).categorize(df.to_dict('records')))
+    assert [len(speakers) for speakers in result] == [1, 1, 1]
+    with pytest.raises(ValueError):
+        tag_index.contains('summit, london confirmed')
+
+
+def test_duplicate_index_matches_speaker_filter():
+    df = pd.DataFrame(list(EDGE_ROWS.values()))
+    df = pd.concat([df, df])
+    assert not df.index.is_unique
+
+    result = DataFrameSpeakerFilter(EVENT).categorize_frame(df)
+
+    assert as_dicts(result) == expected(df.to_dict('records'))
+
+
+def test_missing_workshops_column():
+    df = pd.DataFrame([EDGE_ROWS['confirmed']]).drop(columns=[COLUMNS['workshops']])
+
+    assert DataFrameSpeakerFilter(EVENT).categorize_frame(df) == ([], [], [])
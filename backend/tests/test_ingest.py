@@ -0,0 +1,91 @@
+"""
+Parquet and Arrow IPC uploads are read with column projection.
+"""
+import io
+import mmap
+import tempfile
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import ingest
+from config import COLUMNS
+
+ROWS = 2000
+
+
+@pytest.fixture
+def table():
+    columns = {name: [f'{name} {i}' for i in range(ROWS)] for name in COLUMNS.values()}
+    columns['Unused notes'] = ['x' * 500] * ROWS
+    return pa.table(columns)
+
+
+def write(table, fmt):
+    """Serialize a table as 'parquet', 'arrow' (file) or 'arrow_stream'."""
+    if fmt == 'parquet':
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, row_group_size=500)
+        return buffer.getvalue()
+
+    sink = pa.BufferOutputStream()
+    open_writer = pa.ipc.new_file if fmt == 'arrow' else pa.ipc.new_stream
+    with open_writer(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=700):
+            writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+class CountingFile(io.BytesIO):
+    """In-memory file that counts the bytes read from it."""
+
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow', 'arrow_stream'])
+def test_read_speaker_table_loads_mapped_columns(table, fmt):
+    df, stats = ingest.read_speaker_table(io.BytesIO(write(table, fmt)), fmt.split('_')[0])
+
+    assert list(df.columns) == list(COLUMNS.values())
+    assert stats['columns'] == table.column_names
+    assert len(df) == ROWS
+    assert df[COLUMNS['company']].iloc[-1] == f"{COLUMNS['company']} {ROWS - 1}"
+    assert stats['memory_saved_bytes'] > 0
+
+
+def test_arrow_file_reads_only_mapped_columns(table):
+    data = write(table, 'arrow')
+    fileobj = CountingFile(data)
+
+    ingest.read_speaker_table(fileobj, 'arrow')
+
+    # The unused column is most of the file and is never read
+    unused_bytes = table.column('Unused notes').nbytes
+    assert fileobj.bytes_read < len(data) - unused_bytes
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_spooled_upload_is_mapped_and_closed(table, fmt, monkeypatch):
+    maps = []
+    open_map = mmap.mmap
+
+    def tracked_mmap(*args, **kwargs):
+        maps.append(open_map(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(ingest.mmap, 'mmap', tracked_mmap)
+
+    with tempfile.SpooledTemporaryFile(max_size=1024) as upload:
+        upload.write(write(table, fmt))
+        df, _ = ingest.read_speaker_table(upload, fmt)
+        chunks = list(ingest.iter_table_chunks(upload, fmt, chunksize=300))
+
+    assert len(maps) == 2 and all(mapped.closed for mapped in maps)
+    # Loaded values stay valid once the map and the upload are closed
+    assert df[COLUMNS['speaker_name']].iloc[0] == f"{COLUMNS['speaker_name']} 0"
+    assert max(len(chunk) for chunk in chunks) == 300
+    assert sum(len(chunk) for chunk in chunks) == ROWS
@@ -0,0 +1,61 @@
+"""
+Report files written from DataFrameSpeakerFilter output.
+"""
+import json
+import pandas as pd
+from config import COLUMNS
+from filters import DataFrameSpeakerFilter, SpeakerRecord
+from output_generator import OutputGenerator
+
+EVENT = '2511 Barclays'
+TITLE = 'Banking risk and capital markets'
+
+
+def speakers_frame():
+    rows = [
+        ('Ada', f'{EVENT} Confirmed', 95, None),
+        ('Grace', f'{EVENT} Intended', 94, 'Keynote 4.1'),
+        ('Edsger', f'{EVENT} Endorsed', float('nan'), 'Panel 3.9'),
+        ('Barbara', f'{EVENT} Intended, {EVENT} Endorsed', '93', None),
+    ]
+    return pd.DataFrame([
+        {
+            COLUMNS['speaker_name']: name,
+            COLUMNS['workshops']: workshops,
+            COLUMNS['axel_rating']: axel,
+            COLUMNS['ir_speaking_engagement']: ir,
+            COLUMNS['company']: 'Acme',
+            COLUMNS['notes_speaker_calls']: 'In sum: great on risk\nSecond line\n\nMore',
+            COLUMNS['jelena_comments']: 'In sum 4\nGood',
+            COLUMNS['abstract']: 'Managing banking risk\nHow capital markets price risk'
+        }
+        for name, workshops, axel, ir in rows
+    ])
+
+
+def test_generate_json_writes_speaker_records(tmp_path):
+    confirmed, intended, endorsed = DataFrameSpeakerFilter(EVENT).categorize_frame(
+        speakers_frame()
+    )
+    assert all(isinstance(s, SpeakerRecord) for s in intended + endorsed)
+    output_file = tmp_path / 'report.json'
+
+    OutputGenerator(EVENT, TITLE).generate_json(confirmed, intended, endorsed, output_file)
+
+    report = json.loads(output_file.read_text(encoding='utf-8'))
+    assert report['summary'] == {'confirmed_count': 1, 'intended_count': 2, 'endorsed_count': 2}
+    assert report['confirmed_speakers'] == confirmed
+    assert [s['speaker_name'] for s in report['intended_speakers']] == ['Grace', 'Barbara']
+
+    grace = report['intended_speakers'][0]
+    assert grace == {
+        **intended[0].to_dict(),
+        'content_fit_analysis': grace['content_fit_analysis']
+    }
+    assert grace['ir_rating'] == 4.1
+    assert grace['content_fit_analysis'].startswith('Strong content fit')
+
+    edsger = report['endorsed_speakers'][0]
+    assert (edsger['axel_rating'], edsger['ir_rating']) == ('', 3.9)
+    # Same two-space layout as before
+    assert output_file.read_text(encoding='utf-8').startswith('{\n  "event_name": ')
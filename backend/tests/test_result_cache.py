@@ -0,0 +1,58 @@
+"""
+Result cache sizing of stored filter responses.
+"""
+import pytest
+from config import COLUMNS
+from filters import SpeakerRecord
+from result_cache import ResultCache, estimate_size
+from text_extractor import TextExtractor
+
+RECORD = {
+    COLUMNS['speaker_name']: 'Ada',
+    COLUMNS['notes_speaker_calls']: 'In sum: strong on risk\nSecond line\n\nCalled 03/04/2025',
+    COLUMNS['jelena_comments']: 'In sum 4\nGood',
+    COLUMNS['abstract']: 'Managing risk\n' + 'Long abstract text. ' * 50,
+    COLUMNS['ir_speaking_engagement']: 'Keynote 4.2',
+    COLUMNS['axel_rating']: 95
+}
+
+
+@pytest.fixture
+def no_extraction(monkeypatch):
+    """Fail if any lazy SpeakerRecord field gets extracted."""
+    def extracted(*args):
+        raise AssertionError("field extracted")
+
+    for name in ('extract_in_sum_section', 'extract_jelena_comments',
+                 'extract_abstract_title', 'extract_ir_rating'):
+        monkeypatch.setattr(TextExtractor, name, staticmethod(extracted))
+    monkeypatch.setattr('filters.rating_flag', extracted)
+
+
+def test_speaker_record_size_does_not_extract_fields(no_extraction):
+    response = {'intended_speakers': [SpeakerRecord(RECORD, 'Intended') for _ in range(3)]}
+
+    size = estimate_size(response)
+
+    assert size > 3 * len(RECORD[COLUMNS['abstract']])
+
+
+def test_storing_a_result_set_does_not_extract_fields(no_extraction):
+    cache = ResultCache(max_bytes=1024 * 1024, ttl=60)
+    response = {'endorsed_speakers': [SpeakerRecord(RECORD, 'Endorsed')]}
+
+    cache.put('set', response)
+
+    assert cache.stats()['total_bytes'] > 0
+    assert cache.get('set') is response
+
+
+def test_speaker_record_size_counts_extracted_fields():
+    record = SpeakerRecord(RECORD, 'Intended')
+    lazy_size = record.estimated_size()
+
+    record.to_dict()
+
+    assert record.estimated_size() > lazy_size
+    enriched = record.with_analysis('Strong content fit')
+    assert enriched.estimated_size() > record.estimated_size()
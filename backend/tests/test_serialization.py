@@ -0,0 +1,54 @@
+"""
+Both JSON serializers write the same bytes, with NaN and infinity as null.
+"""
+import json
+import pytest
+from config import COLUMNS
+from filters import SpeakerRecord
+from serialization import JSON_SERIALIZERS, dumps, orjson
+
+SERIALIZERS = [name for name in JSON_SERIALIZERS if name != 'orjson' or orjson is not None]
+
+
+def strict_loads(body):
+    """Parse JSON, rejecting NaN and Infinity literals."""
+    def reject(constant):
+        raise ValueError(f"Invalid JSON constant: {constant}")
+    return json.loads(body, parse_constant=reject)
+
+
+CONTENT = {
+    'summary': {'ratio': float('nan'), 'count': 3, 'max': float('inf')},
+    'speakers': [
+        SpeakerRecord({COLUMNS['speaker_name']: 'Zoë', COLUMNS['ir_speaking_engagement']: 4.5},
+                      'Intended'),
+        {'speaker_name': 'Ada', 'score': float('-inf'), 'tags': (1.5, float('nan'))}
+    ]
+}
+
+
+@pytest.mark.parametrize('compact', [True, False])
+@pytest.mark.parametrize('serializer', SERIALIZERS)
+def test_nan_and_infinity_are_null(serializer, compact):
+    data = strict_loads(dumps(CONTENT, compact, serializer))
+
+    assert data['summary'] == {'ratio': None, 'count': 3, 'max': None}
+    assert data['speakers'][0]['speaker_name'] == 'Zoë'
+    assert data['speakers'][0]['ir_rating'] == 4.5
+    assert data['speakers'][1] == {'speaker_name': 'Ada', 'score': None, 'tags': [1.5, None]}
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_serializers_write_identical_bytes(compact):
+    if orjson is None:
+        pytest.skip("orjson is not installed")
+
+    for content in (CONTENT, {'speakers': CONTENT['speakers'][:1], 'n': 1.25}):
+        assert dumps(content, compact, 'json') == dumps(content, compact, 'orjson')
+
+
+def test_finite_values_are_unchanged():
+    content = {'rating': 3.8, 'name': 'Ada', 'flags': [True, None]}
+
+    assert dumps(content, True, 'json') == json.dumps(content, separators=(',', ':')).encode()
+    assert dumps(content, False, 'json') == json.dumps(content, indent=2).encode()
@@ -0,0 +1,95 @@
+"""
+Streamed (chunked) CSV filtering must match parsing the whole file.
+"""
+import functools
+import io
+import warnings
+import pandas as pd
+import pytest
+import ingest
+import pipeline
+from config import COLUMNS
+from filters import DataFrameSpeakerFilter
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    from fastapi.testclient import TestClient
+
+import api
+
+EVENT = '2511 Barclays'
+ROWS = 45
+CHUNK_ROWS = 7
+
+STATUSES = ['Confirmed', 'Intended', 'Endorsed', 'Intended, 2511 Barclays not reached', None]
+
+
+@pytest.fixture(scope='module')
+def csv_bytes():
+    records = [
+        {
+            COLUMNS['speaker_name']: f'Speaker {i}',
+            COLUMNS['workshops']: None if STATUSES[i % 5] is None else f'{EVENT} {STATUSES[i % 5]}',
+            COLUMNS['axel_rating']: 91 + i % 5,
+            COLUMNS['ir_speaking_engagement']: f'Keynote {3 + i % 10 / 10}',
+            COLUMNS['region']: ['EU', 'US', 'Asia', None][i % 4],
+            COLUMNS['company']: 'Acme',
+            COLUMNS['notes_speaker_calls']: f'In sum: speaker {i}\nGood fit',
+            COLUMNS['abstract']: 'Banking risk and capital markets',
+            'Unused notes': 'x' * 20
+        }
+        for i in range(ROWS - 1)
+    ]
+    # An eligible endorsed speaker in the last, partial chunk
+    records.append(dict(records[2], **{
+        COLUMNS['speaker_name']: 'Last speaker',
+        COLUMNS['axel_rating']: 95,
+        COLUMNS['region']: 'EU'
+    }))
+    return pd.DataFrame(records).to_csv(index=False).encode('utf-8')
+
+
+def as_dicts(categorized):
+    return [[dict(speaker) for speaker in speakers] for speakers in categorized]
+
+
+def test_chunks_cover_every_row(csv_bytes):
+    chunks = list(ingest.iter_csv_chunks(io.BytesIO(csv_bytes), CHUNK_ROWS))
+
+    assert [len(chunk) for chunk in chunks] == [CHUNK_ROWS] * (ROWS // CHUNK_ROWS) + [ROWS % CHUNK_ROWS]
+    assert 'Unused notes' not in chunks[0].columns
+    assert pd.concat(chunks)[COLUMNS['speaker_name']].tolist()[-1] == 'Last speaker'
+
+
+def test_categorize_csv_stream_matches_whole_file(csv_bytes):
+    df, _ = ingest.read_speaker_csv(io.BytesIO(csv_bytes))
+    expected = as_dicts(DataFrameSpeakerFilter(EVENT).categorize_frame(df))
+
+    confirmed, intended, endorsed, row_count = ingest.categorize_csv_stream(
+        io.BytesIO(csv_bytes), DataFrameSpeakerFilter(EVENT), chunksize=CHUNK_ROWS
+    )
+
+    assert row_count == ROWS
+    assert as_dicts((confirmed, intended, endorsed)) == expected
+    # The match in the last chunk is kept
+    assert endorsed[-1]['speaker_name'] == 'Last speaker'
+    assert all(len(speakers) > 0 for speakers in expected)
+
+
+def test_stream_endpoint_matches_whole_file(csv_bytes, monkeypatch):
+    monkeypatch.setattr(pipeline, 'categorize_csv_stream',
+                        functools.partial(ingest.categorize_csv_stream, chunksize=CHUNK_ROWS))
+    client = TestClient(api.app)
+
+    def post(stream):
+        response = client.post('/api/filter-speakers-csv',
+                               params={'event_name': EVENT, 'stream': stream},
+                               files={'file': ('speakers.csv', csv_bytes)})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        body.pop('generated_at')
+        return body
+
+    streamed = post(True)
+    assert streamed == post(False)
+    assert streamed['endorsed_speakers'][-1]['speaker_name'] == 'Last speaker'
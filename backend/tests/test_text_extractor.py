@@ -0,0 +1,108 @@
+"""
+The batch extractors must return what the per-record ones return.
+"""
+import math
+import numpy as np
+import pandas as pd
+import pytest
+from filters import safe_str
+from text_extractor import EventKeywordMatcher, TextExtractor
+
+EDGE_VALUES = {
+    'none': None,
+    'nan': float('nan'),
+    'numpy_nan': np.nan,
+    'pd_na': pd.NA,
+    'empty': '',
+    'whitespace': '  \n ',
+    'zero': 0,
+    'float_zero': 0.0,
+    'int': 5,
+    'numpy_int': np.int64(3),
+    'float': 4.2,
+    'numpy_float': np.float64(3.9),
+    'bool': True,
+    'numeric_text': '4.2',
+    'zero_text': '0',
+    'rating_text': 'Keynote at Summit, rated 3.9 of 5',
+    'in_sum_notes': 'Called 03/04/2025\nIN SUM:  strong speaker\n one\ntwo\n\nMore',
+    'jelena_text': 'insum: 4.5\n  Knows the topic\nThird line',
+    'axel_text': 'First\n25: keynote\n25 panel',
+    'long_line': 'x' * 250,
+}
+
+TEXT_EXTRACTORS = [
+    'extract_in_sum_section',
+    'extract_jelena_comments',
+    'extract_abstract_title',
+    'extract_axel_25_line',
+]
+
+
+@pytest.mark.parametrize('name', TEXT_EXTRACTORS)
+@pytest.mark.parametrize('key', EDGE_VALUES)
+def test_text_batch_matches_per_record(name, key):
+    value = EDGE_VALUES[key]
+    single = getattr(TextExtractor, name)
+    batch = getattr(TextExtractor, f'{name}_many')
+
+    expected = single(safe_str(value))
+
+    assert batch([value]) == [expected]
+    assert batch(pd.Series([value], dtype=object)) == [expected]
+
+
+@pytest.mark.parametrize('name', TEXT_EXTRACTORS)
+def test_text_batch_of_mixed_values(name):
+    values = list(EDGE_VALUES.values())
+    single = getattr(TextExtractor, name)
+    batch = getattr(TextExtractor, f'{name}_many')
+
+    assert batch(values) == [single(safe_str(value)) for value in values]
+    assert batch([]) == []
+
+
+def expected_ir_rating(value):
+    if value is pd.NA:
+        return None
+    rating = TextExtractor.extract_ir_rating(value)
+    # The batch version gives None where the scalar one returns nan
+    return None if rating is not None and math.isnan(rating) else rating
+
+
+@pytest.mark.parametrize('key', EDGE_VALUES)
+def test_ir_rating_batch_matches_per_record(key):
+    value = EDGE_VALUES[key]
+
+    assert TextExtractor.extract_ir_rating_many([value]) == [expected_ir_rating(value)]
+
+
+@pytest.mark.parametrize('values', [
+    list(EDGE_VALUES.values()),
+    [0, 4, 3.9, float('nan')],
+    [None, '4.2', 'n/a', ''],
+    pd.Series([0, 4.5, None]),
+], ids=['mixed', 'numeric', 'text', 'series'])
+def test_ir_rating_batch_of_mixed_values(values):
+    assert TextExtractor.extract_ir_rating_many(values) == [
+        expected_ir_rating(value) for value in list(values)
+    ]
+
+
+def test_ir_rating_scalar_nan_differences():
+    assert math.isnan(TextExtractor.extract_ir_rating(float('nan')))
+    with pytest.raises(TypeError):
+        TextExtractor.extract_ir_rating(pd.NA)
+    assert TextExtractor.extract_ir_rating_many([float('nan'), pd.NA]) == [None, None]
+
+
+@pytest.mark.parametrize('title', ['Banking risk, capital markets and liquidity', '', None])
+def test_content_fit_batch_matches_per_record(title):
+    matcher = EventKeywordMatcher(title)
+    values = list(EDGE_VALUES.values()) + [
+        'Banking risk in capital markets', 'Liquidity only', 'BANKING and Markets'
+    ]
+
+    assert matcher.content_fit_analysis_many(values) == [
+        matcher.content_fit_analysis(safe_str(value)) for value in values
+    ]
@@ -2,10 +2,61 @@
 Text extraction utilities for parsing notes and comments.
 """
 import re
+import pandas as pd
+
+# Patterns are compiled once at import and shared by all extractors
+IN_SUM_PATTERN = re.compile(r'In sum[:\s]+(.*?)(?:\n\n|\n[A-Z]|$)', re.IGNORECASE | re.DOTALL)
+DATE_PATTERN = re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|[A-Z][a-z]+ \d{1,2},? \d{4})')
+JELENA_RATING_PATTERN = re.compile(r'[Ii]n?\s*sum[:\s]*(\d+(?:\.\d+)?)')
+IR_RATING_PATTERN = re.compile(r'(\d+\.\d+|\d+)')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+def _as_texts(values):
+    """
+    Normalize values for batch extraction.
+    
+    Text extraction is a regex search per value either way, and a loop over
+    the precompiled patterns is faster than pandas' object-dtype str.extract,
+    so the text batch variants iterate instead of going through pandas.
+    
+    Args:
+        values: pandas Series or list of text values
+        
+    Returns:
+        list: Strings, with NaN/NA/None as empty strings
+    """
+    return [
+        value if isinstance(value, str) else ('' if value is None or pd.isna(value) else str(value))
+        for value in values
+    ]
+
+
+def _to_list(series):
+    """
+    Convert a batch result to a list, with NaN as None.
+    
+    Args:
+        series: Batch extraction result
+        
+    Returns:
+        list: Values, None where nothing was extracted
+    """
+    series = series.astype(object)
+    return series.where(series.notna(), None).tolist()
 
 
 class TextExtractor:
-    """Utilities for extracting specific sections from text fields."""
+    """
+    Utilities for extracting specific sections from text fields.
+    
+    The *_many batch versions return, for each value, what the per-record
+    version returns for safe_str(value), which is how speaker records call
+    them. They therefore accept any value: NaN, pd.NA and None count as
+    empty text and other non-strings are converted with str(), where the
+    per-record text versions raise or treat a falsy number such as 0 as
+    empty.
+    """
     
     @staticmethod
     def extract_in_sum_section(notes_text):
@@ -22,8 +73,7 @@ class TextExtractor:
             return None, None
         
         # Look for "In sum" section (case insensitive)
-        in_sum_pattern = r'In sum[:\s]+(.*?)(?:\n\n|\n[A-Z]|$)'
-        match = re.search(in_sum_pattern, notes_text, re.IGNORECASE | re.DOTALL)
+        match = IN_SUM_PATTERN.search(notes_text)
         
         in_sum_content = None
         if match:
@@ -34,8 +84,7 @@ class TextExtractor:
                 in_sum_content = '\n'.join(lines[:2])
         
         # Try to extract date (various formats)
-        date_pattern = r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|[A-Z][a-z]+ \d{1,2},? \d{4})'
-        date_match = re.search(date_pattern, notes_text)
+        date_match = DATE_PATTERN.search(notes_text)
         date_of_call = date_match.group(1) if date_match else None
         
         return in_sum_content, date_of_call
@@ -55,8 +104,7 @@ class TextExtractor:
             return None, None
         
         # Look for "INsum" or "In sum" with rating (number)
-        rating_pattern = r'[Ii]n?\s*sum[:\s]*(\d+(?:\.\d+)?)'
-        rating_match = re.search(rating_pattern, jelena_text)
+        rating_match = JELENA_RATING_PATTERN.search(jelena_text)
         rating = rating_match.group(1) if rating_match else None
         
         # Get first two lines
@@ -129,8 +177,7 @@ class TextExtractor:
             return float(ir_engagement_text)
         
         # Try to extract number from text
-        rating_pattern = r'(\d+\.\d+|\d+)'
-        match = re.search(rating_pattern, str(ir_engagement_text))
+        match = IR_RATING_PATTERN.search(str(ir_engagement_text))
         if match:
             try:
                 return float(match.group(1))
@@ -139,6 +186,93 @@ class TextExtractor:
         
         return None
     
+    @staticmethod
+    def extract_in_sum_section_many(notes_texts):
+        """
+        Batch version of extract_in_sum_section.
+        
+        Args:
+            notes_texts: pandas Series or list of call notes
+            
+        Returns:
+            list: (in_sum_section, date_of_call) tuples, one per input
+        """
+        return [TextExtractor.extract_in_sum_section(text) for text in _as_texts(notes_texts)]
+    
+    @staticmethod
+    def extract_jelena_comments_many(jelena_texts):
+        """
+        Batch version of extract_jelena_comments.
+        
+        Args:
+            jelena_texts: pandas Series or list of Jelena's comments
+            
+        Returns:
+            list: (rating, first_two_lines) tuples, one per input
+        """
+        return [TextExtractor.extract_jelena_comments(text) for text in _as_texts(jelena_texts)]
+    
+    @staticmethod
+    def extract_abstract_title_many(abstract_texts):
+        """
+        Batch version of extract_abstract_title.
+        
+        Args:
+            abstract_texts: pandas Series or list of abstracts
+            
+        Returns:
+            list: Extracted titles, one per input
+        """
+        return [TextExtractor.extract_abstract_title(text) for text in _as_texts(abstract_texts)]
+    
+    @staticmethod
+    def extract_axel_25_line_many(axel_input_texts):
+        """
+        Batch version of extract_axel_25_line.
+        
+        Args:
+            axel_input_texts: pandas Series or list of Axel's input
+            
+        Returns:
+            list: First line containing '25:' or None, one per input
+        """
+        return [TextExtractor.extract_axel_25_line(text) for text in _as_texts(axel_input_texts)]
+    
+    @staticmethod
+    def extract_ir_rating_many(ir_engagement_values):
+        """
+        Batch version of extract_ir_rating.
+        
+        Values are not stringified first, so numbers keep their value as in
+        extract_ir_rating. Unlike it, NaN and pd.NA give None (the scalar
+        version returns nan for NaN and raises on pd.NA).
+        
+        Args:
+            ir_engagement_values: pandas Series or list of texts or numbers
+            
+        Returns:
+            list: Rating values or None, one per input
+        """
+        series = pd.Series(list(ir_engagement_values))
+        
+        if pd.api.types.is_numeric_dtype(series):
+            ratings = series.astype(float)
+            # Zero is falsy and has no rating, as in extract_ir_rating
+            return _to_list(ratings.where(ratings != 0))
+        
+        is_text = series.map(lambda value: isinstance(value, str))
+        ratings = (
+            series.where(is_text)
+            .str.extract(IR_RATING_PATTERN, expand=False)
+            .astype(float)
+        )
+        
+        # Numbers mixed into text are used as-is, except falsy zero
+        numbers = pd.to_numeric(series[~is_text], errors='coerce').astype(float)
+        ratings[~is_text] = numbers.where(numbers != 0)
+        
+        return _to_list(ratings)
+    
     @staticmethod
     def generate_content_fit_analysis(abstract_text, event_title, max_words=50):
         """
@@ -152,19 +286,67 @@ class TextExtractor:
         Returns:
             str: Brief analysis
         """
-        if not abstract_text or not event_title:
-            return "Content fit analysis not available due to missing information."
+        return EventKeywordMatcher(event_title).content_fit_analysis(abstract_text)
+
+
+class EventKeywordMatcher:
+    """
+    Event title keywords compiled once and matched against many abstracts.
+    
+    Build one per event and reuse it for every speaker, so the event title
+    is tokenized once instead of once per speaker.
+    """
+    
+    # Words skipped when extracting keywords from the event title
+    STOP_WORDS = ('this', 'that', 'with', 'from', 'will')
+    
+    def __init__(self, event_title):
+        """
+        Extract and compile the keywords of an event title.
         
-        # Simple keyword matching analysis (can be enhanced with NLP/AI)
-        abstract_lower = abstract_text.lower()
-        event_lower = event_title.lower()
+        Args:
+            event_title: Event title
+        """
+        self.event_title = event_title
         
         # Extract key terms from event title (words longer than 3 chars)
-        event_keywords = [word for word in re.findall(r'\b\w+\b', event_lower) 
-                         if len(word) > 3 and word not in ['this', 'that', 'with', 'from', 'will']]
+        event_lower = (event_title or '').lower()
+        self.keywords = [word for word in WORD_PATTERN.findall(event_lower)
+                         if len(word) > 3 and word not in self.STOP_WORDS]
+        
+    def find_matches(self, abstract_text):
+        """
+        Find the event keywords contained in an abstract.
+        
+        Args:
+            abstract_text: Speaker's abstract
+            
+        Returns:
+            list: Matched keywords in event title order
+        """
+        if not abstract_text:
+            return []
+        
+        # A substring test per keyword runs at C speed and measured several
+        # times faster than a single regex alternation scan over the abstract
+        abstract_lower = abstract_text.lower()
+        return [kw for kw in self.keywords if kw in abstract_lower]
+    
+    def content_fit_analysis(self, abstract_text):
+        """
+        Generate a brief analysis of content fit for one abstract.
+        
+        Args:
+            abstract_text: Speaker's abstract
+            
+        Returns:
+            str: Brief analysis
+        """
+        if not abstract_text or not self.event_title:
+            return "Content fit analysis not available due to missing information."
         
         # Check for keyword matches
-        matches = [kw for kw in event_keywords if kw in abstract_lower]
+        matches = self.find_matches(abstract_text)
         
         if len(matches) >= 2:
             return f"Strong content fit: Speaker's expertise aligns with event focus on {', '.join(matches[:3])}. Abstract demonstrates relevant experience."
@@ -172,5 +354,15 @@ class TextExtractor:
             return f"Moderate fit: Abstract touches on {matches[0]}, relevant to event theme. May need to confirm specific angle."
         else:
             return "Content fit requires review: Abstract covers different focus area. Recommend verifying alignment with event objectives."
-
-
+    
+    def content_fit_analysis_many(self, abstract_texts):
+        """
+        Batch version of content_fit_analysis.
+        
+        Args:
+            abstract_texts: pandas Series or list of abstracts
+            
+        Returns:
+            list: Brief analyses, one per input
+        """
+        return [self.content_fit_analysis(text) for text in _as_texts(abstract_texts)]
@@ -12,6 +12,19 @@ AIRTABLE_API_KEY = os.getenv('AIRTABLE_API_KEY')
 AIRTABLE_BASE_ID = os.getenv('AIRTABLE_BASE_ID')
 AIRTABLE_TABLE_NAME = os.getenv('AIRTABLE_TABLE_NAME')
 
+# Airtable API endpoint; point it at a local stand-in to test offline
+AIRTABLE_ENDPOINT_URL = os.getenv('AIRTABLE_ENDPOINT_URL', 'https://api.airtable.com')
+
+# Pages downloaded ahead of filtering when streaming records
+AIRTABLE_PREFETCH_PAGES = int(os.getenv('AIRTABLE_PREFETCH_PAGES', 4))
+
+# Async client: requests per second per base (Airtable allows 5), retries
+# on 429/5xx, and exponential backoff bounds in seconds
+AIRTABLE_RATE_LIMIT = float(os.getenv('AIRTABLE_RATE_LIMIT', 5))
+AIRTABLE_MAX_RETRIES = int(os.getenv('AIRTABLE_MAX_RETRIES', 5))
+AIRTABLE_BACKOFF_BASE = float(os.getenv('AIRTABLE_BACKOFF_BASE', 1.0))
+AIRTABLE_BACKOFF_MAX = float(os.getenv('AIRTABLE_BACKOFF_MAX', 30.0))
+
 # Column names in Airtable
 COLUMNS = {
     'workshops': 'Workshops',
@@ -34,6 +47,9 @@ IR_RATING_THRESHOLD = 3.8
 # Region filters for Intended/Endorsed
 EXCLUDED_REGIONS = ['Asia', 'US']
 
+# Local snapshot of the Airtable table for incremental sync (SQLite file)
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', 'airtable_snapshot.sqlite3')
 
-
-
+# Seconds re-checked before the previous sync time, to cover clock skew
+# between this machine and Airtable
+SYNC_OVERLAP_SECONDS = int(os.getenv('SYNC_OVERLAP_SECONDS', 300))
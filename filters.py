@@ -22,6 +22,133 @@ class SpeakerFilter:
         """
         self.event_name = event_name
         self.text_extractor = TextExtractor()
+        
+        # Lowercased tags, computed once and reused for every record
+        self._confirmed_tag = f"{event_name} Confirmed".lower()
+        self._intended_tag = f"{event_name} Intended".lower()
+        self._endorsed_tag = f"{event_name} Endorsed".lower()
+        self._not_reached_tag = f"{event_name} not reached".lower()
+        self._not_available_tag = f"{event_name} not available".lower()
+    
+    def categorize(self, records):
+        """
+        Categorize records into confirmed, intended and endorsed speakers
+        in a single pass.
+        
+        Each cell is normalized once per record, and the don't-contact and
+        rating checks run at most once per record. Results are identical to
+        calling filter_confirmed, filter_intended and filter_endorsed.
+        
+        Args:
+            records: List of all speaker records
+            
+        Returns:
+            tuple: (confirmed, intended, endorsed) lists of speakers
+        """
+        confirmed = []
+        intended = []
+        endorsed = []
+        
+        for record in records:
+            workshops_lower = self._workshops_text(record)
+            if not workshops_lower:
+                continue
+            
+            is_confirmed, is_intended, is_endorsed = self._match_tags(workshops_lower)
+            
+            if is_confirmed:
+                confirmed.append(self._build_confirmed_speaker_info(record))
+            
+            if not (is_intended or is_endorsed):
+                continue
+            
+            if not self._is_eligible(record):
+                continue
+            
+            if is_intended:
+                intended.append(self._build_detailed_speaker_info(record, 'Intended'))
+            if is_endorsed:
+                endorsed.append(self._build_detailed_speaker_info(record, 'Endorsed'))
+        
+        return confirmed, intended, endorsed
+    
+    @staticmethod
+    def _workshops_text(record):
+        """
+        Get the lowercased Workshops value of a record.
+        
+        Args:
+            record: Speaker record
+            
+        Returns:
+            str: Lowercased tags, empty if the record has none
+        """
+        workshops = record.get(COLUMNS['workshops'], '')
+        if not workshops:
+            return ''
+        
+        # Convert to string for checking
+        if isinstance(workshops, list):
+            return ' '.join(str(w) for w in workshops).lower()
+        return str(workshops).lower()
+    
+    def _match_tags(self, workshops_lower):
+        """
+        Check a record's lowercased tags against this event.
+        
+        Args:
+            workshops_lower: Lowercased Workshops value
+            
+        Returns:
+            tuple: (is_confirmed, is_intended, is_endorsed)
+        """
+        is_intended = (
+            self._intended_tag in workshops_lower
+            and self._not_reached_tag not in workshops_lower
+            and self._not_available_tag not in workshops_lower
+        )
+        return (
+            self._confirmed_tag in workshops_lower,
+            is_intended,
+            self._endorsed_tag in workshops_lower
+        )
+    
+    def _is_eligible(self, record):
+        """
+        Check the event-independent Intended/Endorsed requirements.
+        
+        Args:
+            record: Speaker record
+            
+        Returns:
+            bool: True if not marked DON'T CONTACT and passes rating filters
+        """
+        # Check activity notes for DON'T CONTACT
+        activity_notes = record.get(COLUMNS['activity_notes'], '')
+        if activity_notes:
+            activity_lower = str(activity_notes).lower()
+            if "don't contact" in activity_lower or "do not contact" in activity_lower:
+                return False
+        
+        # Apply rating filters
+        return self._passes_rating_filter(record)
+    
+    def _build_confirmed_speaker_info(self, record):
+        """
+        Build speaker information for the Confirmed category.
+        
+        Args:
+            record: Speaker record
+            
+        Returns:
+            dict: Confirmed speaker information
+        """
+        return {
+            'speaker_name': record.get(COLUMNS['speaker_name'], 'Unknown'),
+            'tag': f"{self.event_name} Confirmed",
+            'company': record.get(COLUMNS['company'], ''),
+            'category': 'Confirmed'
+        }
     
     def filter_confirmed(self, records):
         """
@@ -249,3 +376,73 @@ class SpeakerFilter:
         
         return speaker_info
 
+
+class MultiEventFilter:
+    """Categorizes speaker records for several events in one pass."""
+    
+    def __init__(self, event_names):
+        """
+        Initialize one filter per event.
+        
+        Args:
+            event_names: Event name tags (e.g., ["2511 Barclays", "2512 HSBC"])
+        """
+        # Duplicate names would share one result; keep the first occurrence
+        self.filters = [SpeakerFilter(event_name) for event_name in dict.fromkeys(event_names)]
+    
+    def categorize(self, records, results=None):
+        """
+        Categorize records into confirmed, intended and endorsed speakers
+        for every event in a single pass.
+        
+        Each record's tags are normalized once, the don't-contact and rating
+        checks run at most once, and the detailed fields are extracted once
+        and shared by every event the record qualifies for. Results are
+        identical to calling SpeakerFilter.categorize per event.
+        
+        Records arriving in batches (e.g. Airtable pages) can be categorized
+        as they come by passing the previous return value as results.
+        
+        Args:
+            records: List of speaker records
+            results: Optional results of a previous call to extend
+            
+        Returns:
+            dict: {event_name: (confirmed, intended, endorsed)}
+        """
+        if results is None:
+            results = {f.event_name: ([], [], []) for f in self.filters}
+        
+        for record in records:
+            workshops_lower = SpeakerFilter._workshops_text(record)
+            if not workshops_lower:
+                continue
+            
+            eligible = None
+            detailed_info = None
+            
+            for speaker_filter in self.filters:
+                confirmed, intended, endorsed = results[speaker_filter.event_name]
+                is_confirmed, is_intended, is_endorsed = speaker_filter._match_tags(workshops_lower)
+                
+                if is_confirmed:
+                    confirmed.append(speaker_filter._build_confirmed_speaker_info(record))
+                
+                if not (is_intended or is_endorsed):
+                    continue
+                
+                if eligible is None:
+                    eligible = speaker_filter._is_eligible(record)
+                if not eligible:
+                    continue
+                
+                # Only the category differs between events, so extract once
+                if detailed_info is None:
+                    detailed_info = speaker_filter._build_detailed_speaker_info(record, '')
+                
+                if is_intended:
+                    intended.append(dict(detailed_info, category='Intended'))
+                if is_endorsed:
+                    endorsed.append(dict(detailed_info, category='Endorsed'))
+        
+        return results
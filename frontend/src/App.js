@@ -63,6 +63,7 @@ function App() {
   const [results, setResults] = useState(null);
   const [loading, setLoading] = useState(false);
   const [selectedFile, setSelectedFile] = useState(null);
+  const [datasetId, setDatasetId] = useState(null);
   const [snackbar, setSnackbar] = useState({
     open: false,
     message: '',
@@ -71,6 +72,7 @@ function App() {
 
   const handleFileSelect = (file) => {
     setSelectedFile(file);
+    setDatasetId(null);
     setResults(null); // Clear previous results
     setSnackbar({
       open: true,
@@ -80,10 +82,31 @@ function App() {
   };
 
   const handleFileClear = () => {
+    if (datasetId) {
+      api.deleteDataset(datasetId).catch(() => {});
+    }
     setSelectedFile(null);
+    setDatasetId(null);
     setResults(null);
   };
 
+  const uploadDataset = async () => {
+    const response = await api.uploadCSV(selectedFile);
+    setDatasetId(response.data.dataset_id);
+    return response.data.dataset_id;
+  };
+
+  // Upload the file once and reuse it server-side; re-upload if it expired
+  const withDataset = async (request) => {
+    const id = datasetId || await uploadDataset();
+    try {
+      return await request(id);
+    } catch (error) {
+      if (error.response?.status !== 404) throw error;
+      return request(await uploadDataset());
+    }
+  };
+
   const handleFilter = async (eventName, eventTitle) => {
     if (!selectedFile) {
       setSnackbar({
@@ -96,7 +119,9 @@ function App() {
 
     setLoading(true);
     try {
-      const response = await api.filterSpeakersCSV(eventName, eventTitle, selectedFile);
+      const response = await withDataset((id) =>
+        api.createResultSet(id, eventName, eventTitle)
+      );
       setResults(response.data);
       setSnackbar({
         open: true,
@@ -115,15 +140,37 @@ function App() {
     }
   };
 
+  // Next page of a category; an expired result set is rebuilt under the
+  // same ID, so the cursor stays valid
+  const handleLoadMore = async (category, cursor) => {
+    const getPage = () => api.getResultPage(results.result_set_id, category, cursor);
+    try {
+      try {
+        return (await getPage()).data;
+      } catch (error) {
+        if (error.response?.status !== 404) throw error;
+        await withDataset((id) =>
+          api.createResultSet(id, results.event_name, results.event_title)
+        );
+        return (await getPage()).data;
+      }
+    } catch (error) {
+      setSnackbar({
+        open: true,
+        message: error.response?.data?.detail || 'Error loading speakers',
+        severity: 'error'
+      });
+      console.error('Error loading speakers:', error);
+      return null;
+    }
+  };
+
   const handleExport = async (format) => {
     if (!results || !selectedFile) return;
     
     try {
-      await api.exportSpeakersCSV(
-        format,
-        results.event_name,
-        results.event_title,
-        selectedFile
+      await withDataset((id) =>
+        api.exportDataset(format, id, results.event_name, results.event_title)
       );
       setSnackbar({
         open: true,
@@ -171,6 +218,7 @@ function App() {
             <Results 
               results={results} 
               onExport={handleExport}
+              onLoadMore={handleLoadMore}
             />
           )}
         </Container>
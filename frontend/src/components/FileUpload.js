@@ -11,14 +11,17 @@ import CloudUploadIcon from '@mui/icons-material/CloudUpload';
 import DeleteIcon from '@mui/icons-material/Delete';
 import CheckCircleIcon from '@mui/icons-material/CheckCircle';
 
+const SUPPORTED_EXTENSIONS = ['.csv', '.csv.gz', '.csv.zst', '.parquet', '.arrow', '.feather', '.ipc'];
+
 function FileUpload({ onFileSelect, selectedFile, onFileClear }) {
   const [dragActive, setDragActive] = useState(false);
   const [fileInfo, setFileInfo] = useState(null);
 
   const handleFile = useCallback((file) => {
-    // Check if file is CSV
-    if (!file.name.endsWith('.csv')) {
-      alert('Please upload a CSV file');
+    // Check if file is CSV, Parquet or Arrow IPC
+    const name = file.name.toLowerCase();
+    if (!SUPPORTED_EXTENSIONS.some((extension) => name.endsWith(extension))) {
+      alert('Please upload a CSV, Parquet or Arrow file');
       return;
     }
 
@@ -109,7 +112,7 @@ function FileUpload({ onFileSelect, selectedFile, onFileClear }) {
         >
           <CloudUploadIcon sx={{ fontSize: 64, color: 'primary.main', mb: 2 }} />
           <Typography variant="h6" gutterBottom>
-            Drop your CSV file here
+            Drop your CSV, Parquet or Arrow file here
           </Typography>
           <Typography variant="body2" color="text.secondary" gutterBottom>
             or click to browse
@@ -121,7 +124,7 @@ function FileUpload({ onFileSelect, selectedFile, onFileClear }) {
           <input
             id="fileInput"
             type="file"
-            accept=".csv"
+            accept={SUPPORTED_EXTENSIONS.join(',')}
             onChange={handleChange}
             style={{ display: 'none' }}
           />
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import {
   Paper,
   Box,
@@ -21,16 +21,49 @@ function TabPanel({ children, value, index }) {
   );
 }
 
-function Results({ results, onExport }) {
+function Results({ results, onExport, onLoadMore }) {
   const [currentTab, setCurrentTab] = useState(0);
+  const [pages, setPages] = useState(results?.pages);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  useEffect(() => {
+    setPages(results?.pages);
+  }, [results]);
+
+  // Append the next page of a category to the speakers loaded so far
+  const handleLoadMore = async (category) => {
+    setLoadingMore(true);
+    try {
+      const page = await onLoadMore(category, pages[category].next_cursor);
+      if (page) {
+        setPages((prev) => ({
+          ...prev,
+          [category]: { ...page, speakers: [...prev[category].speakers, ...page.speakers] },
+        }));
+      }
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const handleTabChange = (event, newValue) => {
     setCurrentTab(newValue);
   };
 
-  if (!results) return null;
+  if (!results || !pages) return null;
 
-  const { summary, confirmed_speakers, intended_speakers, endorsed_speakers } = results;
+  const { summary } = results;
+
+  const renderList = (category) => (
+    <SpeakerList
+      speakers={pages[category].speakers}
+      category={category}
+      totalCount={pages[category].total_count}
+      hasMore={Boolean(pages[category].next_cursor)}
+      loadingMore={loadingMore}
+      onLoadMore={() => handleLoadMore(category)}
+    />
+  );
 
   return (
     <Paper elevation={2} sx={{ p: 4, borderRadius: 3 }}>
@@ -117,15 +150,15 @@ function Results({ results, onExport }) {
 
       {/* Tab Panels */}
       <TabPanel value={currentTab} index={0}>
-        <SpeakerList speakers={confirmed_speakers} category="confirmed" />
+        {renderList('confirmed')}
       </TabPanel>
       
       <TabPanel value={currentTab} index={1}>
-        <SpeakerList speakers={intended_speakers} category="intended" />
+        {renderList('intended')}
       </TabPanel>
       
       <TabPanel value={currentTab} index={2}>
-        <SpeakerList speakers={endorsed_speakers} category="endorsed" />
+        {renderList('endorsed')}
       </TabPanel>
     </Paper>
   );
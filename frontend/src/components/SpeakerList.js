@@ -1,8 +1,8 @@
 import React from 'react';
-import { Box, Typography } from '@mui/material';
+import { Box, Button, Typography } from '@mui/material';
 import SpeakerCard from './SpeakerCard';
 
-function SpeakerList({ speakers, category }) {
+function SpeakerList({ speakers, category, totalCount, hasMore, loadingMore, onLoadMore }) {
   if (!speakers || speakers.length === 0) {
     return (
       <Box sx={{ textAlign: 'center', py: 6 }}>
@@ -23,6 +23,18 @@ function SpeakerList({ speakers, category }) {
           index={index + 1}
         />
       ))}
+
+      {/* Further pages are loaded on request */}
+      <Box sx={{ textAlign: 'center', py: 2 }}>
+        <Typography variant="body2" color="text.secondary" gutterBottom>
+          Showing {speakers.length} of {totalCount ?? speakers.length} {category} speakers
+        </Typography>
+        {hasMore && (
+          <Button variant="outlined" onClick={onLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </Button>
+        )}
+      </Box>
     </Box>
   );
 }
@@ -10,12 +10,13 @@ const apiClient = axios.create({
 });
 
 const api = {
-  // Upload and preview CSV file
-  uploadCSV: (file) => {
+  // Upload and preview CSV file; pass a progressId to follow it with watchProgress
+  uploadCSV: (file, progressId = null) => {
     const formData = new FormData();
     formData.append('file', file);
     
-    return apiClient.post('/api/upload-csv', formData, {
+    const query = progressId ? `?progress_id=${encodeURIComponent(progressId)}` : '';
+    return apiClient.post(`/api/upload-csv${query}`, formData, {
       headers: {
         'Content-Type': 'multipart/form-data',
       },
@@ -61,6 +62,112 @@ const api = {
     return response;
   },
 
+  // Filter speakers from a previously uploaded dataset
+  filterDataset: (datasetId, eventName, eventTitle = '', progressId = null) => {
+    const query = progressId ? `&progress_id=${encodeURIComponent(progressId)}` : '';
+    return apiClient.post(`/api/datasets/${datasetId}/filter?event_name=${encodeURIComponent(eventName)}&event_title=${encodeURIComponent(eventTitle)}${query}`);
+  },
+
+  // Filter a previously uploaded dataset into a paginated result set; returns
+  // the summary and the first page of each category. The list view only
+  // needs the summary fields; full texts come from getSpeakerDetail
+  createResultSet: (datasetId, eventName, eventTitle = '', limit = 50, view = 'summary') => {
+    return apiClient.post(`/api/datasets/${datasetId}/result-sets?event_name=${encodeURIComponent(eventName)}&event_title=${encodeURIComponent(eventTitle)}&limit=${limit}&view=${view}`);
+  },
+
+  // Get the page after cursor of one category of a result set
+  getResultPage: (resultSetId, category, cursor = null, limit = 50, view = 'summary') => {
+    return apiClient.get(`/api/result-sets/${resultSetId}/${category}`, {
+      params: { cursor, limit, view },
+    });
+  },
+
+  // Get every field of the speaker at a position (page offset + index) of a category
+  getSpeakerDetail: (resultSetId, category, position) => {
+    return apiClient.get(`/api/result-sets/${resultSetId}/${category}/${position}`);
+  },
+
+  // Filter several events from a previously uploaded dataset in one call
+  filterDatasetEvents: (datasetId, events) => {
+    return apiClient.post(`/api/datasets/${datasetId}/filter-events`, { events });
+  },
+
+  // List the events tagged in a previously uploaded dataset
+  getDatasetEvents: (datasetId) => {
+    return apiClient.get(`/api/datasets/${datasetId}/events`);
+  },
+
+  // Export speakers from a previously uploaded dataset
+  exportDataset: async (format, datasetId, eventName, eventTitle = '') => {
+    const response = await apiClient.post(`/api/datasets/${datasetId}/export/${format}?event_name=${encodeURIComponent(eventName)}&event_title=${encodeURIComponent(eventTitle)}`, null, {
+      responseType: 'blob',
+    });
+
+    // Create download link
+    const url = window.URL.createObjectURL(new Blob([response.data]));
+    const link = document.createElement('a');
+    link.href = url;
+    
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+    link.setAttribute('download', `speaker_report_${timestamp}.${format}`);
+    
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    
+    return response;
+  },
+
+  // Release a previously uploaded dataset
+  deleteDataset: (datasetId) => {
+    return apiClient.delete(`/api/datasets/${datasetId}`);
+  },
+
+  // Submit a filter run (format omitted) or an export run as a background job
+  submitJob: (datasetId, eventName, eventTitle = '', format = null) => {
+    return apiClient.post('/api/jobs', {
+      dataset_id: datasetId,
+      event_name: eventName,
+      event_title: eventTitle,
+      format,
+    });
+  },
+
+  // Get the status and stage progress of a background job
+  getJob: (jobId) => {
+    return apiClient.get(`/api/jobs/${jobId}`);
+  },
+
+  // Get the result of a completed background job
+  getJobResult: (jobId, format = null) => {
+    return apiClient.get(`/api/jobs/${jobId}/result`, format ? { responseType: 'blob' } : {});
+  },
+
+  // Cancel a queued background job or discard its result
+  deleteJob: (jobId) => {
+    return apiClient.delete(`/api/jobs/${jobId}`);
+  },
+
+  // New ID for following one upload, filter or export run
+  newProgressId: () => {
+    return window.crypto.randomUUID();
+  },
+
+  // Follow a run's stage progress; call close() on the result to stop
+  watchProgress: (progressId, onProgress) => {
+    const source = new EventSource(`${API_BASE_URL}/api/progress/${encodeURIComponent(progressId)}`);
+    const handle = (event) => onProgress(JSON.parse(event.data), event.type);
+
+    source.addEventListener('progress', handle);
+    source.addEventListener('done', (event) => {
+      handle(event);
+      source.close();
+    });
+    source.addEventListener('expired', () => source.close());
+
+    return source;
+  },
+
   // Health check
   healthCheck: () => {
     return apiClient.get('/health');
@@ -2,11 +2,99 @@
 Main application for Speaker Prospect Filtering Tool.
 """
 import argparse
+import asyncio
+import re
 import sys
+import time
 from datetime import datetime
 from airtable_fetcher import AirtableFetcher
-from filters import SpeakerFilter
+from async_airtable import AsyncAirtableFetcher
+from config import AIRTABLE_TABLE_NAME, SNAPSHOT_PATH
+from filters import MultiEventFilter
 from output_generator import OutputGenerator
+from snapshot_store import SnapshotStore
+
+
+def read_events_file(path, default_title=''):
+    """
+    Read event names from a file, one per line.
+    
+    Blank lines and lines starting with '#' are skipped. A line may give
+    the event title after a '|' (e.g. "2511 Barclays | Banking Summit").
+    
+    Args:
+        path: Path to the events file
+        default_title: Event title for lines without one
+        
+    Returns:
+        list: (event_name, event_title) pairs
+    """
+    events = []
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            event_name, _, event_title = line.partition('|')
+            events.append((event_name.strip(), event_title.strip() or default_title))
+    
+    return events
+
+
+def event_slug(event_name):
+    """
+    Make an event name safe for use in a file name.
+    
+    Args:
+        event_name: Event name tag (e.g., "2511 Barclays")
+        
+    Returns:
+        str: File name fragment (e.g., "2511_Barclays")
+    """
+    return re.sub(r'[^A-Za-z0-9]+', '_', event_name).strip('_') or 'event'
+
+
+def write_reports(generator, confirmed, intended, endorsed, output_base, output_format):
+    """
+    Write the report files for one event.
+    
+    Args:
+        generator: OutputGenerator for the event
+        confirmed: List of confirmed speakers
+        intended: List of intended speakers
+        endorsed: List of endorsed speakers
+        output_base: Output file name without extension
+        output_format: Output format (csv, json, text, all)
+    """
+    if output_format in ['csv', 'all']:
+        csv_file = f"{output_base}.csv"
+        generator.generate_csv(confirmed, intended, endorsed, csv_file)
+    
+    if output_format in ['json', 'all']:
+        json_file = f"{output_base}.json"
+        generator.generate_json(confirmed, intended, endorsed, json_file)
+    
+    if output_format in ['text', 'all']:
+        text_file = f"{output_base}.txt"
+        generator.generate_text(confirmed, intended, endorsed, text_file)
+
+
+async def fetch_concurrently(sources, event_names):
+    """
+    Fetch candidate records from several tables or views at once.
+    
+    Args:
+        sources: List of (table_name, view) pairs; view may be None
+        event_names: Event names used to narrow the download
+        
+    Returns:
+        tuple: (record fields, request count, retry count)
+    """
+    async with AsyncAirtableFetcher() as fetcher:
+        records = await fetcher.get_records_dict(sources, event_names=event_names)
+        return records, fetcher.request_count, fetcher.retry_count
 
 
 def main():
@@ -15,8 +103,14 @@ def main():
         description='Speaker Prospect Filtering Tool - Filter and organize speaker prospects from Airtable'
     )
     parser.add_argument(
-        'event_name',
-        help='Event name tag (e.g., "2511 Barclays")'
+        'event_names',
+        nargs='*',
+        metavar='event_name',
+        help='Event name tag (e.g., "2511 Barclays"); several can be given'
+    )
+    parser.add_argument(
+        '--events-file',
+        help='File with one event name per line, optionally "name | title"'
     )
     parser.add_argument(
         '--event-title',
@@ -34,64 +128,186 @@ def main():
         default='all',
         help='Output format (default: all)'
     )
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help=f'Sync a local snapshot ({SNAPSHOT_PATH}) and only download changed records'
+    )
+    parser.add_argument(
+        '--full-sync',
+        action='store_true',
+        help='Rebuild the local snapshot from a full download'
+    )
+    parser.add_argument(
+        '--async-fetch',
+        action='store_true',
+        help='Fetch with the async client, several tables/views concurrently'
+    )
+    parser.add_argument(
+        '--table',
+        action='append',
+        help='Table to fetch with --async-fetch (repeatable, default: AIRTABLE_TABLE_NAME)'
+    )
+    parser.add_argument(
+        '--view',
+        action='append',
+        help='View to fetch with --async-fetch (repeatable, default: whole table)'
+    )
     
     args = parser.parse_args()
     
+    events = [(event_name, args.event_title) for event_name in args.event_names]
+    if args.events_file:
+        try:
+            events += read_events_file(args.events_file, args.event_title)
+        except OSError as e:
+            parser.error(f"Cannot read events file: {e}")
+    
+    # Keep the first occurrence of each event
+    unique_events = {}
+    for event_name, event_title in events:
+        unique_events.setdefault(event_name, event_title)
+    events = list(unique_events.items())
+    if not events:
+        parser.error("At least one event name or --events-file is required")
+    
+    batch = len(events) > 1
+    
     print("="*60)
     print("Speaker Prospect Filtering Tool")
     print("="*60)
-    print(f"Event: {args.event_name}")
+    if batch:
+        print(f"Events: {len(events)}")
+    else:
+        print(f"Event: {events[0][0]}")
     print(f"Output: {args.output}")
     print(f"Format: {args.format}")
     print("-"*60)
     
     try:
-        # Step 1: Fetch data from Airtable
-        print("\n[1/4] Fetching data from Airtable...")
-        fetcher = AirtableFetcher()
-        records = fetcher.get_records_dict()
-        print(f"✓ Fetched {len(records)} records")
+        started = time.perf_counter()
+        timings = {}
         
-        # Step 2: Filter speakers into categories
-        print("\n[2/4] Filtering speakers into categories...")
-        speaker_filter = SpeakerFilter(args.event_name)
+        # Step 1: Fetch data from Airtable (once for all events)
+        step_started = time.perf_counter()
+        event_names = [event_name for event_name, _ in events]
+        speaker_filter = MultiEventFilter(event_names)
+        streamed = not (args.sync or args.full_sync or args.async_fetch)
         
-        confirmed = speaker_filter.filter_confirmed(records)
-        print(f"✓ Found {len(confirmed)} confirmed speakers")
+        if streamed:
+            print("\n[1/4] Fetching data from Airtable...")
+            fetcher = AirtableFetcher()
+            # Only records tagged for one of the events are downloaded, and
+            # each page is filtered while the next ones are in flight
+            results = speaker_filter.categorize([])
+            record_count = 0
+            filter_seconds = 0.0
+            
+            for page_number, page in enumerate(fetcher.iter_record_pages(event_names=event_names), 1):
+                filter_started = time.perf_counter()
+                speaker_filter.categorize(page, results)
+                filter_seconds += time.perf_counter() - filter_started
+                
+                record_count += len(page)
+                print(f"\r  Page {page_number}: {record_count} records", end='', flush=True)
+            
+            if record_count:
+                print()
+            print(f"✓ Fetched {record_count} candidate records")
+        elif args.async_fetch:
+            print("\n[1/4] Fetching data from Airtable concurrently...")
+            table_names = args.table or [AIRTABLE_TABLE_NAME]
+            if not all(table_names):
+                raise ValueError("AIRTABLE_TABLE_NAME not set in environment variables")
+            sources = [
+                (table_name, view)
+                for table_name in table_names
+                for view in (args.view or [None])
+            ]
+            records, request_count, retry_count = asyncio.run(
+                fetch_concurrently(sources, event_names)
+            )
+            print(f"✓ Fetched {len(records)} candidate records from {len(sources)} "
+                  f"source(s) in {request_count} requests ({retry_count} retried)")
+        else:
+            print("\n[1/4] Syncing local snapshot with Airtable...")
+            store = SnapshotStore()
+            try:
+                sync_stats = store.sync(AirtableFetcher(), full=args.full_sync)
+                records = store.get_records_dict()
+            finally:
+                store.close()
+            print(f"✓ {sync_stats['mode'].capitalize()} sync: fetched {sync_stats['fetched']} "
+                  f"records, removed {sync_stats['deleted']}")
+            print(f"✓ Loaded {len(records)} records from {SNAPSHOT_PATH}")
         
-        intended = speaker_filter.filter_intended(records)
-        print(f"✓ Found {len(intended)} intended speakers")
+        timings['fetch'] = time.perf_counter() - step_started
         
-        endorsed = speaker_filter.filter_endorsed(records)
-        print(f"✓ Found {len(endorsed)} endorsed speakers")
+        # Step 2: Filter speakers into categories (one pass for all events)
+        print("\n[2/4] Filtering speakers into categories...")
+        if streamed:
+            timings['filter'] = filter_seconds
+        else:
+            step_started = time.perf_counter()
+            results = speaker_filter.categorize(records)
+            timings['filter'] = time.perf_counter() - step_started
+        
+        for event_name, _ in events:
+            confirmed, intended, endorsed = results[event_name]
+            prefix = f"{event_name}: " if batch else ""
+            print(f"✓ {prefix}Found {len(confirmed)} confirmed speakers")
+            print(f"✓ {prefix}Found {len(intended)} intended speakers")
+            print(f"✓ {prefix}Found {len(endorsed)} endorsed speakers")
         
         # Step 3: Generate output
         print("\n[3/4] Generating output files...")
-        generator = OutputGenerator(args.event_name, args.event_title)
-        
+        step_started = time.perf_counter()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_base = f"{args.output}_{timestamp}"
+        event_timings = {}
         
-        if args.format in ['csv', 'all']:
-            csv_file = f"{output_base}.csv"
-            generator.generate_csv(confirmed, intended, endorsed, csv_file)
+        for event_name, event_title in events:
+            event_started = time.perf_counter()
+            generator = OutputGenerator(event_name, event_title)
+            
+            if batch:
+                output_base = f"{args.output}_{event_slug(event_name)}_{timestamp}"
+            else:
+                output_base = f"{args.output}_{timestamp}"
+            
+            write_reports(generator, *results[event_name], output_base, args.format)
+            event_timings[event_name] = time.perf_counter() - event_started
         
-        if args.format in ['json', 'all']:
-            json_file = f"{output_base}.json"
-            generator.generate_json(confirmed, intended, endorsed, json_file)
-        
-        if args.format in ['text', 'all']:
-            text_file = f"{output_base}.txt"
-            generator.generate_text(confirmed, intended, endorsed, text_file)
+        timings['output'] = time.perf_counter() - step_started
+        timings['total'] = time.perf_counter() - started
         
         # Step 4: Summary
         print("\n[4/4] Complete!")
         print("-"*60)
         print("Summary:")
-        print(f"  Confirmed: {len(confirmed)}")
-        print(f"  Intended: {len(intended)}")
-        print(f"  Endorsed: {len(endorsed)}")
-        print(f"  Total: {len(confirmed) + len(intended) + len(endorsed)}")
+        
+        for event_name, _ in events:
+            confirmed, intended, endorsed = results[event_name]
+            indent = "  "
+            if batch:
+                print(f"  {event_name}:")
+                indent = "    "
+            print(f"{indent}Confirmed: {len(confirmed)}")
+            print(f"{indent}Intended: {len(intended)}")
+            print(f"{indent}Endorsed: {len(endorsed)}")
+            print(f"{indent}Total: {len(confirmed) + len(intended) + len(endorsed)}")
+        
+        print("-"*60)
+        print("Timing:")
+        print(f"  Fetch: {timings['fetch']:.2f}s")
+        if streamed:
+            print(f"  Filter: {timings['filter']:.2f}s (during fetch)")
+        else:
+            print(f"  Filter: {timings['filter']:.2f}s")
+        print(f"  Output: {timings['output']:.2f}s")
+        if batch:
+            for event_name, seconds in event_timings.items():
+                print(f"    {event_name}: {seconds:.2f}s")
+        print(f"  Total: {timings['total']:.2f}s")
         print("="*60)
         
         return 0
@@ -103,7 +319,3 @@ def main():
 
 if __name__ == '__main__':
     sys.exit(main())
-
-
-
-
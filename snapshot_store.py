@@ -0,0 +1,166 @@
+"""
+Local snapshot of the Airtable table for incremental sync.
+"""
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from config import SNAPSHOT_PATH, SYNC_OVERLAP_SECONDS
+
+
+class SnapshotStore:
+    """Keeps a copy of the Airtable records in a local SQLite file."""
+    
+    def __init__(self, path=SNAPSHOT_PATH):
+        """
+        Open the snapshot, creating it if needed.
+        
+        Args:
+            path: SQLite file path
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                id TEXT PRIMARY KEY,
+                created_time TEXT,
+                modified_time TEXT NOT NULL,
+                fields TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+    
+    def close(self):
+        """Close the snapshot file."""
+        self.conn.close()
+    
+    def last_synced_at(self):
+        """
+        Get the start time of the last completed sync.
+        
+        Returns:
+            datetime: Sync start time (UTC), or None if never synced
+        """
+        row = self.conn.execute(
+            "SELECT value FROM sync_state WHERE key = 'last_synced_at'"
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+    
+    def record_count(self):
+        """
+        Get the number of stored records.
+        
+        Returns:
+            int: Record count
+        """
+        return self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+    
+    def get_records_dict(self):
+        """
+        Get all stored records as a list of dictionaries with fields only.
+        
+        Returns:
+            list: List of record fields, in the same form as
+                AirtableFetcher.get_records_dict
+        """
+        rows = self.conn.execute("SELECT fields FROM records ORDER BY rowid")
+        return [json.loads(fields) for (fields,) in rows]
+    
+    def sync(self, fetcher, full=False, detect_deletions=True):
+        """
+        Bring the snapshot up to date with Airtable.
+        
+        The first sync (or full=True) downloads every record. Later syncs
+        only download records whose LAST_MODIFIED_TIME() is after the
+        previous sync, minus SYNC_OVERLAP_SECONDS for clock skew, and
+        detect deletions from a listing of record IDs.
+        
+        Records are stored with the start time of the sync that fetched
+        them as their modification time, since Airtable does not return
+        LAST_MODIFIED_TIME() itself.
+        
+        Args:
+            fetcher: AirtableFetcher for the table
+            full: Download every record even if the snapshot has data
+            detect_deletions: Remove records no longer in Airtable
+            
+        Returns:
+            dict: Sync mode and fetched, deleted and total record counts
+        """
+        started = datetime.now(timezone.utc)
+        last_synced_at = None if full else self.last_synced_at()
+        
+        if last_synced_at is None:
+            mode = 'full'
+            records = fetcher.fetch_all_records()
+            remote_ids = {record['id'] for record in records}
+        else:
+            mode = 'incremental'
+            since = last_synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+            records = fetcher.fetch_modified_since(since)
+            remote_ids = fetcher.fetch_record_ids() if detect_deletions else None
+        
+        with self.conn:
+            self._upsert(records, started)
+            
+            deleted = 0
+            if remote_ids is not None:
+                deleted = self._delete_missing(remote_ids)
+            
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('last_synced_at', ?)",
+                (started.isoformat(),)
+            )
+        
+        return {
+            'mode': mode,
+            'fetched': len(records),
+            'deleted': deleted,
+            'total': self.record_count(),
+            'synced_at': started.isoformat()
+        }
+    
+    def _upsert(self, records, modified_time):
+        """
+        Insert or replace records.
+        
+        Args:
+            records: Airtable records with id, createdTime and fields
+            modified_time: Time to store as the records' modification time
+        """
+        self.conn.executemany(
+            """
+            INSERT INTO records (id, created_time, modified_time, fields)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                created_time = excluded.created_time,
+                modified_time = excluded.modified_time,
+                fields = excluded.fields
+            """,
+            [
+                (
+                    record['id'],
+                    record.get('createdTime'),
+                    modified_time.isoformat(),
+                    json.dumps(record.get('fields', {}), ensure_ascii=False)
+                )
+                for record in records
+            ]
+        )
+    
+    def _delete_missing(self, remote_ids):
+        """
+        Delete stored records that are no longer in Airtable.
+        
+        Args:
+            remote_ids: IDs of all records currently in Airtable
+            
+        Returns:
+            int: Number of deleted records
+        """
+        local_ids = {row[0] for row in self.conn.execute("SELECT id FROM records")}
+        missing = [(record_id,) for record_id in local_ids - set(remote_ids)]
+        self.conn.executemany("DELETE FROM records WHERE id = ?", missing)
+        return len(missing)
@@ -18,7 +18,7 @@ def test_connection():
         print("✓ Connection successful")
         
         print("\n[2] Fetching records...")
-        records = fetcher.get_records_dict()
+        records = fetcher.get_records_dict(all_fields=True)
         print(f"✓ Fetched {len(records)} records")
         
         if len(records) == 0:
@@ -0,0 +1,163 @@
+"""
+AsyncAirtableFetcher against an httpx.MockTransport stand-in for Airtable.
+"""
+import asyncio
+import time
+import httpx
+import pytest
+import async_airtable
+from airtable_fetcher import PROJECTED_FIELDS
+from async_airtable import AsyncAirtableFetcher, TokenBucket
+
+
+def record(record_id, name):
+    return {'id': record_id, 'createdTime': '2025-01-01T00:00:00.000Z', 'fields': {'Name': name}}
+
+
+def fetcher(handler, max_retries=3):
+    """Build a fetcher sending its requests to handler."""
+    return AsyncAirtableFetcher(
+        api_key='key', base_id='app123', endpoint_url='http://airtable.test',
+        rate_limit=1000, max_retries=max_retries, transport=httpx.MockTransport(handler)
+    )
+
+
+async def fetch(client, *args, **kwargs):
+    async with client:
+        return await client.fetch_records(*args, **kwargs)
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """Shorten the exponential backoff and record each retry's delay."""
+    monkeypatch.setattr(async_airtable, 'AIRTABLE_BACKOFF_BASE', 0.01)
+    delays = []
+    backoff_delay = AsyncAirtableFetcher._backoff_delay
+
+    def recorded(attempt, response=None):
+        delay = backoff_delay(attempt, response)
+        delays.append(delay)
+        return delay
+
+    monkeypatch.setattr(AsyncAirtableFetcher, '_backoff_delay', staticmethod(recorded))
+    return delays
+
+
+def test_fetch_records_follows_offsets():
+    pages = {
+        None: {'records': [record('rec1', 'Ada'), record('rec2', 'Grace')], 'offset': 'p2'},
+        'p2': {'records': [record('rec3', 'Edsger')], 'offset': 'p3'},
+        'p3': {'records': [record('rec4', 'Barbara')]}
+    }
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=pages[request.url.params.get('offset')])
+
+    client = fetcher(handler)
+    records = asyncio.run(fetch(client, 'Speakers', view='Grid'))
+
+    assert [r['id'] for r in records] == ['rec1', 'rec2', 'rec3', 'rec4']
+    assert [r.url.params.get('offset') for r in requests] == [None, 'p2', 'p3']
+    assert client.request_count == 3
+
+    first = requests[0]
+    assert first.url.path == '/v0/app123/Speakers'
+    assert first.headers['Authorization'] == 'Bearer key'
+    assert first.url.params['pageSize'] == '100'
+    assert first.url.params['view'] == 'Grid'
+    assert first.url.params.get_list('fields[]') == PROJECTED_FIELDS
+
+
+def test_429_retry_after_is_honoured(backoffs):
+    responses = [
+        httpx.Response(429, headers={'Retry-After': '0.05'}, json={'errors': []}),
+        httpx.Response(200, json={'records': [record('rec1', 'Ada')]})
+    ]
+
+    client = fetcher(lambda request: responses.pop(0))
+    records = asyncio.run(fetch(client, 'Speakers'))
+
+    assert [r['id'] for r in records] == ['rec1']
+    assert (client.request_count, client.retry_count) == (2, 1)
+    assert backoffs == [0.05]
+
+
+def test_5xx_is_retried_with_backoff(backoffs):
+    statuses = [503, 502, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        return httpx.Response(status, json={'records': [record('rec1', 'Ada')]})
+
+    client = fetcher(handler)
+    records = asyncio.run(fetch(client, 'Speakers'))
+
+    assert len(records) == 1
+    assert (client.request_count, client.retry_count) == (3, 2)
+    # Jittered between half and all of 0.01 * 2 ** attempt
+    assert len(backoffs) == 2
+    assert 0.005 <= backoffs[0] <= 0.01
+    assert 0.01 <= backoffs[1] <= 0.02
+
+
+def test_gives_up_after_max_retries(backoffs):
+    client = fetcher(lambda request: httpx.Response(503, json={}), max_retries=2)
+
+    with pytest.raises(Exception, match='503 after 2 retries'):
+        asyncio.run(fetch(client, 'Speakers'))
+
+    assert (client.request_count, client.retry_count) == (3, 2)
+    assert len(backoffs) == 2
+
+
+def test_client_errors_are_not_retried(backoffs):
+    client = fetcher(lambda request: httpx.Response(404, json={'error': 'NOT_FOUND'}))
+
+    with pytest.raises(Exception, match='404'):
+        asyncio.run(fetch(client, 'Missing'))
+
+    assert (client.request_count, client.retry_count) == (1, 0)
+    assert backoffs == []
+
+
+def test_token_bucket_spaces_requests():
+    rate = 20
+
+    async def acquire_all():
+        bucket = TokenBucket(rate)
+        times = []
+        for _ in range(5):
+            await bucket.acquire()
+            times.append(time.monotonic())
+        return times
+
+    times = asyncio.run(acquire_all())
+
+    # The first token is available at once, each later one 1/rate apart
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= 0.9 / rate for gap in gaps)
+    assert times[-1] - times[0] >= 4 * 0.9 / rate
+
+
+def test_get_records_dict_deduplicates_across_views():
+    views = {
+        ('Speakers', 'Intended'): [record('rec1', 'Ada'), record('rec2', 'Grace')],
+        ('Speakers', 'Endorsed'): [record('rec2', 'Grace'), record('rec3', 'Edsger')],
+        ('Archive', None): [record('rec1', 'Ada (archived)')]
+    }
+
+    def handler(request):
+        table = request.url.path.rsplit('/', 1)[-1]
+        return httpx.Response(200, json={'records': views[(table, request.url.params.get('view'))]})
+
+    async def get_records():
+        async with fetcher(handler) as client:
+            return await client.get_records_dict(list(views))
+
+    records = asyncio.run(get_records())
+
+    # rec2 appears in both Speakers views but is kept once; rec1 of another
+    # table is a different record
+    assert [fields['Name'] for fields in records] == ['Ada', 'Grace', 'Edsger', 'Ada (archived)']
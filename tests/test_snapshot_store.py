@@ -0,0 +1,182 @@
+"""
+Incremental sync of SnapshotStore against a local stand-in for Airtable.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+import pytest
+from airtable_fetcher import PROJECTED_FIELDS, AirtableFetcher
+from config import COLUMNS, SYNC_OVERLAP_SECONDS
+from snapshot_store import SnapshotStore
+
+MODIFIED_SINCE = re.compile(r"IS_AFTER\(LAST_MODIFIED_TIME\(\), DATETIME_PARSE\('([^']+)'\)\)")
+
+
+def modified_since(formula):
+    """Parse the time of a fetch_modified_since formula."""
+    timestamp = MODIFIED_SINCE.fullmatch(formula).group(1)
+    return datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
+
+
+class FakeTable:
+    """In-memory stand-in for a pyairtable Table, with modification times."""
+
+    def __init__(self):
+        self.records = {}
+        self.calls = []
+
+    def put(self, record_id, fields, modified=None):
+        """Create or update a record, modified now unless given."""
+        self.records[record_id] = {
+            'id': record_id,
+            'createdTime': '2025-01-01T00:00:00.000Z',
+            'fields': fields,
+            'modified': modified or datetime.now(timezone.utc)
+        }
+
+    def all(self, formula=None, fields=None):
+        self.calls.append({'formula': formula, 'fields': fields})
+        records = sorted(self.records.values(), key=lambda record: record['id'])
+
+        if formula:
+            since = modified_since(formula)
+            records = [record for record in records if record['modified'] > since]
+
+        return [
+            {
+                'id': record['id'],
+                'createdTime': record['createdTime'],
+                'fields': {
+                    name: value for name, value in record['fields'].items()
+                    if fields is None or name in fields
+                }
+            }
+            for record in records
+        ]
+
+
+def speaker(name, workshops='2511 Barclays Intended'):
+    return {COLUMNS['speaker_name']: name, COLUMNS['workshops']: workshops}
+
+
+@pytest.fixture
+def table():
+    # Last modified well before any sync window of the tests
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    table = FakeTable()
+    table.put('rec1', speaker('Ada'), yesterday)
+    table.put('rec2', speaker('Grace'), yesterday)
+    table.put('rec3', speaker('Edsger'), yesterday)
+    return table
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'snapshot.sqlite3'))
+    yield store
+    store.close()
+
+
+def names(store):
+    return sorted(fields[COLUMNS['speaker_name']] for fields in store.get_records_dict())
+
+
+def test_full_sync(table, store):
+    stats = store.sync(AirtableFetcher(table=table))
+
+    assert stats['mode'] == 'full'
+    assert (stats['fetched'], stats['deleted'], stats['total']) == (3, 0, 3)
+    assert names(store) == ['Ada', 'Edsger', 'Grace']
+    assert table.calls == [{'formula': None, 'fields': PROJECTED_FIELDS}]
+
+
+def test_incremental_sync_uses_overlap_window(table, store):
+    store.sync(AirtableFetcher(table=table))
+    last_synced_at = store.last_synced_at()
+
+    # Modified inside the overlap window before the previous sync, e.g.
+    # by a clock running behind; a plain "after last sync" would miss it
+    table.put('rec1', speaker('Ada King'),
+              modified=last_synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS // 2))
+    # Modified before the window; not downloaded again
+    table.put('rec2', speaker('Grace Hopper'),
+              modified=last_synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS * 2))
+    table.calls.clear()
+
+    stats = store.sync(AirtableFetcher(table=table))
+
+    assert stats['mode'] == 'incremental'
+    assert stats['fetched'] == 1
+    modified_call = table.calls[0]
+    assert modified_call['fields'] == PROJECTED_FIELDS
+    expected_since = last_synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+    # The formula carries millisecond precision
+    assert timedelta(0) <= expected_since - modified_since(modified_call['formula']) < timedelta(milliseconds=1)
+    assert names(store) == ['Ada King', 'Edsger', 'Grace']
+
+
+def test_incremental_sync_upserts_modified_record(table, store):
+    store.sync(AirtableFetcher(table=table))
+    table.put('rec2', speaker('Grace', workshops='2511 Barclays Confirmed'))
+    table.put('rec4', speaker('Barbara'))
+
+    stats = store.sync(AirtableFetcher(table=table))
+
+    assert (stats['fetched'], stats['total']) == (2, 4)
+    records = {fields[COLUMNS['speaker_name']]: fields for fields in store.get_records_dict()}
+    assert records['Grace'][COLUMNS['workshops']] == '2511 Barclays Confirmed'
+    assert 'Barbara' in records
+
+
+def test_incremental_sync_detects_deletions(table, store):
+    store.sync(AirtableFetcher(table=table))
+    del table.records['rec3']
+
+    stats = store.sync(AirtableFetcher(table=table))
+
+    assert (stats['fetched'], stats['deleted'], stats['total']) == (0, 1, 2)
+    assert names(store) == ['Ada', 'Grace']
+    # The ID listing only asks for the name field
+    assert table.calls[-1] == {'formula': None, 'fields': [COLUMNS['speaker_name']]}
+
+
+def test_deletion_detection_can_be_disabled(table, store):
+    store.sync(AirtableFetcher(table=table))
+    del table.records['rec3']
+    table.calls.clear()
+
+    stats = store.sync(AirtableFetcher(table=table), detect_deletions=False)
+
+    assert (stats['deleted'], stats['total']) == (0, 3)
+    assert len(table.calls) == 1
+
+
+def test_last_synced_at_persists(table, tmp_path):
+    path = str(tmp_path / 'snapshot.sqlite3')
+    store = SnapshotStore(path)
+    assert store.last_synced_at() is None
+
+    before = datetime.now(timezone.utc)
+    stats = store.sync(AirtableFetcher(table=table))
+    synced_at = store.last_synced_at()
+    store.close()
+
+    assert synced_at >= before
+    assert synced_at.isoformat() == stats['synced_at']
+
+    reopened = SnapshotStore(path)
+    try:
+        assert reopened.last_synced_at() == synced_at
+        assert reopened.record_count() == 3
+        assert reopened.sync(AirtableFetcher(table=table))['mode'] == 'incremental'
+    finally:
+        reopened.close()
+
+
+def test_full_sync_replaces_incremental(table, store):
+    store.sync(AirtableFetcher(table=table))
+    del table.records['rec1']
+
+    stats = store.sync(AirtableFetcher(table=table), full=True)
+
+    assert stats['mode'] == 'full'
+    assert (stats['fetched'], stats['deleted'], stats['total']) == (2, 1, 2)
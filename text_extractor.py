@@ -3,6 +3,13 @@ Text extraction utilities for parsing notes and comments.
 """
 import re
 
+# Patterns are compiled once at import and shared by all extractors
+IN_SUM_PATTERN = re.compile(r'In sum[:\s]+(.*?)(?:\n\n|\n[A-Z]|$)', re.IGNORECASE | re.DOTALL)
+DATE_PATTERN = re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|[A-Z][a-z]+ \d{1,2},? \d{4})')
+JELENA_RATING_PATTERN = re.compile(r'[Ii]n?\s*sum[:\s]*(\d+(?:\.\d+)?)')
+IR_RATING_PATTERN = re.compile(r'(\d+\.\d+|\d+)')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
 
 class TextExtractor:
     """Utilities for extracting specific sections from text fields."""
@@ -22,8 +29,7 @@ class TextExtractor:
             return None, None
         
         # Look for "In sum" section (case insensitive)
-        in_sum_pattern = r'In sum[:\s]+(.*?)(?:\n\n|\n[A-Z]|$)'
-        match = re.search(in_sum_pattern, notes_text, re.IGNORECASE | re.DOTALL)
+        match = IN_SUM_PATTERN.search(notes_text)
         
         in_sum_content = None
         if match:
@@ -34,8 +40,7 @@ class TextExtractor:
                 in_sum_content = '\n'.join(lines[:2])
         
         # Try to extract date (various formats)
-        date_pattern = r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|[A-Z][a-z]+ \d{1,2},? \d{4})'
-        date_match = re.search(date_pattern, notes_text)
+        date_match = DATE_PATTERN.search(notes_text)
         date_of_call = date_match.group(1) if date_match else None
         
         return in_sum_content, date_of_call
@@ -55,8 +60,7 @@ class TextExtractor:
             return None, None
         
         # Look for "INsum" or "In sum" with rating (number)
-        rating_pattern = r'[Ii]n?\s*sum[:\s]*(\d+(?:\.\d+)?)'
-        rating_match = re.search(rating_pattern, jelena_text)
+        rating_match = JELENA_RATING_PATTERN.search(jelena_text)
         rating = rating_match.group(1) if rating_match else None
         
         # Get first two lines
@@ -129,8 +133,7 @@ class TextExtractor:
             return float(ir_engagement_text)
         
         # Try to extract number from text
-        rating_pattern = r'(\d+\.\d+|\d+)'
-        match = re.search(rating_pattern, str(ir_engagement_text))
+        match = IR_RATING_PATTERN.search(str(ir_engagement_text))
         if match:
             try:
                 return float(match.group(1))
@@ -160,7 +163,7 @@ class TextExtractor:
         event_lower = event_title.lower()
         
         # Extract key terms from event title (words longer than 3 chars)
-        event_keywords = [word for word in re.findall(r'\b\w+\b', event_lower) 
+        event_keywords = [word for word in WORD_PATTERN.findall(event_lower) 
                          if len(word) > 3 and word not in ['this', 'that', 'with', 'from', 'will']]
         
         # Check for keyword matches